@@ -0,0 +1,148 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for full and chunked `MultiHeadAttention`."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import threading
+import time
+
+import tensorflow as tf
+
+from tensorflow.python.platform.benchmark import ParameterizedBenchmark
+
+_BATCH_SIZE = 1
+_NUM_HEADS = 4
+_KEY_DIM = 32
+_NUM_ITERS = 5
+
+
+def _resident_memory_bytes():
+  """Returns the resident memory of the process, or None if unavailable."""
+  try:
+    with open('/proc/self/statm') as f:
+      resident_pages = int(f.read().split()[1])
+  except (IOError, OSError, IndexError, ValueError):
+    return None
+  return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _memory_usage_fn():
+  """Returns a function measuring the memory used by the benchmark, or None.
+
+  On GPU, this is the memory used by TensorFlow on the first GPU. Otherwise, it
+  is the resident memory of the process.
+  """
+  if tf.config.list_physical_devices('GPU'):
+    return lambda: tf.config.experimental.get_memory_info('GPU:0')['current']
+  if _resident_memory_bytes() is None:
+    return None
+  return _resident_memory_bytes
+
+
+class _PeakMemorySampler(object):
+  """Samples `usage_fn` in a background thread and records its maximum.
+
+  The device peak of `tf.config.experimental.get_memory_info` covers the whole
+  process, so it would not tell the runs of a parameterized benchmark apart.
+  """
+
+  def __init__(self, usage_fn, interval=0.001):
+    self._usage_fn = usage_fn
+    self._interval = interval
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._sample)
+    self.baseline = None
+    self.peak = None
+
+  def _sample(self):
+    while not self._stop.is_set():
+      self.peak = max(self.peak, self._usage_fn())
+      time.sleep(self._interval)
+
+  def __enter__(self):
+    self.baseline = self.peak = self._usage_fn()
+    self._thread.start()
+    return self
+
+  def __exit__(self, *unused_exc_info):
+    self._stop.set()
+    self._thread.join()
+    self.peak = max(self.peak, self._usage_fn())
+
+
+class MultiHeadAttentionBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks self-attention training steps versus sequence length."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the name of the implementation.
+  _benchmark_parameters = [
+      ('%s_%d' % (name, sequence_length), chunk_size, sequence_length)
+      for name, chunk_size in (('full', None), ('chunked', 256))
+      for sequence_length in (512, 1024, 2048, 4096)
+  ]
+
+  def benchmark_self_attention(self, chunk_size, sequence_length):
+    """Measures forward and backward passes of self-attention.
+
+    Args:
+      chunk_size: `chunk_size` of the layer, `None` for the full computation.
+      sequence_length: Length of the input sequences.
+    """
+    layer = tf.keras.layers.MultiHeadAttention(
+        num_heads=_NUM_HEADS, key_dim=_KEY_DIM, chunk_size=chunk_size)
+    inputs = tf.random.uniform(
+        (_BATCH_SIZE, sequence_length, _NUM_HEADS * _KEY_DIM))
+
+    @tf.function
+    def train_step():
+      with tf.GradientTape() as tape:
+        loss = tf.reduce_sum(layer(inputs, inputs))
+      return tape.gradient(loss, layer.trainable_variables)
+
+    # Warm up, and build the layer.
+    train_step()[0].numpy()
+    usage_fn = _memory_usage_fn()
+    if usage_fn is not None:
+      with _PeakMemorySampler(usage_fn) as sampler:
+        train_step()[0].numpy()
+    start = time.time()
+    for _ in range(_NUM_ITERS):
+      grads = train_step()
+    grads[0].numpy()
+    wall_time = (time.time() - start) / _NUM_ITERS
+
+    metrics = [{
+        'name': 'tokens_per_sec',
+        'value': _BATCH_SIZE * sequence_length / wall_time,
+    }]
+    if usage_fn is not None:
+      metrics.append({
+          'name': 'peak_memory_mb',
+          'value': (sampler.peak - sampler.baseline) / 2. ** 20,
+      })
+    self.report_benchmark(
+        iters=_NUM_ITERS,
+        wall_time=wall_time,
+        metrics=metrics,
+        extras={'chunk_size': chunk_size,
+                'sequence_length': sequence_length})
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -17,6 +17,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import collections
+import json
 import timeit
 import numpy as np
 
@@ -136,7 +138,8 @@ def measure_performance(model_fn,
   Returns:
     Performance summary, which contains build_time, compile_time,
     startup_time, avg_epoch_time, wall_time, exp_per_sec, epochs,
-    distribution_strategy.
+    distribution_strategy, and the mean, standard deviation and 95%
+    confidence interval of the wall time per step (see `BenchmarkResult`).
 
   Raise:
     ValueError: If `x` is none or if `optimizer` is not provided or
@@ -157,6 +160,7 @@ def measure_performance(model_fn,
 
   build_time_list, compile_time_list, startup_time_list = [], [], []
   avg_epoch_time_list, wall_time_list, exp_per_sec_list = [], [], []
+  step_times = []
   total_num_examples = epochs * num_examples
 
   strategy = distribution_util.get_distribution_strategy(
@@ -198,6 +202,8 @@ def measure_performance(model_fn,
     avg_epoch_time_list.append(np.mean(cbk.times))
     wall_time_list.append(end_time - start_time)
     exp_per_sec_list.append(total_num_examples / (end_time - t2))
+    steps = model._train_counter.numpy() // epochs  # pylint: disable=protected-access
+    step_times.extend(t / steps for t in cbk.times)
 
   metrics = []
   metrics.append({'name': 'build_time', 'value': np.mean(build_time_list)})
@@ -209,6 +215,13 @@ def measure_performance(model_fn,
   })
   metrics.append({'name': 'exp_per_sec', 'value': np.mean(exp_per_sec_list)})
   metrics.append({'name': 'epochs', 'value': epochs})
+  # Statistics of the wall time per step over the timed epochs of all runs.
+  step_result = BenchmarkResult('step', step_times, steps)
+  step_time_ci_low, step_time_ci_high = step_result.confidence_interval
+  metrics.append({'name': 'step_time', 'value': step_result.mean})
+  metrics.append({'name': 'step_time_stddev', 'value': step_result.stddev})
+  metrics.append({'name': 'step_time_ci_low', 'value': step_time_ci_low})
+  metrics.append({'name': 'step_time_ci_high', 'value': step_time_ci_high})
 
   wall_time = np.mean(wall_time_list)
   extras = {
@@ -217,3 +230,268 @@ def measure_performance(model_fn,
   }
 
   return metrics, wall_time, extras
+
+
+# Two-sided 95% critical values of Student's t distribution, indexed by the
+# degrees of freedom. Larger degrees of freedom use the normal approximation.
+_T_CRITICAL_VALUES_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160,
+    14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+    30: 2.042
+}
+
+
+def _t_critical_value(dof):
+  if dof > max(_T_CRITICAL_VALUES_95):
+    return 1.96
+  # Degrees of freedom missing from the table use the next smaller entry, which
+  # gives a slightly wider interval.
+  return _T_CRITICAL_VALUES_95[max(
+      table_dof for table_dof in _T_CRITICAL_VALUES_95 if table_dof <= dof)]
+
+
+class BenchmarkResult(
+    collections.namedtuple('BenchmarkResult', ['name', 'times', 'iters'])):
+  """Timings of the repetitions of a benchmark.
+
+  Attributes:
+    name: String, the name of the benchmark.
+    times: List of the wall times in seconds of each repetition, for a single
+      iteration.
+    iters: Integer, the number of iterations timed together in each
+      repetition.
+  """
+  __slots__ = ()
+
+  @property
+  def mean(self):
+    return float(np.mean(self.times))
+
+  @property
+  def stddev(self):
+    if len(self.times) < 2:
+      return 0.
+    return float(np.std(self.times, ddof=1))
+
+  @property
+  def confidence_interval(self):
+    """The 95% confidence interval of the mean wall time."""
+    if len(self.times) < 2:
+      return self.mean, self.mean
+    half_width = (
+        _t_critical_value(len(self.times) - 1) * self.stddev /
+        float(np.sqrt(len(self.times))))
+    return self.mean - half_width, self.mean + half_width
+
+  def to_dict(self):
+    ci_low, ci_high = self.confidence_interval
+    return {
+        'name': self.name,
+        'iters': self.iters,
+        'times': [float(t) for t in self.times],
+        'mean': self.mean,
+        'stddev': self.stddev,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+    }
+
+  @classmethod
+  def from_dict(cls, config):
+    return cls(config['name'], list(config['times']), config['iters'])
+
+  def report_kwargs(self, extras=None):
+    """Returns the keyword arguments of `tf.test.Benchmark.report_benchmark`."""
+    ci_low, ci_high = self.confidence_interval
+    return {
+        'name': self.name,
+        'iters': self.iters * len(self.times),
+        'wall_time': self.mean,
+        'metrics': [
+            {'name': 'wall_time_stddev', 'value': self.stddev},
+            {'name': 'wall_time_ci_low', 'value': ci_low},
+            {'name': 'wall_time_ci_high', 'value': ci_high},
+        ],
+        'extras': extras,
+    }
+
+
+def run_benchmark(name, fn, warmup_iters=1, repeats=5, iters_per_repeat=10):
+  """Times `fn` after warming it up.
+
+  Args:
+    name: String, the name of the benchmark.
+    fn: Callable without arguments to time. It must only return once the
+      computation it starts is done, e.g. by converting a result to NumPy.
+    warmup_iters: Integer, the number of untimed calls to `fn`, which trace
+      functions and fill caches.
+    repeats: Integer, the number of timed repetitions, used to estimate the
+      variance of the wall time.
+    iters_per_repeat: Integer, the number of calls to `fn` timed together in
+      each repetition.
+
+  Returns:
+    A `BenchmarkResult`.
+  """
+  if repeats < 1 or iters_per_repeat < 1:
+    raise ValueError('`repeats` and `iters_per_repeat` must be at least 1.')
+  for _ in range(warmup_iters):
+    fn()
+  times = []
+  for _ in range(repeats):
+    start = timeit.default_timer()
+    for _ in range(iters_per_repeat):
+      fn()
+    times.append((timeit.default_timer() - start) / iters_per_repeat)
+  return BenchmarkResult(name, times, iters_per_repeat)
+
+
+def run_layer_benchmark(name,
+                        layer,
+                        inputs,
+                        training=False,
+                        backward=False,
+                        use_function=True,
+                        **kwargs):
+  """Times calls of a layer or model on `inputs`.
+
+  Args:
+    name: String, the name of the benchmark.
+    layer: A `tf.keras.layers.Layer` or `tf.keras.Model`.
+    inputs: Inputs of the layer.
+    training: Boolean, the `training` argument of the calls.
+    backward: Boolean, whether to also compute the gradients of the mean
+      squared outputs with respect to the trainable variables.
+    use_function: Boolean, whether to wrap the step in a `tf.function`.
+    **kwargs: Additional arguments of `run_benchmark`.
+
+  Returns:
+    A `BenchmarkResult`.
+  """
+
+  def step():
+    with tf.GradientTape() as tape:
+      outputs = layer(inputs, training=training)
+      loss = tf.add_n([
+          tf.reduce_mean(tf.square(tf.cast(output, tf.float32)))
+          for output in tf.nest.flatten(outputs)
+      ])
+    if backward:
+      return tape.gradient(loss, layer.trainable_variables)
+    return loss
+
+  if use_function:
+    step = tf.function(step)
+
+  def fn():
+    tf.nest.map_structure(lambda t: t.numpy(), step())
+
+  return run_benchmark(name, fn, **kwargs)
+
+
+def run_fit_benchmark(name,
+                      model,
+                      x,
+                      y=None,
+                      batch_size=32,
+                      steps_per_epoch=None,
+                      repeats=5,
+                      **kwargs):
+  """Times epochs of `model.fit`.
+
+  The model must be compiled. A first epoch is run as warm up, and each
+  further epoch is a repetition.
+
+  Args:
+    name: String, the name of the benchmark.
+    model: A compiled `tf.keras.Model`.
+    x: Input data. See `x` in the `fit()` method of `keras.Model`.
+    y: Target data. See `y` in the `fit()` method of `keras.Model`.
+    batch_size: Integer. See `batch_size` in the `fit()` method.
+    steps_per_epoch: Integer. See `steps_per_epoch` in the `fit()` method.
+    repeats: Integer, the number of timed epochs.
+    **kwargs: Additional arguments of `fit()`.
+
+  Returns:
+    A `BenchmarkResult` with the wall time per step.
+  """
+  if isinstance(x, tf.data.Dataset):
+    batch_size = None
+  fit_kwargs = dict(kwargs, batch_size=batch_size,
+                    steps_per_epoch=steps_per_epoch, verbose=0)
+  model.fit(x, y, epochs=1, **fit_kwargs)
+  cbk = TimerCallBack()
+  model.fit(x, y, epochs=repeats, callbacks=[cbk], **fit_kwargs)
+  steps = model._train_counter.numpy() // repeats  # pylint: disable=protected-access
+  return BenchmarkResult(name, [t / steps for t in cbk.times], steps)
+
+
+def save_results(results, path):
+  """Writes `BenchmarkResult`s to a JSON file."""
+  with tf.io.gfile.GFile(path, 'w') as f:
+    json.dump({'results': [result.to_dict() for result in results]},
+              f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+  """Reads the `BenchmarkResult`s written by `save_results`."""
+  with tf.io.gfile.GFile(path, 'r') as f:
+    return [BenchmarkResult.from_dict(config)
+            for config in json.load(f)['results']]
+
+
+Regression = collections.namedtuple(
+    'Regression', ['name', 'baseline_mean', 'mean', 'relative_change'])
+
+
+def find_regressions(results, baseline_results, threshold=0.05):
+  """Compares benchmark results to a baseline.
+
+  A benchmark regressed when its mean wall time is more than `threshold`
+  slower than the baseline, and the slowdown is statistically significant,
+  i.e. the 95% confidence intervals of the two means do not overlap.
+  Benchmarks missing from either list are ignored.
+
+  Args:
+    results: List of `BenchmarkResult`s.
+    baseline_results: List of `BenchmarkResult`s, e.g. read with
+      `load_results`.
+    threshold: Float, the tolerated relative slowdown.
+
+  Returns:
+    A list of `Regression`s, in the order of `results`.
+  """
+  baselines = {result.name: result for result in baseline_results}
+  regressions = []
+  for result in results:
+    baseline = baselines.get(result.name)
+    if baseline is None:
+      continue
+    relative_change = result.mean / baseline.mean - 1.
+    if (relative_change > threshold and
+        result.confidence_interval[0] > baseline.confidence_interval[1]):
+      regressions.append(Regression(
+          result.name, baseline.mean, result.mean, relative_change))
+  return regressions
+
+
+def check_regressions(results, baseline_path, threshold=0.05):
+  """Raises an error if any result regressed from the baseline file.
+
+  Args:
+    results: List of `BenchmarkResult`s.
+    baseline_path: Path of a JSON file written by `save_results`.
+    threshold: Float, the tolerated relative slowdown.
+
+  Raises:
+    AssertionError: If a benchmark regressed, listing all regressions.
+  """
+  regressions = find_regressions(
+      results, load_results(baseline_path), threshold=threshold)
+  if regressions:
+    lines = ['  {}: {:.6g}s -> {:.6g}s ({:+.1%})'.format(*regression)
+             for regression in regressions]
+    raise AssertionError(
+        'Benchmarks regressed by more than {:.1%}:\n{}'.format(
+            threshold, '\n'.join(lines)))
@@ -18,6 +18,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import json
+import os
+
 import tensorflow as tf
 
 from tensorflow.python.keras.benchmarks import benchmark_util
@@ -48,6 +51,74 @@ class BenchmarkUtilTest(tf.test.TestCase):
     out = benchmark_util.generate_benchmark_params_cpu_gpu(params)
     self.assertAllEqual(out, expected)
 
+  def test_run_benchmark(self):
+    calls = []
+    result = benchmark_util.run_benchmark(
+        "noop", lambda: calls.append(None), warmup_iters=2, repeats=3,
+        iters_per_repeat=4)
+    self.assertLen(calls, 2 + 3 * 4)
+    self.assertEqual(result.name, "noop")
+    self.assertLen(result.times, 3)
+    self.assertEqual(result.iters, 4)
+
+  def test_confidence_interval(self):
+    result = benchmark_util.BenchmarkResult("b", [1., 2., 3.], 1)
+    self.assertAllClose(result.mean, 2.)
+    self.assertAllClose(result.stddev, 1.)
+    # t = 4.303 for 2 degrees of freedom.
+    self.assertAllClose(result.confidence_interval,
+                        (2. - 4.303 / 3 ** 0.5, 2. + 4.303 / 3 ** 0.5))
+
+  def test_t_critical_value(self):
+    self.assertEqual(benchmark_util._t_critical_value(22), 2.074)
+    # Missing degrees of freedom use the next smaller entry.
+    self.assertEqual(benchmark_util._t_critical_value(27), 2.060)
+    self.assertEqual(benchmark_util._t_critical_value(100), 1.96)
+
+  def test_run_layer_benchmark(self):
+    layer = tf.keras.layers.Dense(4)
+    result = benchmark_util.run_layer_benchmark(
+        "dense", layer, tf.ones((2, 3)), backward=True, repeats=2,
+        iters_per_repeat=1)
+    self.assertLen(result.times, 2)
+
+  def test_run_fit_benchmark(self):
+    model = tf.keras.Sequential([tf.keras.layers.Dense(1)])
+    model.compile("sgd", "mse")
+    result = benchmark_util.run_fit_benchmark(
+        "fit", model, tf.ones((8, 3)), tf.ones((8, 1)), batch_size=2,
+        repeats=2)
+    self.assertLen(result.times, 2)
+    self.assertEqual(result.iters, 4)
+
+  def test_save_and_load_results(self):
+    results = [benchmark_util.BenchmarkResult("a", [1., 2.], 10),
+               benchmark_util.BenchmarkResult("b", [3.], 1)]
+    path = os.path.join(self.get_temp_dir(), "results.json")
+    benchmark_util.save_results(results, path)
+    self.assertEqual(benchmark_util.load_results(path), results)
+    with open(path) as f:
+      self.assertAllClose(json.load(f)["results"][0]["mean"], 1.5)
+
+  def test_find_regressions(self):
+    baseline = [benchmark_util.BenchmarkResult("fast", [1., 1.01, 0.99], 1),
+                benchmark_util.BenchmarkResult("noisy", [1., 1.01, 0.99], 1),
+                benchmark_util.BenchmarkResult("same", [1., 1.01, 0.99], 1)]
+    results = [benchmark_util.BenchmarkResult("fast", [2., 2.01, 1.99], 1),
+               benchmark_util.BenchmarkResult("noisy", [0.5, 3., 1.], 1),
+               benchmark_util.BenchmarkResult("same", [1.01, 1.02, 1.], 1),
+               benchmark_util.BenchmarkResult("new", [1.], 1)]
+    regressions = benchmark_util.find_regressions(
+        results, baseline, threshold=0.1)
+    self.assertEqual([r.name for r in regressions], ["fast"])
+    self.assertAllClose(regressions[0].relative_change, 1.)
+
+    path = os.path.join(self.get_temp_dir(), "baseline.json")
+    benchmark_util.save_results(baseline, path)
+    with self.assertRaisesRegex(AssertionError, "fast"):
+      benchmark_util.check_regressions(results, path, threshold=0.1)
+    benchmark_util.check_regressions(results[1:], path, threshold=0.1)
+
 
 if __name__ == "__main__":
   tf.test.main()
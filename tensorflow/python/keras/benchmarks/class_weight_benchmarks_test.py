@@ -0,0 +1,88 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the overhead of `class_weight` on `fit`."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import numpy as np
+import tensorflow as tf
+
+from tensorflow.python.keras.benchmarks import benchmark_util
+from tensorflow.python.platform.benchmark import ParameterizedBenchmark
+
+_NUM_SAMPLES = 8192
+_BATCH_SIZE = 64
+_NUM_FEATURES = 32
+
+
+def _get_model(num_classes):
+  model = tf.keras.Sequential([
+      tf.keras.layers.Dense(num_classes, input_shape=(_NUM_FEATURES,))])
+  model.compile(
+      'sgd',
+      tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True))
+  return model
+
+
+class ClassWeightBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks `fit` with and without class weights on many classes."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the number of classes.
+  _benchmark_parameters = [
+      ('%d_classes_%s' % (num_classes, input_type), num_classes, input_type)
+      for num_classes in (10, 1000, 10000)
+      for input_type in ('numpy', 'dataset')
+  ]
+
+  def benchmark_class_weight(self, num_classes, input_type):
+    """Measures the step time of `fit` with `class_weight`.
+
+    Args:
+      num_classes: Number of classes of the targets.
+      input_type: Either "numpy" (weights looked up once for all samples) or
+        "dataset" (weights looked up in every batch).
+    """
+    x = np.random.random((_NUM_SAMPLES, _NUM_FEATURES)).astype('float32')
+    y = np.random.randint(num_classes, size=(_NUM_SAMPLES, 1))
+    class_weight = {i: np.random.random() for i in range(num_classes)}
+    if input_type == 'dataset':
+      x = tf.data.Dataset.from_tensor_slices((x, y)).batch(_BATCH_SIZE)
+      y = None
+
+    name = 'class_weight_%d_classes_%s' % (num_classes, input_type)
+    baseline = benchmark_util.run_fit_benchmark(
+        name + '_baseline', _get_model(num_classes), x, y,
+        batch_size=_BATCH_SIZE)
+    result = benchmark_util.run_fit_benchmark(
+        name, _get_model(num_classes), x, y, batch_size=_BATCH_SIZE,
+        class_weight=class_weight)
+
+    report_kwargs = result.report_kwargs(
+        extras={'num_classes': num_classes, 'input_type': input_type})
+    report_kwargs['metrics'].extend([{
+        'name': 'baseline_wall_time',
+        'value': baseline.mean,
+    }, {
+        'name': 'overhead_percent',
+        'value': 100. * (result.mean - baseline.mean) / baseline.mean,
+    }])
+    self.report_benchmark(**report_kwargs)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -106,6 +106,48 @@ class MicroBenchmarksBase(tf.test.Benchmark):
 
     self._run(fn, 10000)
 
+  def _run_layer_call_overhead(self, layer, x, num_iters=10000):
+
+    def fn():
+      layer(x)
+
+    fn()  # Builds the layer.
+    self._run(fn, num_iters)
+
+  def benchmark_layers_call_overhead_with_input_spec(self):
+
+    class OnlyOverheadLayer(tf.keras.layers.Layer):
+
+      def __init__(self):
+        super(OnlyOverheadLayer, self).__init__()
+        self.input_spec = tf.keras.layers.InputSpec(shape=(None, 1))
+
+      def call(self, x):
+        return x
+
+    self._run_layer_call_overhead(
+        OnlyOverheadLayer(), tf.convert_to_tensor([[1.]]))
+
+  def benchmark_layers_call_overhead_with_autocast(self):
+
+    class OnlyOverheadLayer(tf.keras.layers.Layer):
+
+      def call(self, x):
+        return x
+
+    self._run_layer_call_overhead(
+        OnlyOverheadLayer(dtype="float64"), tf.convert_to_tensor([[1.]]))
+
+  def benchmark_layers_call_overhead_list_inputs(self):
+    self._run_layer_call_overhead(
+        tf.keras.layers.Add(),
+        [tf.convert_to_tensor([[1.]]), tf.convert_to_tensor([[1.]])])
+
+  def benchmark_layers_call_overhead_masked_inputs(self):
+    x = tf.convert_to_tensor([[1.]])
+    x._keras_mask = tf.convert_to_tensor([True])  # pylint: disable=protected-access
+    self._run_layer_call_overhead(tf.keras.layers.Activation("linear"), x)
+
   def benchmark_op_layer_call_overhead(self):
     model_input = tf.keras.Input(shape=(1,))
     model_output = model_input
@@ -136,6 +178,34 @@ class MicroBenchmarksBase(tf.test.Benchmark):
 
     self._run(fn, 20)
 
+  def _run_functional_call_overhead(self, num_layers, num_iters):
+
+    class OnlyOverheadLayer(tf.keras.layers.Layer):
+
+      def call(self, x):
+        return x
+
+    # Residual blocks, so that some intermediate tensors are read by more
+    # than one layer.
+    model_input = tf.keras.Input(shape=(1,))
+    x = model_input
+    for _ in range(num_layers // 2):
+      y = OnlyOverheadLayer()(x)
+      x = tf.keras.layers.Add()([x, y])
+    model = tf.keras.Model(inputs=model_input, outputs=x)
+    x = tf.convert_to_tensor([[1.]])
+
+    def fn():
+      model(x)  # pylint: disable=not-callable
+
+    self._run(fn, num_iters)
+
+  def benchmark_functional_model_call_overhead_100_layers(self):
+    self._run_functional_call_overhead(100, 100)
+
+  def benchmark_functional_model_call_overhead_1000_layers(self):
+    self._run_functional_call_overhead(1000, 10)
+
   def benchmark_layers_embeddings_embedding_overhead(self):
 
     layer = tf.keras.layers.Embedding(1, 1)
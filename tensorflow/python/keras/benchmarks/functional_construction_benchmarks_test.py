@@ -0,0 +1,79 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for building very large Functional models."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import timeit
+
+import tensorflow as tf
+
+from tensorflow.python.keras.benchmarks import benchmark_util
+from tensorflow.python.platform.benchmark import ParameterizedBenchmark
+
+
+def _call_layers(num_layers):
+  """Calls `num_layers` layers, with a residual connection every 4 layers."""
+  inputs = tf.keras.Input(shape=(8,))
+  x = residual = inputs
+  for i in range(num_layers):
+    if i % 4 == 3:
+      x = residual = tf.keras.layers.Add()([x, residual])
+    else:
+      x = tf.keras.layers.Dense(8)(x)
+  return inputs, x
+
+
+class FunctionalConstructionBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks the construction time of Functional models versus depth."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the number of layers.
+  _benchmark_parameters = [
+      ('%d_layers' % num_layers, num_layers)
+      for num_layers in (1000, 10000, 50000)
+  ]
+
+  def benchmark_functional_construction(self, num_layers):
+    """Measures calling the layers, then creating the model from the graph.
+
+    Args:
+      num_layers: Number of layers of the model.
+    """
+    start = timeit.default_timer()
+    inputs, outputs = _call_layers(num_layers)
+    layer_calls_time = timeit.default_timer() - start
+
+    result = benchmark_util.run_benchmark(
+        'functional_construction_%d_layers' % num_layers,
+        lambda: tf.keras.Model(inputs, outputs),
+        warmup_iters=0,
+        repeats=3,
+        iters_per_repeat=1)
+    report_kwargs = result.report_kwargs(extras={'num_layers': num_layers})
+    report_kwargs['metrics'].extend([{
+        'name': 'layer_calls_time',
+        'value': layer_calls_time,
+    }, {
+        'name': 'us_per_layer',
+        'value': 1e6 * (layer_calls_time + result.mean) / num_layers,
+    }])
+    self.report_benchmark(**report_kwargs)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -118,8 +118,18 @@ RECURRENT_LAYERS = [
      {"units": 1}, {"input_shape": (1, 1, 1)}, 100),
     ("LSTM_normal_shape", tf.keras.layers.LSTM,
      {"units": 4}, {"input_shape": (32, 10, 8)}, 100),
+    ("LSTM_large_shape", tf.keras.layers.LSTM,
+     {"units": 64}, {"input_shape": (32, 100, 64)}, 10),
+    ("LSTMUnrolled_normal_shape", tf.keras.layers.LSTM,
+     {"units": 4, "unroll": True}, {"input_shape": (32, 10, 8)}, 100),
     ("GRU_small_shape", tf.keras.layers.GRU,
      {"units": 1}, {"input_shape": (1, 1, 1)}, 100),
+    ("GRU_normal_shape", tf.keras.layers.GRU,
+     {"units": 4}, {"input_shape": (32, 10, 8)}, 100),
+    ("GRU_large_shape", tf.keras.layers.GRU,
+     {"units": 64}, {"input_shape": (32, 100, 64)}, 10),
+    ("GRUUnrolled_normal_shape", tf.keras.layers.GRU,
+     {"units": 4, "unroll": True}, {"input_shape": (32, 10, 8)}, 100),
     ("SimpleRNN_small_shape", tf.keras.layers.SimpleRNN,
      {"units": 1}, {"input_shape": (1, 1, 1)}, 100),
     ("TimeDistributed_small_shape", tf.keras.layers.TimeDistributed,
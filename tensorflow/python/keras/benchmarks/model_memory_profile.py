@@ -18,6 +18,10 @@ To add a new model for memory profile:
 1. Create the model.
 2. Decorate it with `@memory_profiler.profile`.
 3. Add the model function to the dict `models`.
+
+With `--layer_breakdown`, a training step of the model is traced instead and
+the parameter, optimizer slot and saved activation bytes of each layer are
+printed. This requires the model to be added to the dict `compiled_models`.
 """
 from __future__ import absolute_import
 from __future__ import division
@@ -31,6 +35,8 @@ import numpy as np
 
 import tensorflow as tf
 
+from tensorflow.python.keras.utils import memory_utils
+
 try:
   import memory_profiler  # pylint:disable=g-import-not-at-top
 except ImportError:
@@ -40,11 +46,13 @@ except ImportError:
 FLAGS = flags.FLAGS
 flags.DEFINE_string('model', None,
                     'The model to run memory profiler.')
+flags.DEFINE_bool('layer_breakdown', False,
+                  'Print the estimated memory of each layer for one training '
+                  'step instead of running the memory profiler.')
 
 
-@memory_profiler.profile
-def _imdb_lstm_model():
-  """LSTM model."""
+def _compiled_imdb_lstm_model():
+  """Returns the compiled IMDB LSTM model, its training data and batch size."""
   x_train = np.random.randint(0, 1999, size=(2500, 100))
   y_train = np.random.random((2500, 1))
 
@@ -55,8 +63,22 @@ def _imdb_lstm_model():
   model.add(tf.keras.layers.Dense(1, activation='sigmoid'))
 
   model.compile('sgd', 'mse')
+  return model, x_train, y_train, 512
+
+
+@memory_profiler.profile
+def _imdb_lstm_model():
+  """LSTM model."""
+  model, x_train, y_train, batch_size = _compiled_imdb_lstm_model()
   # Warm up the model with one epoch.
-  model.fit(x_train, y_train, batch_size=512, epochs=3)
+  model.fit(x_train, y_train, batch_size=batch_size, epochs=3)
+
+
+def _print_layer_breakdown(get_compiled_model):
+  model, x_train, y_train, batch_size = get_compiled_model()
+  profile = memory_utils.profile_memory(
+      model, x_train[:batch_size], y_train[:batch_size])
+  memory_utils.print_memory_profile(profile)
 
 
 def main(_):
@@ -64,8 +86,14 @@ def main(_):
   models = {
       'lstm': _imdb_lstm_model,
   }
+  compiled_models = {
+      'lstm': _compiled_imdb_lstm_model,
+  }
 
-  if FLAGS.model in models:
+  if FLAGS.layer_breakdown and FLAGS.model in compiled_models:
+    logging.info('Print layer memory breakdown of %s.', FLAGS.model)
+    _print_layer_breakdown(compiled_models[FLAGS.model])
+  elif not FLAGS.layer_breakdown and FLAGS.model in models:
     logging.info('Run memory profile on %s.', FLAGS.model)
     run_model = models[FLAGS.model]
     run_model()
@@ -17,6 +17,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+
+import numpy as np
 import tensorflow as tf
 
 from tensorflow.python.keras.benchmarks import benchmark_util
@@ -82,5 +85,146 @@ class KerasOptimizerBenchmark(
         iters=num_iters, wall_time=wall_time, metrics=metrics, extras=extras)
 
 
+class KerasSparseOptimizerBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks optimizer updates of a large embedding table."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the optimizer name.
+  _benchmark_parameters = [
+      ("Adam", tf.keras.optimizers.Adam),
+      ("LazyAdam", lambda: tf.keras.optimizers.Adam(lazy_sparse_updates=True)),
+      ("Adagrad", tf.keras.optimizers.Adagrad),
+      ("Ftrl", tf.keras.optimizers.Ftrl),
+  ]
+
+  def benchmark_sparse_embedding_update(self, optimizer_fn, num_rows=10**6,
+                                        embedding_dim=32, batch_size=4096,
+                                        num_iters=20):
+    """Measures `apply_gradients` with `IndexedSlices` gradients.
+
+    The gradients have `batch_size` rows drawn with a Zipf distribution, so
+    that frequent ids are repeated within a batch as with real embeddings.
+
+    Args:
+      optimizer_fn: Callable returning the optimizer to benchmark.
+      num_rows: Number of rows of the embedding table.
+      embedding_dim: Number of columns of the embedding table.
+      batch_size: Number of (possibly repeated) rows in each gradient.
+      num_iters: The number of iterations to run for performance measurement.
+    """
+    optimizer = optimizer_fn()
+    table = tf.Variable(
+        tf.random.uniform((num_rows, embedding_dim), dtype="float32"))
+    ids = np.minimum(np.random.zipf(1.2, size=(num_iters + 1, batch_size)),
+                     num_rows) - 1
+    ids = tf.constant(ids, dtype="int64")
+    values = tf.random.uniform((batch_size, embedding_dim), dtype="float32")
+
+    @tf.function
+    def train_step(step_ids):
+      grad = tf.IndexedSlices(values, step_ids, tf.shape(table, "int64"))
+      optimizer.apply_gradients([(grad, table)])
+
+    # Warm up, and create the slot variables.
+    train_step(ids[0])
+    start = time.time()
+    for i in range(1, num_iters + 1):
+      train_step(ids[i])
+    # Wait for the updates to be applied.
+    table.numpy()
+    wall_time = (time.time() - start) / num_iters
+
+    metrics = [{
+        "name": "updates_per_sec",
+        "value": 1. / wall_time,
+    }]
+    extras = {
+        "num_rows": num_rows,
+        "embedding_dim": embedding_dim,
+        "batch_size": batch_size,
+    }
+    self.report_benchmark(
+        iters=num_iters, wall_time=wall_time, metrics=metrics, extras=extras)
+
+
+def _per_variable_apply(optimizer_fn):
+  """Returns `optimizer_fn` with the grouped dense apply path disabled."""
+
+  def fn():
+    optimizer = optimizer_fn()
+    optimizer._HAS_GROUPED_APPLY = False  # pylint: disable=protected-access
+    return optimizer
+
+  return fn
+
+
+class KerasOptimizerApplyOverheadBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks the per-step overhead of updating many small variables."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the optimizer name.
+  _benchmark_parameters = [
+      ("SGD", tf.keras.optimizers.SGD),
+      ("SGDPerVariable", _per_variable_apply(tf.keras.optimizers.SGD)),
+      ("Adam", tf.keras.optimizers.Adam),
+      ("AdamPerVariable", _per_variable_apply(tf.keras.optimizers.Adam)),
+      ("RMSprop", tf.keras.optimizers.RMSprop),
+      ("RMSpropPerVariable", _per_variable_apply(tf.keras.optimizers.RMSprop)),
+  ]
+
+  def benchmark_many_variables_apply(self, optimizer_fn, num_variables=1000,
+                                     num_iters=20):
+    """Measures `apply_gradients` on a list of small dense variables.
+
+    Reports the time of an eager step, the time to trace a `tf.function` step
+    and the time of a `tf.function` step.
+
+    Args:
+      optimizer_fn: Callable returning the optimizer to benchmark.
+      num_variables: Number of variables updated at each step.
+      num_iters: The number of iterations to run for performance measurement.
+    """
+    var_list = [tf.Variable(tf.zeros((16,))) for _ in range(num_variables)]
+    grads = [tf.ones((16,)) for _ in range(num_variables)]
+
+    optimizer = optimizer_fn()
+    # Warm up, and create the slot variables.
+    optimizer.apply_gradients(zip(grads, var_list))
+    start = time.time()
+    for _ in range(num_iters):
+      optimizer.apply_gradients(zip(grads, var_list))
+    var_list[-1].numpy()
+    eager_wall_time = (time.time() - start) / num_iters
+
+    @tf.function
+    def train_step():
+      optimizer.apply_gradients(zip(grads, var_list))
+
+    start = time.time()
+    train_step.get_concrete_function()
+    trace_time = time.time() - start
+    train_step()
+    start = time.time()
+    for _ in range(num_iters):
+      train_step()
+    var_list[-1].numpy()
+    wall_time = (time.time() - start) / num_iters
+
+    metrics = [{
+        "name": "eager_step_time",
+        "value": eager_wall_time,
+    }, {
+        "name": "trace_time",
+        "value": trace_time,
+    }]
+    extras = {
+        "num_variables": num_variables,
+    }
+    self.report_benchmark(
+        iters=num_iters, wall_time=wall_time, metrics=metrics, extras=extras)
+
+
 if __name__ == "__main__":
   tf.test.main()
@@ -0,0 +1,54 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for loading deep models with and without lazy revival."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import tensorflow as tf
+from tensorflow.python.keras.benchmarks.saved_model_benchmarks import saved_model_benchmark_util
+
+
+def _deep_mlp(num_layers):
+  inputs = tf.keras.Input(shape=(8,))
+  x = inputs
+  for _ in range(num_layers):
+    x = tf.keras.layers.Dense(8, activation='relu')(x)
+  return tf.keras.Model(inputs, x)
+
+
+class BenchmarkLazyLoad(tf.test.Benchmark):
+
+  def _benchmark_load(self, num_layers):
+    model = _deep_mlp(num_layers)
+    model_name = 'deep_mlp_{}_layers'.format(num_layers)
+    for lazy in (False, True):
+      result = saved_model_benchmark_util.load_benchmark(
+          model, model_name, lazy=lazy)
+      self.report_benchmark(
+          iters=result['iters'],
+          wall_time=result['wall_time'],
+          name=result['name'])
+
+  def benchmark_load_deep_mlp_100_layers(self):
+    self._benchmark_load(100)
+
+  def benchmark_load_deep_mlp_1000_layers(self):
+    self._benchmark_load(1000)
+
+
+if __name__ == '__main__':
+  tf.test.main()
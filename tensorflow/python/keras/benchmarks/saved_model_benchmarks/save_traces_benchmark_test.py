@@ -0,0 +1,60 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for saving models with all traces or serving traces only."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import tensorflow as tf
+from tensorflow.python.keras.benchmarks.saved_model_benchmarks import saved_model_benchmark_util
+
+
+def _repeated_blocks_model(num_blocks):
+  """A model built from identical residual blocks."""
+  inputs = tf.keras.Input(shape=(64,))
+  x = inputs
+  for _ in range(num_blocks):
+    y = tf.keras.layers.Dense(64, activation='relu')(x)
+    y = tf.keras.layers.Dense(64)(y)
+    y = tf.keras.layers.LayerNormalization()(y)
+    x = tf.keras.layers.Add()([x, y])
+  outputs = tf.keras.layers.Dense(10)(x)
+  return tf.keras.Model(inputs, outputs)
+
+
+class BenchmarkSaveTraces(tf.test.Benchmark):
+
+  def _benchmark_save(self, num_blocks):
+    model = _repeated_blocks_model(num_blocks)
+    model_name = 'repeated_blocks_{}'.format(num_blocks)
+    for save_traces in (True, 'serving'):
+      result = saved_model_benchmark_util.save_traces_benchmark(
+          model, model_name, save_traces=save_traces)
+      self.report_benchmark(
+          iters=result['iters'],
+          wall_time=result['wall_time'],
+          metrics=result['metrics'],
+          name=result['name'])
+
+  def benchmark_save_repeated_blocks_10(self):
+    self._benchmark_save(10)
+
+  def benchmark_save_repeated_blocks_50(self):
+    self._benchmark_save(50)
+
+
+if __name__ == '__main__':
+  tf.test.main()
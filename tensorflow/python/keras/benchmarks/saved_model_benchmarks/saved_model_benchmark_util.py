@@ -18,6 +18,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import os
 import tempfile
 import time
 
@@ -68,3 +69,81 @@ def save_and_load_benchmark(app):
   gfile.DeleteRecursively(save_dir)
   return save_result, load_result
 
+
+def load_benchmark(model, model_name, lazy=False):
+  """Times `load_model`, followed by one inference call on the loaded model.
+
+  Args:
+    model: A built Keras model with a single input.
+    model_name: Name of the model in the benchmark results.
+    lazy: Whether to load the model with `load_model(..., lazy=True)`.
+
+  Returns:
+    The benchmark results, as a dictionary.
+  """
+  trials = 3
+
+  tmp_dir = test.get_temp_dir()
+  gfile.MakeDirs(tmp_dir)
+  save_dir = tempfile.mkdtemp(dir=tmp_dir)
+  model.save(save_dir, save_format='tf')
+  x = tf.ones([1] + list(model.input_shape[1:]))
+
+  total_load_time = 0
+  for _ in range(trials):
+    start_time = time.time()
+    loaded = tf.keras.models.load_model(save_dir, lazy=lazy)
+    loaded(x, training=False)
+    total_load_time += time.time() - start_time
+
+  gfile.DeleteRecursively(save_dir)
+  return {
+      'iters': trials,
+      'wall_time': total_load_time / trials,
+      'name': '{}.{}'.format(model_name, 'lazy_load' if lazy else 'load')
+  }
+
+
+def save_traces_benchmark(model, model_name, save_traces=True):
+  """Times `model.save` with the given `save_traces`, and measures its output.
+
+  Args:
+    model: A built Keras model.
+    model_name: Name of the model in the benchmark results.
+    save_traces: The `save_traces` argument of `model.save`.
+
+  Returns:
+    The benchmark results, as a dictionary. The size of the SavedModel is
+    reported in the `metrics`.
+  """
+  trials = 3
+
+  tmp_dir = test.get_temp_dir()
+  gfile.MakeDirs(tmp_dir)
+  save_dir = tempfile.mkdtemp(dir=tmp_dir)
+
+  # Run one untimed iteration of saving.
+  model.save(save_dir, save_format='tf', save_traces=save_traces)
+
+  total_save_time = 0
+  for _ in range(trials):
+    start_time = time.time()
+    model.save(save_dir, save_format='tf', save_traces=save_traces)
+    total_save_time += time.time() - start_time
+
+  saved_model_bytes = 0
+  for dir_name, _, file_names in tf.io.gfile.walk(save_dir):
+    for file_name in file_names:
+      saved_model_bytes += tf.io.gfile.stat(
+          os.path.join(dir_name, file_name)).length
+
+  gfile.DeleteRecursively(save_dir)
+  return {
+      'iters': trials,
+      'wall_time': total_save_time / trials,
+      'name': '{}.save_traces_{}'.format(model_name, save_traces),
+      'metrics': [{
+          'name': 'saved_model_mb',
+          'value': saved_model_bytes / 2.**20
+      }]
+  }
@@ -0,0 +1,97 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for the overhead of the `TensorBoard` callback on `fit`."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import tempfile
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from tensorflow.python.platform.benchmark import ParameterizedBenchmark
+
+_NUM_SAMPLES = 4096
+_BATCH_SIZE = 32
+_NUM_EPOCHS = 3
+_HIDDEN_UNITS = 1024
+_NUM_LAYERS = 8
+
+
+def _get_model():
+  model = tf.keras.Sequential(
+      [tf.keras.layers.Dense(_HIDDEN_UNITS, activation='relu')
+       for _ in range(_NUM_LAYERS)] + [tf.keras.layers.Dense(1)])
+  model.compile('sgd', 'mse', metrics=['mae'])
+  return model
+
+
+def _time_per_step(model, callbacks):
+  x = np.random.random((_NUM_SAMPLES, _HIDDEN_UNITS)).astype('float32')
+  y = np.random.random((_NUM_SAMPLES, 1)).astype('float32')
+  # Warm up.
+  model.fit(x, y, batch_size=_BATCH_SIZE, epochs=1, verbose=0)
+  start = time.time()
+  model.fit(
+      x, y, batch_size=_BATCH_SIZE, epochs=_NUM_EPOCHS, verbose=0,
+      callbacks=callbacks)
+  num_steps = _NUM_EPOCHS * _NUM_SAMPLES // _BATCH_SIZE
+  return (time.time() - start) / num_steps
+
+
+class TensorBoardOverheadBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks batch-level logging with and without background writes."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the name of the configuration.
+  _benchmark_parameters = [
+      ('inline', False),
+      ('background', True),
+  ]
+
+  def benchmark_batch_logging(self, write_in_background):
+    """Measures the step time of `fit` with per-batch summaries.
+
+    Args:
+      write_in_background: `write_in_background` of the callback.
+    """
+    model = _get_model()
+    baseline = _time_per_step(model, [])
+    tb_callback = tf.keras.callbacks.TensorBoard(
+        tempfile.mkdtemp(),
+        histogram_freq=1,
+        update_freq=1,
+        profile_batch=0,
+        write_in_background=write_in_background)
+    wall_time = _time_per_step(model, [tb_callback])
+
+    self.report_benchmark(
+        iters=_NUM_EPOCHS * _NUM_SAMPLES // _BATCH_SIZE,
+        wall_time=wall_time,
+        metrics=[{
+            'name': 'baseline_wall_time',
+            'value': baseline,
+        }, {
+            'name': 'overhead_percent',
+            'value': 100. * (wall_time - baseline) / baseline,
+        }],
+        extras={'write_in_background': write_in_background})
+
+
+if __name__ == '__main__':
+  tf.test.main()
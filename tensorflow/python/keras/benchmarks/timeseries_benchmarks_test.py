@@ -0,0 +1,127 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmarks for `timeseries_dataset_from_array`."""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from tensorflow.python.platform.benchmark import ParameterizedBenchmark
+
+_NUM_STEPS = 2 ** 18
+_NUM_FEATURES = 8
+_BATCH_SIZE = 32
+_NUM_BATCHES = 50
+
+
+def gather_timeseries_dataset(data, sequence_length, batch_size):
+  """Reference implementation gathering an index tensor for each window."""
+  num_seqs = len(data) - sequence_length + 1
+  start_positions = np.arange(num_seqs, dtype='int32')
+  positions_ds = tf.data.Dataset.from_tensors(start_positions).repeat()
+  indices = tf.data.Dataset.zip(
+      (tf.data.Dataset.range(num_seqs), positions_ds)).map(
+          lambda i, positions: tf.range(  # pylint: disable=g-long-lambda
+              positions[i], positions[i] + sequence_length),
+          num_parallel_calls=tf.data.experimental.AUTOTUNE)
+  steps_ds = tf.data.Dataset.from_tensors(data).repeat()
+  dataset = tf.data.Dataset.zip((steps_ds, indices)).map(
+      tf.gather, num_parallel_calls=tf.data.experimental.AUTOTUNE)
+  return dataset.batch(batch_size)
+
+
+def _resident_memory_mb():
+  """Returns the resident memory of the process, or None if unavailable."""
+  try:
+    with open('/proc/self/statm') as f:
+      resident_pages = int(f.read().split()[1])
+  except (IOError, OSError, IndexError, ValueError):
+    return None
+  return resident_pages * os.sysconf('SC_PAGE_SIZE') / 2. ** 20
+
+
+class TimeseriesDatasetBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Benchmarks windowing a long timeseries with stride 1."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the name of the implementation.
+  _benchmark_parameters = [
+      ('%s_%d' % (implementation, sequence_length), implementation,
+       sequence_length)
+      for implementation in ('gather', 'slice', 'memmap')
+      for sequence_length in (256, 1024, 4096)
+  ]
+
+  def benchmark_timeseries_dataset(self, implementation, sequence_length):
+    """Measures the throughput of iterating over windows.
+
+    Args:
+      implementation: One of "gather" (reference implementation), "slice"
+        (`timeseries_dataset_from_array` on an in-memory array) or "memmap"
+        (`timeseries_dataset_from_array` on a `np.memmap`).
+      sequence_length: Length of the windows.
+    """
+    data = np.random.random((_NUM_STEPS, _NUM_FEATURES)).astype('float32')
+    if implementation == 'gather':
+      dataset = gather_timeseries_dataset(data, sequence_length, _BATCH_SIZE)
+    else:
+      if implementation == 'memmap':
+        path = os.path.join(tempfile.mkdtemp(), 'data.npy')
+        np.save(path, data)
+        del data
+        data = np.load(path, mmap_mode='r')
+      dataset = tf.keras.preprocessing.timeseries_dataset_from_array(
+          data, None, sequence_length=sequence_length, batch_size=_BATCH_SIZE)
+
+    iterator = iter(dataset)
+    # Warm up.
+    next(iterator)
+    memory_before = _resident_memory_mb()
+    start = time.time()
+    for _ in range(_NUM_BATCHES):
+      next(iterator)
+    wall_time = (time.time() - start) / _NUM_BATCHES
+    memory_after = _resident_memory_mb()
+
+    metrics = [{
+        'name': 'windows_per_sec',
+        'value': _BATCH_SIZE / wall_time,
+    }]
+    if memory_before is not None and memory_after is not None:
+      metrics.append({
+          'name': 'resident_memory_mb',
+          'value': memory_after,
+      })
+      metrics.append({
+          'name': 'resident_memory_growth_mb',
+          'value': memory_after - memory_before,
+      })
+    self.report_benchmark(
+        iters=_NUM_BATCHES,
+        wall_time=wall_time,
+        metrics=metrics,
+        extras={'implementation': implementation,
+                'sequence_length': sequence_length})
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -46,6 +46,8 @@ from tensorflow.python.keras import backend as K
 from tensorflow.python.keras.distribute import distributed_file_utils
 from tensorflow.python.keras.distribute import worker_training_state
 from tensorflow.python.keras.optimizer_v2 import learning_rate_schedule
+from tensorflow.python.keras.saving import async_saving
+from tensorflow.python.keras.saving import saving_utils
 from tensorflow.python.keras.utils import generic_utils
 from tensorflow.python.keras.utils import tf_utils
 from tensorflow.python.keras.utils import version_utils
@@ -955,6 +957,12 @@ class ProgbarLogger(Callback):
           All others will be averaged over time (e.g. loss, etc).
           If not provided, defaults to the `Model`'s metrics.
 
+  With `verbose=1`, the progress bar is refreshed at most every 0.05 seconds,
+  and logs are only converted to NumPy when it is, so that the training loop
+  does not wait on the device at every batch. When stdout is not interactive
+  (e.g. redirected to a file), only the final progress bar of each epoch is
+  printed and no work is done per batch.
+
   Raises:
       ValueError: In case of invalid `count_mode`.
   """
@@ -992,7 +1000,9 @@ class ProgbarLogger(Callback):
     else:
       self.target = None  # Will be inferred at the end of the first epoch.
 
-    self._call_batch_hooks = self.verbose == 1
+    # Intermediate progress is only displayed when someone is watching.
+    self._call_batch_hooks = (self.verbose == 1 and
+                              generic_utils.is_interactive_stdout())
     if self.target is None:
       try:
         self._train_step = self.model._train_counter  # pylint: disable=protected-access
@@ -1084,8 +1094,7 @@ class ProgbarLogger(Callback):
       self.seen += add_seen
 
     if self.verbose == 1:
-      # Only block async when verbose = 1.
-      logs = tf_utils.to_numpy_or_python_type(logs)
+      # The progbar only blocks async when it is displayed.
       self.progbar.update(self.seen, list(logs.items()), finalize=False)
 
   def _finalize_progbar(self, logs, counter):
@@ -1127,6 +1136,17 @@ class History(Callback):
     self.model.history = self
 
 
+def _reraise_checkpoint_io_error(error, filepath):
+  """Re-raises an `IOError` of a checkpoint write with a clearer message."""
+  # `e.errno` appears to be `None` so checking the content of `e.args[0]`.
+  if 'is a directory' in six.ensure_str(error.args[0]).lower():
+    raise IOError('Please specify a non-directory filepath for '
+                  'ModelCheckpoint. Filepath used is an existing '
+                  'directory: {}'.format(filepath))
+  # Re-throw the error for any other causes.
+  raise error
+
+
 @keras_export('keras.callbacks.ModelCheckpoint')
 class ModelCheckpoint(Callback):
   """Callback to save the Keras model or model weights at some frequency.
@@ -1223,6 +1243,17 @@ class ModelCheckpoint(Callback):
       options: Optional `tf.train.CheckpointOptions` object if
         `save_weights_only` is true or optional `tf.saved_model.SaveOptions`
         object if `save_weights_only` is false.
+      save_in_background: If True, saving only blocks training while the
+        values to save are copied into host memory, and the files are written
+        from a background thread. Supported for weights in either format and
+        for full models saved in HDF5 format; full models saved in SavedModel
+        format are always saved synchronously. Errors raised while writing
+        are re-raised by the next save or at the end of training. The total
+        time training was blocked on saving is available as
+        `save_blocked_time`.
+      max_pending_saves: When `save_in_background=True`, the maximum number
+        of snapshots waiting to be written. Further saves block until a write
+        finishes. Defaults to 1.
       **kwargs: Additional arguments for backwards compatibility. Possible key
         is `period`.
   """
@@ -1236,6 +1267,8 @@ class ModelCheckpoint(Callback):
                mode='auto',
                save_freq='epoch',
                options=None,
+               save_in_background=False,
+               max_pending_saves=1,
                **kwargs):
     super(ModelCheckpoint, self).__init__()
     self._supports_tf_logs = True
@@ -1305,10 +1338,23 @@ class ModelCheckpoint(Callback):
     if self.save_freq != 'epoch' and not isinstance(self.save_freq, int):
       raise ValueError('Unrecognized save_freq: {}'.format(self.save_freq))
 
+    self.save_in_background = save_in_background
+    if save_in_background:
+      self._background_saver = async_saving.BackgroundSaver(max_pending_saves)
+    else:
+      self._background_saver = None
+
     # Only the chief worker writes model checkpoints, but all workers
     # restore checkpoint at on_train_begin().
     self._chief_worker_only = False
 
+  @property
+  def save_blocked_time(self):
+    """Seconds training was blocked on saves made in the background."""
+    if self._background_saver is None:
+      return 0.
+    return self._background_saver.blocked_time
+
   def set_model(self, model):
     self.model = model
     # Use name matching rather than `isinstance` to avoid circular dependencies.
@@ -1332,6 +1378,11 @@ class ModelCheckpoint(Callback):
           raise ValueError('Error loading file from {}. Reason: {}'.format(
               filepath_to_load, e))
 
+  def on_train_end(self, logs=None):
+    if self._background_saver is not None:
+      # Surfaces any error raised while writing in the background.
+      self._background_saver.join()
+
   def _implements_train_batch_hooks(self):
     # Only call batch hooks when saving on batch
     return self.save_freq != 'epoch'
@@ -1388,6 +1439,7 @@ class ModelCheckpoint(Callback):
           if current is None:
             logging.warning('Can save best model only with %s available, '
                             'skipping.', self.monitor)
+            self._maybe_remove_file()
           else:
             if self.monitor_op(current, self.best):
               if self.verbose > 0:
@@ -1395,33 +1447,63 @@ class ModelCheckpoint(Callback):
                       ' saving model to %s' % (epoch + 1, self.monitor,
                                                self.best, current, filepath))
               self.best = current
-              if self.save_weights_only:
-                self.model.save_weights(
-                    filepath, overwrite=True, options=self._options)
-              else:
-                self.model.save(filepath, overwrite=True, options=self._options)
+              self._write_model(filepath)
             else:
               if self.verbose > 0:
                 print('\nEpoch %05d: %s did not improve from %0.5f' %
                       (epoch + 1, self.monitor, self.best))
+              self._maybe_remove_file()
         else:
           if self.verbose > 0:
             print('\nEpoch %05d: saving model to %s' % (epoch + 1, filepath))
-          if self.save_weights_only:
-            self.model.save_weights(
-                filepath, overwrite=True, options=self._options)
-          else:
-            self.model.save(filepath, overwrite=True, options=self._options)
-
-        self._maybe_remove_file()
+          self._write_model(filepath)
       except IOError as e:
-        # `e.errno` appears to be `None` so checking the content of `e.args[0]`.
-        if 'is a directory' in six.ensure_str(e.args[0]).lower():
-          raise IOError('Please specify a non-directory filepath for '
-                        'ModelCheckpoint. Filepath used is an existing '
-                        'directory: {}'.format(filepath))
-        # Re-throw the error for any other causes.
-        raise e
+        _reraise_checkpoint_io_error(e, filepath)
+
+  def _write_model(self, filepath):
+    """Saves the model or its weights to `filepath`.
+
+    When saving in the background, this only snapshots the values to save and
+    hands the write over to `self._background_saver`.
+
+    Args:
+        filepath: the file path returned by `_get_file_path`.
+    """
+    write_filepath = self._write_filepath
+    strategy = self.model.distribute_strategy
+    if self.save_in_background and (self.save_weights_only or
+                                    saving_utils.is_hdf5_filepath(filepath)):
+
+      def snapshot_fn():
+        if self.save_weights_only:
+          write_fn = async_saving.snapshot_model_weights(
+              self.model, filepath, options=self._options)
+        else:
+          write_fn = async_saving.snapshot_model(self.model, filepath)
+
+        def write_and_clean_up():
+          try:
+            write_fn()
+          except IOError as e:
+            # Raised on the training thread by the next `submit` or `join`.
+            _reraise_checkpoint_io_error(e, filepath)
+          finally:
+            distributed_file_utils.remove_temp_dir_with_filepath(
+                write_filepath, strategy)
+
+        return write_and_clean_up
+
+      self._background_saver.submit(snapshot_fn)
+      return
+
+    if self._background_saver is not None:
+      # Keep writes ordered with the ones still pending.
+      self._background_saver.join()
+    if self.save_weights_only:
+      self.model.save_weights(filepath, overwrite=True, options=self._options)
+    else:
+      self.model.save(filepath, overwrite=True, options=self._options)
+    self._maybe_remove_file()
 
   def _get_file_path(self, epoch, logs):
     """Returns the file path for checkpoint."""
@@ -1602,11 +1684,21 @@ class BackupAndRestore(Callback):
         cannot be reused elsewhere to store other files, e.g. by
         BackupAndRestore callback of another training, or by another callback
         (ModelCheckpoint) of the same training.
+      save_in_background: If True, backing up only blocks training while the
+        training state is copied into host memory, and the checkpoint is
+        written from a background thread. Errors raised while writing are
+        re-raised by the next backup or at the end of training.
+      max_pending_saves: When `save_in_background=True`, the maximum number
+        of backups waiting to be written. Defaults to 1.
   """
 
-  def __init__(self, backup_dir):
+  def __init__(self, backup_dir, save_in_background=False, max_pending_saves=1):
     super(BackupAndRestore, self).__init__()
     self.backup_dir = backup_dir
+    if save_in_background:
+      self._background_saver = async_saving.BackgroundSaver(max_pending_saves)
+    else:
+      self._background_saver = None
     self._supports_tf_logs = True
     self._supported_strategies = (
         mirrored_strategy.MirroredStrategy,
@@ -1645,8 +1737,17 @@ class BackupAndRestore(Callback):
     self._training_state = self.model._training_state
     self._training_state.restore()
 
+  @property
+  def save_blocked_time(self):
+    """Seconds training was blocked on backups made in the background."""
+    if self._background_saver is None:
+      return 0.
+    return self._background_saver.blocked_time
+
   def on_train_end(self, logs=None):
     # pylint: disable=protected-access
+    if self._background_saver is not None:
+      self._background_saver.join()
     # On exit of training, delete the training state backup file that was saved
     # for the purpose of worker recovery.
     self._training_state.delete_backup()
@@ -1657,7 +1758,10 @@ class BackupAndRestore(Callback):
 
   def on_epoch_end(self, epoch, logs=None):
     # Back up the model and current epoch for possible future recovery.
-    self._training_state.back_up(epoch)
+    if self._background_saver is not None:
+      self._training_state.back_up_in_background(epoch, self._background_saver)
+    else:
+      self._training_state.back_up(epoch)
 
 
 @keras_export('keras.callbacks.EarlyStopping')
@@ -1978,6 +2082,11 @@ def keras_model_summary(name, data, step=None):
         tag=tag, tensor=tensor, step=step, metadata=summary_metadata)
 
 
+# Maximum number of events queued by the summary writers of `TensorBoard`
+# before writing them to disk when `write_in_background=True`.
+_BACKGROUND_MAX_QUEUE = 1000
+
+
 @keras_export('keras.callbacks.TensorBoard', v1=[])
 class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
   # pylint: disable=line-too-long
@@ -2035,6 +2144,13 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
           https://www.tensorflow.org/how_tos/embedding_viz/#metadata_optional)
         about metadata files format. In case if the same metadata file is
         used for all embedding layers, string can be passed.
+      write_in_background: If True, epoch-level summaries only block training
+        while the weights and metrics are copied into host memory; the weight
+        histograms and images are computed and written from a background
+        thread. Summary files are also flushed in larger batches, every 1000
+        events rather than every 10, which makes batch-level logging with
+        `update_freq` cheaper. Errors raised while writing are re-raised by
+        the next epoch-level summary or at the end of training.
 
   Examples:
 
@@ -2116,6 +2232,7 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
                profile_batch=2,
                embeddings_freq=0,
                embeddings_metadata=None,
+               write_in_background=False,
                **kwargs):
     super(TensorBoard, self).__init__()
     self._supports_tf_logs = True
@@ -2129,6 +2246,11 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     self.update_freq = 1 if update_freq == 'batch' else update_freq
     self.embeddings_freq = embeddings_freq
     self.embeddings_metadata = embeddings_metadata
+    self.write_in_background = write_in_background
+    if write_in_background:
+      self._background_writer = async_saving.BackgroundSaver()
+    else:
+      self._background_writer = None
     self._init_profile_batch(profile_batch)
     self._epoch = 0
     self._global_train_batch = 0
@@ -2193,16 +2315,24 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
   @property
   def _train_writer(self):
     if 'train' not in self._writers:
-      self._writers['train'] = summary_ops_v2.create_file_writer_v2(
-          self._train_dir)
+      self._writers['train'] = self._create_writer(self._train_dir)
     return self._writers['train']
 
   @property
   def _val_writer(self):
     if 'val' not in self._writers:
-      self._writers['val'] = summary_ops_v2.create_file_writer_v2(self._val_dir)
+      self._writers['val'] = self._create_writer(self._val_dir)
     return self._writers['val']
 
+  def _create_writer(self, logdir):
+    if self.write_in_background:
+      # Events are written to disk in batches instead of by the op that
+      # fills the queue, which for batch-level summaries runs in the
+      # training step.
+      return summary_ops_v2.create_file_writer_v2(
+          logdir, max_queue=_BACKGROUND_MAX_QUEUE)
+    return summary_ops_v2.create_file_writer_v2(logdir)
+
   def _get_log_write_dir(self):
     """For multi-worker, only chief should write, others write to '/tmp'."""
     return distributed_file_utils.write_dirpath(self.log_dir,
@@ -2354,6 +2484,9 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     if self._is_tracing:
       self._stop_trace()
 
+    if self._background_writer is not None:
+      # Surfaces any error raised while writing in the background.
+      self._background_writer.join()
     self._close_writers()
     self._delete_tmp_write_dir()
 
@@ -2452,28 +2585,64 @@ class TensorBoard(Callback, version_utils.TensorBoardVersionSelector):
     if self.write_steps_per_second:
       train_logs['steps_per_second'] = self._compute_steps_per_second()
 
-    with summary_ops_v2.record_if(True):
-      if train_logs:
-        with self._train_writer.as_default():
-          for name, value in train_logs.items():
-            summary_ops_v2.scalar('epoch_' + name, value, step=epoch)
-      if val_logs:
-        with self._val_writer.as_default():
-          for name, value in val_logs.items():
-            name = name[4:]  # Remove 'val_' prefix.
-            summary_ops_v2.scalar('epoch_' + name, value, step=epoch)
+    # The writers are created on the calling thread.
+    train_writer = self._train_writer if train_logs else None
+    val_writer = self._val_writer if val_logs else None
+
+    def write_fn(train_logs, val_logs):
+      with summary_ops_v2.record_if(True):
+        if train_logs:
+          with train_writer.as_default():
+            for name, value in train_logs.items():
+              summary_ops_v2.scalar('epoch_' + name, value, step=epoch)
+        if val_logs:
+          with val_writer.as_default():
+            for name, value in val_logs.items():
+              name = name[4:]  # Remove 'val_' prefix.
+              summary_ops_v2.scalar('epoch_' + name, value, step=epoch)
+
+    if self._background_writer is None:
+      write_fn(train_logs, val_logs)
+      return
+
+    def snapshot_fn():
+      snapshot = async_saving.snapshot_to_host((train_logs, val_logs))
+      return lambda: write_fn(*snapshot)
+
+    self._background_writer.submit(snapshot_fn)
 
   def _log_weights(self, epoch):
     """Logs the weights of the Model to TensorBoard."""
-    with self._train_writer.as_default():
-      with summary_ops_v2.record_if(True):
-        for layer in self.model.layers:
-          for weight in layer.weights:
-            weight_name = weight.name.replace(':', '_')
+    named_weights = [(weight.name.replace(':', '_'), weight)
+                     for layer in self.model.layers
+                     for weight in layer.weights]
+    writer = self._train_writer
+
+    def write_fn(named_weights):
+      with writer.as_default():
+        with summary_ops_v2.record_if(True):
+          for weight_name, weight in named_weights:
             summary_ops_v2.histogram(weight_name, weight, step=epoch)
             if self.write_images:
               self._log_weight_as_image(weight, weight_name, epoch)
-        self._train_writer.flush()
+
+    if self._background_writer is None:
+      write_fn(named_weights)
+      writer.flush()
+      return
+
+    def snapshot_fn():
+      snapshot = async_saving.snapshot_to_host(named_weights)
+
+      def write_snapshot():
+        # The histograms of the host copies are computed on the host.
+        with ops.device('/cpu:0'):
+          write_fn(snapshot)
+        writer.flush()
+
+      return write_snapshot
+
+    self._background_writer.submit(snapshot_fn)
 
   def _log_weight_as_image(self, weight, weight_name, epoch):
     """Logs a weight as a TensorBoard image."""
@@ -20,6 +20,7 @@ from __future__ import print_function
 
 import collections
 import csv
+import io
 import json
 import os
 import re
@@ -47,6 +48,7 @@ from tensorflow.python.keras.layers import Activation
 from tensorflow.python.keras.layers import Dense
 from tensorflow.python.keras.optimizer_v2 import gradient_descent
 from tensorflow.python.keras.optimizer_v2 import learning_rate_schedule
+from tensorflow.python.keras.utils import generic_utils
 from tensorflow.python.keras.utils import np_utils
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import math_ops
@@ -926,6 +928,58 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
                                 'filepath.*'):
       model.fit(train_ds, epochs=1, callbacks=[callback])
 
+  @parameterized.named_parameters(('h5', 'checkpoint.epoch{epoch:02d}.h5'),
+                                  ('tf', 'checkpoint.epoch{epoch:02d}'))
+  def test_ModelCheckpoint_save_weights_in_background(self, file_pattern):
+    if h5py is None:
+      return  # Skip test if models cannot be saved.
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    filepath = os.path.join(self.get_temp_dir(), file_pattern)
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath, save_weights_only=True, save_in_background=True)
+
+    model.fit(train_ds, epochs=3, callbacks=[callback])
+
+    self.assertGreaterEqual(callback.save_blocked_time, 0.)
+    expected_weights = model.get_weights()
+    model.load_weights(
+        callback._get_most_recently_modified_file_matching_pattern(filepath))
+    self.assertAllClose(expected_weights, model.get_weights())
+
+  def test_ModelCheckpoint_save_model_in_background(self):
+    if h5py is None:
+      return  # Skip test if models cannot be saved.
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    filepath = os.path.join(self.get_temp_dir(), 'model.h5')
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath, save_freq=1, save_in_background=True,
+        max_pending_saves=2)
+
+    model.fit(train_ds, epochs=2, callbacks=[callback])
+
+    loaded_model = keras.models.load_model(
+        filepath, custom_objects={'Bias': testing_utils.Bias})
+    self.assertAllClose(model.get_weights(), loaded_model.get_weights())
+    self.assertAllClose(
+        model.optimizer.get_weights(), loaded_model.optimizer.get_weights())
+
+  def test_ModelCheckpoint_save_in_background_raises_write_errors(self):
+    if h5py is None:
+      return  # Skip test if models cannot be saved.
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    filepath = os.path.join(self.get_temp_dir(), 'temp.h5')
+    os.mkdir(filepath)
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath, save_weights_only=True, save_in_background=True)
+
+    with self.assertRaisesRegex(
+        IOError, 'Please specify a non-directory '
+        'filepath for ModelCheckpoint.'):
+      model.fit(train_ds, epochs=1, callbacks=[callback])
+
   def test_ModelCheckpoint_nonblocking(self):
     filepath = self.get_temp_dir()
     # Should only cause a sync block when saving is actually performed.
@@ -1004,6 +1058,65 @@ class KerasCallbacksTest(keras_parameterized.TestCase):
       cb_list.on_epoch_end(0, logs)
     cb_list.on_train_end(logs)
 
+  def test_ProgbarLogger_verbose_1_rate_limited(self):
+    # Should only convert logs to NumPy when the progbar is displayed.
+    callback = keras.callbacks.ProgbarLogger(count_mode='steps')
+    callback.set_model(keras.Sequential([keras.layers.Dense(1)]))
+    callback.set_params({'verbose': 1, 'epochs': 1, 'steps': 10})
+
+    tensor = ops.convert_to_tensor_v2_with_dispatch(1.)
+
+    def mock_numpy():
+      raise RuntimeError(
+          'If this error is seen, ProgbarLogger is causing a blocking NumPy '
+          'conversion at every batch.')
+
+    tensor.numpy = mock_numpy
+    logs = {'metric': tensor}
+
+    callback.on_train_begin(logs)
+    callback.on_epoch_begin(0, logs)
+    callback.progbar.interval = 60.
+    callback.progbar._last_update = time.time()
+    with self.captureWritesToStream(sys.stdout) as printed:
+      for batch in range(9):
+        callback.on_train_batch_end(batch, logs)
+    self.assertEqual(printed.contents(), '')
+    self.assertEqual(callback.seen, 9)
+
+    callback.progbar.interval = 0.
+    with self.captureWritesToStream(sys.stdout) as printed:
+      callback.on_train_batch_end(9, logs)
+    self.assertIn('10/10', printed.contents())
+    self.assertIn('metric: 1.0000', printed.contents())
+
+  @parameterized.parameters(True, False)
+  def test_ProgbarLogger_batch_hooks_need_interactive_stdout(
+      self, interactive):
+    callback = keras.callbacks.ProgbarLogger(count_mode='steps')
+    model = keras.Sequential([keras.layers.Dense(1)])
+    with test.mock.patch.object(
+        generic_utils, 'is_interactive_stdout', return_value=interactive):
+      cb_list = keras.callbacks.CallbackList([callback],
+                                             model=model,
+                                             epochs=1,
+                                             steps=10,
+                                             verbose=1)
+    self.assertEqual(cb_list._should_call_train_batch_hooks, interactive)
+
+  def test_ProgbarLogger_no_batch_hooks_when_stdout_is_a_file(self):
+    if 'ipykernel' in sys.modules or 'PYCHARM_HOSTED' in os.environ:
+      self.skipTest('stdout is always considered interactive.')
+    callback = keras.callbacks.ProgbarLogger(count_mode='steps')
+    model = keras.Sequential([keras.layers.Dense(1)])
+    with test.mock.patch.object(sys, 'stdout', io.StringIO()):
+      cb_list = keras.callbacks.CallbackList([callback],
+                                             model=model,
+                                             epochs=1,
+                                             steps=10,
+                                             verbose=1)
+    self.assertFalse(cb_list._should_call_train_batch_hooks)
+
   def test_EarlyStopping(self):
     with self.cached_session():
       np.random.seed(123)
@@ -2167,6 +2280,43 @@ class TestTensorBoardV2(keras_parameterized.TestCase):
         expected
     )
 
+  def test_TensorBoard_write_in_background(self):
+    model = self._get_model()
+    x, y = np.ones((10, 10, 10, 1)), np.ones((10, 1))
+    tb_cbk = keras.callbacks.TensorBoard(
+        self.logdir,
+        histogram_freq=1,
+        write_images=True,
+        update_freq=1,
+        write_in_background=True)
+    model_type = testing_utils.get_model_type()
+
+    model.fit(
+        x,
+        y,
+        batch_size=2,
+        epochs=2,
+        validation_data=(x, y),
+        callbacks=[tb_cbk])
+    summary_file = list_summaries(self.logdir)
+
+    self.assertEqual(
+        summary_file.scalars,
+        {
+            _ObservedSummary(logdir=self.train_dir, tag='batch_loss'),
+            _ObservedSummary(logdir=self.train_dir, tag='epoch_loss'),
+            _ObservedSummary(logdir=self.validation_dir, tag='epoch_loss'),
+        },
+    )
+    self.assertEqual(
+        self._strip_layer_names(summary_file.histograms, model_type),
+        {
+            _ObservedSummary(logdir=self.train_dir, tag='bias_0'),
+            _ObservedSummary(logdir=self.train_dir, tag='kernel_0'),
+        },
+    )
+    self.assertNotEmpty(summary_file.images)
+
   def test_TensorBoard_projector_callback(self):
     layers = [
         keras.layers.Embedding(10, 10, name='test_embedding'),
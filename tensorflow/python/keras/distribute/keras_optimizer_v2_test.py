@@ -24,6 +24,7 @@ from tensorflow.python import keras
 from tensorflow.python.distribute import combinations as ds_combinations
 from tensorflow.python.distribute import distribution_strategy_context as ds_context
 from tensorflow.python.distribute import strategy_combinations
+from tensorflow.python.distribute import test_util
 from tensorflow.python.eager import context
 from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import dtypes
@@ -134,6 +135,42 @@ class MirroredStrategyOptimizerV2Test(test.TestCase, parameterized.TestCase):
       model.predict(inputs)
 
 
+class GradientAccumulationTest(test.TestCase, parameterized.TestCase):
+
+  def setUp(self):
+    test_util.set_logical_devices_to_at_least('CPU', 3)
+    super(GradientAccumulationTest, self).setUp()
+
+  @ds_combinations.generate(
+      combinations.combine(
+          distribution=[
+              strategy_combinations.default_strategy,
+              strategy_combinations.mirrored_strategy_with_cpu_1_and_2,
+          ],
+          mode=['eager']))
+  def testGradientAccumulationMatchesLargerBatch(self, distribution):
+    x = np.random.random((16, 3)).astype('float32')
+    y = np.random.random((16, 4)).astype('float32')
+
+    def train(batch_size, gradient_accumulation_steps):
+      with distribution.scope():
+        model = get_model()
+        model.compile(
+            gradient_descent.SGD(0.1, momentum=0.9),
+            'mse',
+            gradient_accumulation_steps=gradient_accumulation_steps)
+        model.set_weights([np.ones((3, 4)), np.zeros((4,))])
+      model.fit(x, y, batch_size=batch_size, epochs=2, shuffle=False,
+                verbose=0)
+      return model
+
+    model = train(batch_size=8, gradient_accumulation_steps=1)
+    accumulated_model = train(batch_size=2, gradient_accumulation_steps=4)
+    # The optimizer is applied once per window of 4 batches.
+    self.assertEqual(accumulated_model.optimizer.iterations.numpy(), 4)
+    self.assertAllClose(model.get_weights(), accumulated_model.get_weights())
+
+
 def _replica_id():
   replica_id = ds_context.get_replica_context().replica_id_in_sync_group
   if not isinstance(replica_id, ops.Tensor):
@@ -23,6 +23,7 @@ from tensorflow.python.framework import constant_op
 from tensorflow.python.framework import dtypes
 from tensorflow.python.keras import backend as K
 from tensorflow.python.keras.distribute import distributed_file_utils
+from tensorflow.python.keras.saving import async_saving
 from tensorflow.python.keras.utils import mode_keys
 from tensorflow.python.lib.io import file_io
 from tensorflow.python.ops import variables
@@ -61,6 +62,7 @@ class WorkerTrainingState(object):
     # when backing up.
     checkpoint = trackable_util.Checkpoint(
         model=self._model, ckpt_saved_epoch=self._ckpt_saved_epoch)
+    self._checkpoint = checkpoint
 
     # If this is single-worker training, checkpoint_dir are the same for
     # write_checkpoint_manager and read_checkpoint_manager.
@@ -98,6 +100,42 @@ class WorkerTrainingState(object):
           self.write_checkpoint_manager.directory,
           self._model.distribute_strategy)
 
+  def back_up_in_background(self, epoch, background_saver):
+    """Back up the current state of training from a background thread.
+
+    Only copying the training state into host memory happens on the calling
+    thread; the checkpoint file is written by `background_saver`.
+
+    Args:
+      epoch: The current epoch information to be saved.
+      background_saver: An `async_saving.BackgroundSaver`.
+    """
+    manager = self.write_checkpoint_manager
+    strategy = self._model.distribute_strategy
+
+    def snapshot_fn():
+      K.set_value(self._ckpt_saved_epoch, epoch)
+      checkpoint_number = K.get_value(
+          self._checkpoint.save_counter.assign_add(1))
+      prefix = '%s-%d' % (os.path.join(manager.directory, 'ckpt'),
+                          checkpoint_number)
+      snapshot = async_saving.snapshot_trackable_saver(self._checkpoint._saver)  # pylint: disable=protected-access
+
+      def write_fn():
+        previous_prefix = checkpoint_management.latest_checkpoint(
+            manager.directory)
+        async_saving.write_trackable_snapshot(snapshot, prefix)
+        # Mirrors `max_to_keep=1` of the checkpoint managers.
+        if previous_prefix and previous_prefix != prefix:
+          for filename in file_io.get_matching_files_v2(
+              previous_prefix + '.*'):
+            file_io.delete_file_v2(filename)
+        distributed_file_utils.remove_temp_dirpath(manager.directory, strategy)
+
+      return write_fn
+
+    background_saver.submit(snapshot_fn)
+
   def restore(self):
     """Restore the training state from the backed up checkpoint file.
 
@@ -100,6 +100,9 @@ _TF_OP_LAYER_NAME_PREFIX = 'tf_op_layer_'
 _AUTOCAST_TYPES = (ops.Tensor, sparse_tensor.SparseTensor,
                    ragged_tensor.RaggedTensor)
 
+# Maximum number of input signatures remembered by `Layer._fast_path_call`.
+_FAST_PATH_CACHE_SIZE = 32
+
 keras_layers_gauge = monitoring.BoolGauge('/tensorflow/api/keras/layers',
                                           'keras layers usage', 'method')
 keras_models_gauge = monitoring.BoolGauge(
@@ -290,9 +293,10 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
   # since it is trying to convert Trackable to a string. This attribute can be
   # ignored even after the fix of nest lib, since the trackable object should
   # already been available as individual attributes. _obj_reference_counts_dict
-  # just contains a copy of them.
+  # just contains a copy of them. _call_fast_path_cache only holds call
+  # signatures, keyed by `DType`s and shapes.
   _TF_MODULE_IGNORED_PROPERTIES = frozenset(itertools.chain(
-      ('_obj_reference_counts_dict',),
+      ('_obj_reference_counts_dict', '_call_fast_path_cache'),
       module.Module._TF_MODULE_IGNORED_PROPERTIES
   ))
 
@@ -364,6 +368,9 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
     self.built = False
     # Provides information about which inputs are compatible with the layer.
     self._input_spec = None
+    # Maps input signatures seen by `__call__` to whether inputs with that
+    # signature need to be autocast. See `_fast_path_call`.
+    self._call_fast_path_cache = {}
 
     # SavedModel-related attributes.
     # Record the build input shape for loading purposes.
@@ -947,6 +954,20 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
       raise RuntimeError(
           'You must call `super().__init__()` in the layer constructor.')
 
+    # Performance optimization: a built layer called eagerly on the same input
+    # signature as a previous call skips the checks that already passed for
+    # that signature. See `_fast_path_call`.
+    fast_path_key = None
+    if (self.built and len(args) == 1 and
+        (not kwargs or _is_fast_path_kwargs(kwargs)) and
+        context.executing_eagerly()):
+      fast_path_key = _fast_path_key(args[0])
+      if fast_path_key is not None:
+        should_cast = self._call_fast_path_cache.get(fast_path_key)
+        if (should_cast is not None and
+            not self._has_input_masks(args[0], fast_path_key)):
+          return self._fast_path_call(args[0], kwargs, should_cast)
+
     # `inputs` (the first arg in the method spec) is special cased in
     # layer call due to historical reasons.
     # This special casing currently takes the form of:
@@ -1038,7 +1059,75 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
         if self._saved_model_inputs_spec is None:
           self._set_save_spec(inputs)
 
-        return outputs
+    if fast_path_key is not None:
+      self._record_fast_path(fast_path_key, input_list)
+    return outputs
+
+  def _fast_path_call(self, inputs, kwargs, should_cast):
+    """Eager `__call__` for an input signature that was seen before.
+
+    Only used once a built layer has completed a regular `__call__` on inputs
+    with the same structure, shapes and dtypes (see `_fast_path_key`). For
+    such inputs the functional construction detection, NumPy conversion and
+    `input_spec` check of `__call__` are redundant, and whether the inputs need
+    to be autocast is known in advance. The call still runs in the name scope
+    of the layer, e.g. for the tags of summaries written in `call`. Inputs
+    carrying a Keras mask always take the regular path.
+
+    Args:
+      inputs: An `EagerTensor`, or a list or tuple of `EagerTensor`s.
+      kwargs: Keyword arguments passed to `__call__`. Only `training` is
+        supported.
+      should_cast: Whether `inputs` need to be cast to the compute dtype.
+
+    Returns:
+      Output tensor(s).
+    """
+    call_context = base_layer_utils.call_context()
+    args, kwargs, training_mode = self._set_training_mode(
+        (), kwargs, call_context)
+    if not call_context.in_call:
+      self._clear_losses()
+
+    with call_context.enter(
+        layer=self, inputs=inputs, build_graph=False, training=training_mode):
+      if should_cast:
+        inputs = nest.map_structure(self._cast_single_input, inputs)
+      with ops.name_scope_v2(self._name):
+        with autocast_variable.enable_auto_cast_variables(
+            self._compute_dtype_object):
+          outputs = self.call(inputs, *args, **kwargs)
+
+        if self._activity_regularizer:
+          self._handle_activity_regularization(inputs, outputs)
+        if self._supports_masking:
+          self._set_mask_metadata(inputs, outputs, None, False)
+    return outputs
+
+  def _has_input_masks(self, inputs, fast_path_key):
+    if not self._supports_masking and not self._expects_mask_arg:
+      return False
+    if isinstance(fast_path_key[0], dtypes.DType):
+      return getattr(inputs, '_keras_mask', None) is not None
+    return any(getattr(x, '_keras_mask', None) is not None for x in inputs)
+
+  def _record_fast_path(self, fast_path_key, input_list):
+    """Enables `_fast_path_call` for an input signature."""
+    cache = self._call_fast_path_cache
+    if len(cache) >= _FAST_PATH_CACHE_SIZE:
+      # Layers called on many distinct shapes, e.g. with a variable batch
+      # size, keep only the most recent signatures.
+      cache.clear()
+    compute_dtype_object = self._compute_dtype_object
+    cache[fast_path_key] = bool(
+        self._autocast and compute_dtype_object and
+        compute_dtype_object.is_floating and
+        any(map(self._should_cast_single_input, input_list)))
+
+  def _clear_fast_path_cache(self):
+    cache = getattr(self, '_call_fast_path_cache', None)
+    if cache:
+      cache.clear()
 
   def _functional_construction_call(self, inputs, args, kwargs, input_list):
     call_context = base_layer_utils.call_context()
@@ -1361,6 +1450,7 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
         raise TypeError('Layer input_spec must be an instance of InputSpec. '
                         'Got: {}'.format(v))
     self._input_spec = value
+    self._clear_fast_path_cache()
 
   @property
   def trainable_weights(self):
@@ -2373,6 +2463,7 @@ class Layer(module.Module, version_utils.LayerVersionSelector):
           self._dtype_policy.compute_dtype)
     else:
       self._compute_dtype_object = None
+    self._clear_fast_path_cache()
 
   @property
   def dtype_policy(self):
@@ -3333,6 +3424,26 @@ def _in_functional_construction_mode(layer, inputs, args, kwargs, input_list):
               all(hasattr(t, '_keras_history') for t in input_list))
 
 
+def _fast_path_key(inputs):
+  """Returns the `Layer._fast_path_call` cache key of `inputs`, or None."""
+  if isinstance(inputs, ops.EagerTensor):
+    return (inputs.dtype, inputs._shape_tuple())
+  if type(inputs) in (list, tuple):  # pylint: disable=unidiomatic-typecheck
+    key = [type(inputs)]
+    for x in inputs:
+      if not isinstance(x, ops.EagerTensor):
+        return None
+      key.append((x.dtype, x._shape_tuple()))
+    return tuple(key)
+  return None
+
+
+def _is_fast_path_kwargs(kwargs):
+  """Whether `Layer._fast_path_call` supports these `__call__` kwargs."""
+  return (len(kwargs) == 1 and 'training' in kwargs and
+          isinstance(kwargs['training'], (bool, type(None))))
+
+
 def _convert_numpy_or_python_types(x):
   if isinstance(x, (np_arrays.ndarray, np.ndarray, float, int)):
     return ops.convert_to_tensor_v2_with_dispatch(x)
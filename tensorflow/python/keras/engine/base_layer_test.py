@@ -43,6 +43,7 @@ from tensorflow.python.keras import regularizers
 from tensorflow.python.keras import testing_utils
 from tensorflow.python.keras.engine import base_layer
 from tensorflow.python.keras.engine import input_layer
+from tensorflow.python.keras.engine import input_spec
 from tensorflow.python.keras.engine import sequential
 from tensorflow.python.keras.engine import training as training_lib
 from tensorflow.python.keras.legacy_tf_layers import core as legacy_core
@@ -868,6 +869,76 @@ class BaseLayerTest(keras_parameterized.TestCase):
     self.assertLen(model.trainable_variables, 0)
     self.assertLen(model.non_trainable_variables, 2)
 
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def test_call_fast_path(self):
+
+    class TrainingLayer(base_layer.Layer):
+
+      def build(self, input_shape):
+        self.input_spec = input_spec.InputSpec(shape=(None, input_shape[-1]))
+        self.v = self.add_weight('v', (), initializer='ones')
+
+      def call(self, inputs, training=None):
+        if training:
+          return inputs + self.v
+        return inputs * self.v
+
+    layer = TrainingLayer()
+    x = array_ops.ones((2, 3))
+    layer(x)  # Builds the layer, which clears the cache.
+    self.assertEmpty(layer._call_fast_path_cache)
+    layer(x)
+    self.assertLen(layer._call_fast_path_cache, 1)
+    self.assertAllEqual(layer(x), x)
+    self.assertAllEqual(layer(x, training=True), x + 1)
+    layer(array_ops.ones((4, 3)))
+    self.assertLen(layer._call_fast_path_cache, 2)
+
+    # Signatures that were never checked take the regular path.
+    with self.assertRaisesRegex(ValueError, 'is incompatible with the layer'):
+      layer(array_ops.ones((2, 4)))
+
+    # Setting the input spec forgets the signatures checked against the
+    # previous spec.
+    layer.input_spec = input_spec.InputSpec(shape=(None, 4))
+    self.assertEmpty(layer._call_fast_path_cache)
+    with self.assertRaisesRegex(ValueError, 'is incompatible with the layer'):
+      layer(x)
+
+  @combinations.generate(combinations.combine(mode=['eager']))
+  @testing_utils.enable_v2_dtype_behavior
+  def test_call_fast_path_casting_and_masking(self):
+    layer = layers.Dense(1, kernel_initializer='ones', dtype='float64')
+    x = array_ops.ones((2, 3), dtype='float32')
+    for _ in range(3):
+      self.assertEqual(layer(x).dtype, dtypes.float64)
+    self.assertTrue(layer._call_fast_path_cache[(dtypes.float32, (2, 3))])
+
+    masking_layer = layers.Activation('linear')
+    x = array_ops.ones((2, 3))
+    masking_layer(x)
+    masking_layer(x)
+    self.assertLen(masking_layer._call_fast_path_cache, 1)
+    x._keras_mask = array_ops.constant([True, False])
+    # Inputs carrying a mask take the regular path, which propagates the mask.
+    self.assertAllEqual(masking_layer(x)._keras_mask, [True, False])
+
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def test_call_fast_path_enters_name_scope(self):
+
+    class NameScopeLayer(base_layer.Layer):
+
+      def call(self, inputs):
+        self.active_name_scope = ops.get_name_scope()
+        return inputs
+
+    layer = NameScopeLayer(name='scoped')
+    x = array_ops.ones((2, 3))
+    for _ in range(3):
+      layer(x)
+      self.assertEqual(layer.active_name_scope, 'scoped')
+    self.assertLen(layer._call_fast_path_cache, 1)
+
 
 class SymbolicSupportTest(keras_parameterized.TestCase):
 
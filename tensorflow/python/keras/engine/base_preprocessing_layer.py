@@ -19,10 +19,14 @@ from __future__ import print_function
 
 import abc
 import collections
+import functools
+from multiprocessing import pool as multiprocessing_pool
+import threading
 
 import numpy as np
 import six
 
+from tensorflow.python.distribute import distribute_lib
 from tensorflow.python.eager import context
 from tensorflow.python.eager import def_function
 from tensorflow.python.eager import monitoring
@@ -45,6 +49,9 @@ keras_kpl_gauge = monitoring.BoolGauge(
     '/tensorflow/api/keras/layers/preprocessing',
     'keras preprocessing layers usage', 'method')
 
+# Guards building a layer from the first batch of concurrently adapted shards.
+_adapt_build_lock = threading.Lock()
+
 
 @keras_export('keras.layers.experimental.preprocessing.PreprocessingLayer')
 @six.add_metaclass(abc.ABCMeta)
@@ -319,6 +326,127 @@ class CombinerPreprocessingLayer(PreprocessingLayer):
     super(CombinerPreprocessingLayer, self).adapt(
         data, batch_size=batch_size, steps=steps, reset_state=reset_state)
 
+  def adapt_shard(self, data, batch_size=None, steps=None):
+    """Computes the accumulated state of one shard of the `adapt` data.
+
+    This is the per-shard half of a sharded `adapt`: it runs the layer's
+    combiner over `data` without touching the layer's state, and returns the
+    result as a serialized accumulator. Pass the results of all shards to
+    `merge_shards` to set the state of the layer. Each shard can be computed
+    by a different thread, process or machine, as long as it uses a layer
+    created from the same config.
+
+    ```python
+    # On each worker:
+    shard = layer.adapt_shard(dataset.shard(num_workers, worker_index))
+    # On the chief, once the shards have been collected:
+    layer.merge_shards(shards)
+    ```
+
+    Arguments:
+        data: The shard of data to process. It can be passed either as a
+          tf.data Dataset, or as a numpy array.
+        batch_size: Integer or `None`. Number of samples per state update.
+          If unspecified, `batch_size` will default to 32. Do not specify the
+          `batch_size` if your data is in the form of datasets.
+        steps: Integer or `None`. Total number of steps (batches of samples)
+          to process. If `None`, the shard is processed until exhausted.
+
+    Returns:
+      A byte string holding the serialized accumulator of the shard, or `None`
+      if the shard is empty.
+    """
+    _disallow_inside_tf_function('adapt_shard')
+    if not context.executing_eagerly():
+      raise RuntimeError('`adapt_shard` is only supported when executing '
+                         'eagerly.')
+    data_handler = data_adapter.DataHandler(
+        data,
+        batch_size=batch_size,
+        steps_per_epoch=steps,
+        epochs=1,
+        distribute=False)
+    accumulator = None
+    for _, iterator in data_handler.enumerate_epochs():
+      with data_handler.catch_stop_iteration():
+        for _ in data_handler.steps():
+          batch = next(iterator)
+          if not self.built:
+            with _adapt_build_lock:
+              self._adapt_maybe_build(batch)
+          accumulator = self._combiner.compute(batch, accumulator)
+    if accumulator is None:
+      return None
+    return self._combiner.serialize(accumulator)
+
+  def merge_shards(self, shards):
+    """Sets the state of the layer from the results of `adapt_shard`.
+
+    Arguments:
+        shards: A list of serialized accumulators returned by `adapt_shard`.
+          `None` entries (empty shards) are skipped.
+
+    Raises:
+      ValueError: If all shards are empty.
+    """
+    _disallow_inside_tf_function('merge_shards')
+    accumulators = [
+        self._combiner.deserialize(shard) for shard in shards
+        if shard is not None
+    ]
+    if not accumulators:
+      raise ValueError('`merge_shards` requires at least one non-empty shard.')
+    self._set_accumulator(self._combiner.merge(accumulators))
+    self._is_adapted = True
+
+  def adapt_in_parallel(self, dataset_fn, num_shards, pool=None):
+    """Fits the state of the layer by adapting shards of data in parallel.
+
+    `dataset_fn` is called once per shard with a
+    `tf.distribute.InputContext`, like the input function of
+    `tf.distribute.Strategy.distribute_datasets_from_function`, and should
+    return the part of the data identified by
+    `input_context.input_pipeline_id`, e.g. with `tf.data.Dataset.shard`.
+    Shards are computed with `adapt_shard` and merged once with
+    `merge_shards`.
+
+    Arguments:
+        dataset_fn: A function taking a `tf.distribute.InputContext` and
+          returning a batched `tf.data.Dataset` (or numpy array).
+        num_shards: The number of shards to split the data into.
+        pool: Optional object with a `map(fn, iterable)` method used to
+          compute the shards, e.g. a `multiprocessing.Pool`, a
+          `multiprocessing.pool.ThreadPool` or a `concurrent.futures.Executor`.
+          Defaults to a thread pool with one thread per shard. Each shard is
+          computed by a copy of the layer created from its config, so the layer
+          must implement `get_config`. With a process pool, `dataset_fn` must
+          also be picklable, e.g. a module-level function.
+    """
+    if num_shards < 1:
+      raise ValueError('`num_shards` must be at least 1, got: '
+                       '{}'.format(num_shards))
+    input_contexts = [
+        distribute_lib.InputContext(
+            num_input_pipelines=num_shards, input_pipeline_id=shard_index)
+        for shard_index in range(num_shards)
+    ]
+    if not self.built:
+      # The shards are computed by copies of the layer, so this layer is built
+      # from one batch of the first shard.
+      self.adapt_shard(dataset_fn(input_contexts[0]), steps=1)
+    compute_shard = functools.partial(_adapt_shard_from_config,
+                                      self.__class__, self.get_config(),
+                                      dataset_fn)
+    if pool is not None:
+      shards = list(pool.map(compute_shard, input_contexts))
+    else:
+      thread_pool = multiprocessing_pool.ThreadPool(num_shards)
+      try:
+        shards = thread_pool.map(compute_shard, input_contexts)
+      finally:
+        thread_pool.close()
+    self.merge_shards(shards)
+
   def _add_state_variable(self,
                           name,
                           shape,
@@ -397,6 +525,16 @@ class CombinerPreprocessingLayer(PreprocessingLayer):
         self.state_variables[var_name].assign(value)
 
 
+def _adapt_shard_from_config(layer_class, config, dataset_fn, input_context):
+  """Computes one shard of `adapt_in_parallel` with a layer built from config.
+
+  This is a module-level function so that it can be pickled and sent to the
+  workers of a process pool.
+  """
+  layer = layer_class.from_config(config)
+  return layer.adapt_shard(dataset_fn(input_context))
+
+
 def convert_to_list(values, sparse_default_value=None):
   """Convert a TensorLike, CompositeTensor, or ndarray into a Python list."""
   if tf_utils.is_ragged(values):
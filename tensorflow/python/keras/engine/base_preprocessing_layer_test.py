@@ -19,6 +19,7 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import multiprocessing
 import os
 
 from absl.testing import parameterized
@@ -132,6 +133,13 @@ def get_layer(**kwargs):
     return AddingPreprocessingLayerV1(**kwargs)
 
 
+def _shard_array(input_context):
+  # Module-level so that it can be sent to the workers of a process pool.
+  data = np.array([[1], [2], [3], [4], [5], [0]], dtype=np.float64)
+  return data[input_context.input_pipeline_id::
+              input_context.num_input_pipelines]
+
+
 @keras_parameterized.run_all_keras_modes
 class PreprocessingLayerTest(keras_parameterized.TestCase):
 
@@ -411,6 +419,53 @@ class PreprocessingLayerTest(keras_parameterized.TestCase):
     self.assertEqual(model.input_shape, (None, 1, 2))
 
 
+@keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+class ShardedAdaptTest(keras_parameterized.TestCase):
+
+  def test_adapt_in_parallel(self):
+    data = np.array([[1], [2], [3], [4], [5], [0]], dtype=np.float64)
+
+    def dataset_fn(input_context):
+      dataset = dataset_ops.Dataset.from_tensor_slices(data)
+      return dataset.shard(input_context.num_input_pipelines,
+                           input_context.input_pipeline_id).batch(2)
+
+    layer = get_layer()
+    layer.adapt_in_parallel(dataset_fn, num_shards=3)
+
+    input_data = keras.Input(shape=(1,))
+    output = layer(input_data)
+    model = keras.Model(input_data, output)
+    model._run_eagerly = testing_utils.should_run_eagerly()
+
+    self.assertAllEqual([[16], [17], [18]], model.predict([1., 2., 3.]))
+
+  def test_adapt_in_parallel_with_process_pool(self):
+    layer = get_layer()
+    pool = multiprocessing.get_context("spawn").Pool(2)
+    try:
+      layer.adapt_in_parallel(_shard_array, num_shards=2, pool=pool)
+    finally:
+      pool.close()
+      pool.join()
+    self.assertAllEqual([15.], keras.backend.get_value(layer._sum))
+
+  def test_adapt_shard_and_merge_shards(self):
+    shard_1 = get_layer().adapt_shard(np.array([1., 2., 3.]))
+    layer = get_layer()
+    shard_2 = layer.adapt_shard(np.array([4., 5.]))
+    # Computing a shard does not change the state of the layer.
+    self.assertAllEqual([0.], keras.backend.get_value(layer._sum))
+
+    layer.merge_shards([shard_1, shard_2, None])
+    self.assertAllEqual([15.], keras.backend.get_value(layer._sum))
+
+  def test_merge_empty_shards_fails(self):
+    layer = get_layer()
+    with self.assertRaisesRegex(ValueError, "at least one non-empty shard"):
+      layer.merge_shards([None, None])
+
+
 @keras_parameterized.run_all_keras_modes
 class ConvertToListTest(keras_parameterized.TestCase):
 
@@ -20,7 +20,6 @@ from __future__ import print_function
 
 import abc
 import contextlib
-import functools
 import itertools
 import math
 import random
@@ -1120,6 +1119,12 @@ class DataHandler(object):
       self._steps_per_execution_value = steps_per_execution.numpy().item()
 
     adapter_cls = select_data_adapter(x, y)
+    if class_weight and adapter_cls is TensorLikeDataAdapter:
+      # In-memory data is weighted once up front; the weights are then sliced
+      # together with the rest of each batch.
+      x, y, sample_weight = _class_weight_to_sample_weight(
+          class_weight, x, y, sample_weight)
+      class_weight = None
     self._adapter = adapter_cls(
         x,
         y,
@@ -1249,6 +1254,22 @@ class DataHandler(object):
     """
     return self._inferred_steps
 
+  @property
+  def inferred_samples(self):
+    """The number of samples in one epoch, or `None` if it is unknown.
+
+    The number of samples is only known for inputs with a fixed batch size,
+    such as NumPy arrays or tensors. When fewer steps than batches were
+    requested, only the samples of those steps are counted.
+    """
+    samples = self._adapter.get_samples()
+    if samples is None:
+      return None
+    if (self._inferred_steps is not None and
+        self._inferred_steps < self._adapter.get_size()):
+      return self._inferred_steps * self._adapter.batch_size()
+    return samples
+
   @property
   def should_sync(self):
     # Catch OutOfRangeError for Datasets of unknown size.
@@ -1323,8 +1344,13 @@ def _make_class_weight_map_fn(class_weight):
       raise ValueError("`class_weight` not supported for "
                        "3+ dimensional targets.")
 
+    if y.shape.rank == 2 and y.shape[1] is not None:
+      # Decide statically when possible to avoid a `cond` in every batch.
+      is_one_hot = y.shape[1] > 1
+    else:
+      is_one_hot = y.shape.rank == 2 and backend.shape(y)[1] > 1
     y_classes = smart_cond.smart_cond(
-        y.shape.rank == 2 and backend.shape(y)[1] > 1,
+        is_one_hot,
         lambda: backend.argmax(y, axis=1),
         lambda: math_ops.cast(backend.reshape(y, (-1,)), dtypes.int64))
 
@@ -1342,6 +1368,26 @@ def _make_class_weight_map_fn(class_weight):
   return _class_weights_map_fn
 
 
+def _class_weight_to_sample_weight(class_weight, x, y, sample_weight):
+  """Converts `class_weight` to `sample_weight` for in-memory data.
+
+  The class weights of all samples are looked up at once, so that no per-batch
+  `Dataset.map` is needed.
+
+  Args:
+    class_weight: See `Model.fit`.
+    x: Input data, a structure of `Tensor`s or NumPy arrays.
+    y: Target data, a single `Tensor` or NumPy array.
+    sample_weight: Optional `Tensor` or NumPy array of sample weights.
+
+  Returns:
+    A tuple `(x, y, sample_weight)` where `sample_weight` includes the class
+    weights.
+  """
+  x, y, sample_weight = _process_tensorlike((x, y, sample_weight))
+  return _make_class_weight_map_fn(class_weight)(x, y, sample_weight)
+
+
 def expand_1d(data):
   """Expands 1-dimensional `Tensor`s into 2-dimensional `Tensor`s."""
 
@@ -1404,17 +1450,18 @@ def train_validation_split(arrays, validation_split):
         "different value for the `validation_split` argument." .format(
             batch_dim=batch_dim, validation_split=validation_split))
 
-  def _split(t, start, end):
+  train_arrays = []
+  val_arrays = []
+  for t in flat_arrays:
     if t is None:
-      return t
-    return t[start:end]
-
-  train_arrays = nest.map_structure(
-      functools.partial(_split, start=0, end=split_at), arrays)
-  val_arrays = nest.map_structure(
-      functools.partial(_split, start=split_at, end=batch_dim), arrays)
+      train_arrays.append(None)
+      val_arrays.append(None)
+    else:
+      train_arrays.append(t[:split_at])
+      val_arrays.append(t[split_at:])
 
-  return train_arrays, val_arrays
+  return (nest.pack_sequence_as(arrays, train_arrays),
+          nest.pack_sequence_as(arrays, val_arrays))
 
 
 @keras_export("keras.utils.unpack_x_y_sample_weight", v1=[])
@@ -1528,6 +1575,9 @@ def single_batch_iterator(strategy,
                           class_weight=None):
   """Creates a single-batch dataset."""
   x, y, sample_weight = _process_tensorlike((x, y, sample_weight))
+  if class_weight:
+    x, y, sample_weight = _class_weight_to_sample_weight(
+        class_weight, x, y, sample_weight)
   if y is None:
     data = (x,)
   elif sample_weight is None:
@@ -1537,8 +1587,6 @@ def single_batch_iterator(strategy,
 
   _check_data_cardinality(data)
   dataset = dataset_ops.DatasetV2.from_tensors(data)
-  if class_weight:
-    dataset = dataset.map(_make_class_weight_map_fn(class_weight))
   dataset = strategy.experimental_distribute_dataset(dataset)
   return iter(dataset)
 
@@ -1010,6 +1010,34 @@ class DataHandlerTest(keras_parameterized.TestCase):
               2: 1.5
           })
 
+  @parameterized.named_parameters(('sparse', False), ('one_hot', True))
+  def test_class_weight_numpy_matches_dataset(self, one_hot):
+    x = np.arange(6).reshape((6, 1)).astype('float32')
+    y = np.array([0, 2, 1, 1, 0, 2])
+    if one_hot:
+      y = np.eye(3)[y]
+    sample_weight = np.array([1., 2., 1., 2., 1., 2.], dtype='float32')
+    class_weight = {0: 0.5, 1: 1., 2: 1.5}
+
+    def get_weights(data_handler):
+      weights = []
+      for _, iterator in data_handler.enumerate_epochs():
+        for _ in data_handler.steps():
+          weights.append(self.evaluate(next(iterator)[2]))
+      return np.concatenate(weights).ravel()
+
+    numpy_handler = data_adapter.DataHandler(
+        x, y, sample_weight=sample_weight, batch_size=4,
+        class_weight=class_weight)
+    dataset = dataset_ops.Dataset.from_tensor_slices(
+        (x, y, sample_weight)).batch(4)
+    dataset_handler = data_adapter.DataHandler(
+        dataset, class_weight=class_weight)
+
+    expected = [0.5, 3., 1., 2., 0.5, 3.]
+    self.assertAllClose(get_weights(numpy_handler), expected)
+    self.assertAllClose(get_weights(dataset_handler), expected)
+
   @parameterized.named_parameters(('numpy', True), ('dataset', False))
   def test_single_x_input_no_tuple_wrapping(self, use_numpy):
     x = np.ones((10, 1))
@@ -209,7 +209,8 @@ class Functional(training_lib.Model):
     self._self_tracked_trackables = layers
     self._layer_call_argspecs = {}
     for layer in self._self_tracked_trackables:
-      self._layer_call_argspecs[layer] = tf_inspect.getfullargspec(layer.call)
+      # Reuses the argspec cached by the layer.
+      self._layer_call_argspecs[layer] = layer._call_full_argspec  # pylint: disable=protected-access
 
     # Build self.input_names and self.output_names.
     self._set_output_names()
@@ -538,40 +539,13 @@ class Functional(training_lib.Model):
     for input_t, mask in zip(inputs, masks):
       input_t._keras_mask = mask
 
-    # Dictionary mapping reference tensors to computed tensors.
-    tensor_dict = {}
-    tensor_usage_count = self._tensor_usage_count
-    for x, y in zip(self.inputs, inputs):
-      y = self._conform_to_reference_input(y, ref_input=x)
-      x_id = str(id(x))
-      tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
-
-    nodes_by_depth = self._nodes_by_depth
-    depth_keys = list(nodes_by_depth.keys())
-    depth_keys.sort(reverse=True)
-
-    for depth in depth_keys:
-      nodes = nodes_by_depth[depth]
-      for node in nodes:
-        if node.is_input:
-          continue  # Input tensors already exist.
-
-        if any(t_id not in tensor_dict for t_id in node.flat_input_ids):
-          continue  # Node is not computable, try skipping.
-
-        args, kwargs = node.map_arguments(tensor_dict)
-        outputs = node.layer(*args, **kwargs)
-
-        # Update tensor_dict.
-        for x_id, y in zip(node.flat_output_ids, nest.flatten(outputs)):
-          tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
-
-    output_tensors = []
-    for x in self.outputs:
-      x_id = str(id(x))
-      assert x_id in tensor_dict, 'Could not compute output ' + str(x)
-      output_tensors.append(tensor_dict[x_id].pop())
-
+    inputs = [
+        self._conform_to_reference_input(y, ref_input=x)
+        for x, y in zip(self.inputs, inputs)
+    ]
+    if self._execution_plan is None:
+      self._execution_plan = _ExecutionPlan(self)
+    output_tensors = self._execution_plan.run(inputs)
     return nest.pack_sequence_as(self._nested_outputs, output_tensors)
 
   def _flatten_to_reference_inputs(self, tensors):
@@ -846,6 +820,9 @@ class Functional(training_lib.Model):
       tensor_usage_count[str(id(tensor))] += 1
 
     self._tensor_usage_count = tensor_usage_count
+    # The execution plan is derived from the same graph, and is rebuilt lazily
+    # on the next call.
+    self._execution_plan = None
 
   def _assert_weights_created(self):
     # Override the implementation in Model.
@@ -884,6 +861,132 @@ class Functional(training_lib.Model):
     return super(Functional, self)._get_save_spec(dynamic_batch)
 
 
+_PlanStep = collections.namedtuple('_PlanStep', [
+    'layer', 'node', 'single_positional_tensor', 'input_slots',
+    'argument_indices', 'single_output', 'output_slots', 'released_slots'
+])
+
+
+class _ExecutionPlan(object):
+  """A flat schedule for running the nodes of a Functional model.
+
+  The plan is computed once from `_nodes_by_depth` and replaces the per-call
+  walk over depths, the availability checks and the reference counting of
+  tensors done by dict lookups. Every tensor computed during a call is stored
+  in an integer slot of a flat list. A slot is released right after the last
+  node that reads it, so intermediate tensors are freed as early as possible,
+  and released slots are reused by tensors computed later.
+  """
+
+  def __init__(self, model):
+    # Nodes that can be computed from the model inputs, in execution order.
+    available = set(str(id(x)) for x in model.inputs)
+    nodes = []
+    for depth in sorted(model._nodes_by_depth.keys(), reverse=True):
+      for node in model._nodes_by_depth[depth]:
+        if node.is_input:
+          continue  # Input tensors already exist.
+        if any(t_id not in available for t_id in node.flat_input_ids):
+          continue  # Node is not computable, skip it.
+        nodes.append(node)
+        available.update(node.flat_output_ids)
+
+    output_ids = [str(id(x)) for x in model.outputs]
+    for x, x_id in zip(model.outputs, output_ids):
+      assert x_id in available, 'Could not compute output ' + str(x)
+
+    # Index of the last step reading each tensor. Model outputs stay alive.
+    last_use = {}
+    for i, node in enumerate(nodes):
+      for t_id in node.flat_input_ids:
+        last_use[t_id] = i
+    for t_id in output_ids:
+      last_use[t_id] = len(nodes)
+
+    slots = {}
+    free_slots = []
+    self._num_slots = 0
+
+    def acquire_slot(t_id):
+      if t_id not in last_use:
+        return None  # Never read, no need to keep it.
+      if t_id in slots:
+        return slots[t_id]
+      if free_slots:
+        slot = free_slots.pop()
+      else:
+        slot = self._num_slots
+        self._num_slots += 1
+      slots[t_id] = slot
+      return slot
+
+    self._input_slots = [acquire_slot(str(id(x))) for x in model.inputs]
+    self._steps = []
+    for i, node in enumerate(nodes):
+      input_slots = [slots[t_id] for t_id in node.flat_input_ids]
+      released_slots = []
+      for t_id in node.flat_input_ids:
+        slot = slots[t_id]
+        if last_use[t_id] == i and slot not in released_slots:
+          released_slots.append(slot)
+      free_slots.extend(released_slots)
+      output_slots = [acquire_slot(t_id) for t_id in node.flat_output_ids]
+      self._steps.append(
+          _PlanStep(
+              layer=node.layer,
+              node=node,
+              single_positional_tensor=node._single_positional_tensor_passed,
+              input_slots=input_slots,
+              argument_indices=[
+                  index for _, index in node._keras_inputs_ids_and_indices
+              ],
+              single_output=not nest.is_nested(node.outputs),
+              output_slots=output_slots,
+              released_slots=released_slots))
+    self._output_slots = [slots[t_id] for t_id in output_ids]
+
+  def run(self, inputs):
+    """Runs the plan on a flat list of conformed model inputs.
+
+    Args:
+      inputs: List of tensors, one per entry of `model.inputs`.
+
+    Returns:
+      A flat list of output tensors, one per entry of `model.outputs`.
+    """
+    values = [None] * self._num_slots
+    for slot, value in zip(self._input_slots, inputs):
+      if slot is not None:
+        values[slot] = value
+
+    for (layer, node, single_positional_tensor, input_slots, argument_indices,
+         single_output, output_slots, released_slots) in self._steps:
+      if single_positional_tensor:
+        # Performance optimization for most common case.
+        outputs = layer(values[input_slots[0]])
+      else:
+        flat_arguments = copy.copy(node._flat_arguments)
+        for index, slot in zip(argument_indices, input_slots):
+          flat_arguments[index] = values[slot]
+        args, kwargs = nest.pack_sequence_as((node.call_args, node.call_kwargs),
+                                             flat_arguments)
+        outputs = layer(*args, **kwargs)
+
+      # Drop references to tensors that are no longer needed.
+      for slot in released_slots:
+        values[slot] = None
+
+      if single_output:
+        if output_slots[0] is not None:
+          values[output_slots[0]] = outputs
+      else:
+        for slot, y in zip(output_slots, nest.flatten(outputs)):
+          if slot is not None:
+            values[slot] = y
+
+    return [values[slot] for slot in self._output_slots]
+
+
 def _make_node_key(layer_name, node_index):
   return layer_name + '_ib-' + str(node_index)
 
@@ -908,8 +1011,14 @@ def _map_graph_network(inputs, outputs):
   # "depth" is number of layers between output Node and the Node.
   # Nodes are ordered from inputs -> outputs.
   nodes_in_decreasing_depth, layer_indices = _build_map(outputs)
+  # Looking the nodes up in their layer's `_inbound_nodes` would be quadratic
+  # in the number of calls of shared layers.
+  node_indices = {}
+  for layer in layer_indices:
+    for node_index, node in enumerate(layer._inbound_nodes):
+      node_indices[node] = node_index
   network_nodes = {
-      _make_node_key(node.layer.name, node.layer._inbound_nodes.index(node))
+      _make_node_key(node.layer.name, node_indices[node])
       for node in nodes_in_decreasing_depth
   }
 
@@ -1001,11 +1110,11 @@ def _map_graph_network(inputs, outputs):
 
   # Ensure name unicity, which will be crucial for serialization
   # (since serialized nodes refer to layers by their name).
-  all_names = [layer.name for layer in layers]
-  for name in all_names:
-    if all_names.count(name) != 1:
-      raise ValueError('The name "' + name + '" is used ' +
-                       str(all_names.count(name)) + ' times in the model. '
+  name_counts = collections.Counter(layer.name for layer in layers)
+  for name, count in name_counts.items():
+    if count != 1:
+      raise ValueError('The name "' + name + '" is used ' + str(count) +
+                       ' times in the model. '
                        'All layer names should be unique.')
   return network_nodes, nodes_by_depth, layers, layers_by_depth
 
@@ -1043,33 +1152,49 @@ def _build_map(outputs):
 
 def _build_map_helper(tensor, finished_nodes, nodes_in_progress,
                       nodes_in_decreasing_depth, layer_indices):
-  """Recursive helper for `_build_map`."""
-  layer, node_index, _ = tensor._keras_history  # pylint: disable=protected-access
-  node = layer._inbound_nodes[node_index]  # pylint: disable=protected-access
+  """Depth-first search helper for `_build_map`.
 
-  # Don't repeat work for shared subgraphs
-  if node in finished_nodes:
-    return
+  The search keeps an explicit stack instead of recursing, so that models
+  deeper than the Python recursion limit can be built.
+  """
+
+  def visit(tensor):
+    """Returns the node of `tensor` and its inputs if it is not visited yet."""
+    layer, node_index, _ = tensor._keras_history  # pylint: disable=protected-access
+    node = layer._inbound_nodes[node_index]  # pylint: disable=protected-access
+
+    # Don't repeat work for shared subgraphs
+    if node in finished_nodes:
+      return None
 
-  # Prevent cycles.
-  if node in nodes_in_progress:
-    raise ValueError('The tensor ' + str(tensor) + ' at layer "' + layer.name +
-                     '" is part of a cycle.')
-
-  # Store the traversal order for layer sorting.
-  if layer not in layer_indices:
-    layer_indices[layer] = len(layer_indices)
-
-  # Propagate to all previous tensors connected to this node.
-  nodes_in_progress.add(node)
-  if not node.is_input:
-    for tensor in node.keras_inputs:
-      _build_map_helper(tensor, finished_nodes, nodes_in_progress,
-                        nodes_in_decreasing_depth, layer_indices)
-
-  finished_nodes.add(node)
-  nodes_in_progress.remove(node)
-  nodes_in_decreasing_depth.append(node)
+    # Prevent cycles.
+    if node in nodes_in_progress:
+      raise ValueError('The tensor ' + str(tensor) + ' at layer "' +
+                       layer.name + '" is part of a cycle.')
+
+    # Store the traversal order for layer sorting.
+    if layer not in layer_indices:
+      layer_indices[layer] = len(layer_indices)
+
+    nodes_in_progress.add(node)
+    return node, iter(() if node.is_input else node.keras_inputs)
+
+  stack = [visit(tensor)]
+  if stack[0] is None:
+    return
+  while stack:
+    node, inputs = stack[-1]
+    # Propagate to the next previous tensor connected to this node.
+    for tensor in inputs:
+      entry = visit(tensor)
+      if entry is not None:
+        stack.append(entry)
+        break
+    else:
+      stack.pop()
+      finished_nodes.add(node)
+      nodes_in_progress.remove(node)
+      nodes_in_decreasing_depth.append(node)
 
 
 def _map_subgraph_network(inputs, outputs):
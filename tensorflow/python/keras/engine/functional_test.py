@@ -18,6 +18,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import sys
 import warnings
 
 import numpy as np
@@ -1431,6 +1432,40 @@ class NetworkConstructionTest(keras_parameterized.TestCase):
     self.assertEqual('a', net2.layers[0].name)
     self.assertEqual('b', net2.layers[1].name)
 
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def test_execution_plan_reuses_slots(self):
+    inputs = input_layer_lib.Input(shape=(4,))
+    x = inputs
+    for _ in range(10):
+      x = layers.Dense(4)(x)
+    skip = layers.Dense(4)(inputs)
+    outputs = [layers.add([x, skip]), x]
+    model = functional.Functional(inputs, outputs)
+
+    x_val = np.random.random((3, 4)).astype('float32')
+    y, z = model(x_val)
+    plan = model._execution_plan
+    # The chain only ever needs the current activation, the skip connection
+    # and the last hidden layer kept alive, regardless of its depth.
+    self.assertLessEqual(plan._num_slots, 4)
+    self.assertLen(plan._steps, 12)
+
+    expected = x_val
+    for layer in model.layers[1:11]:
+      expected = layer(expected)
+    self.assertAllClose(z, expected)
+    self.assertAllClose(y, expected + model.layers[11](x_val))
+
+  @combinations.generate(combinations.combine(mode=['eager']))
+  def test_execution_plan_rebuilt_when_layers_change(self):
+    model = sequential.Sequential([layers.Dense(2, input_shape=(3,))])
+    model(np.ones((1, 3)))
+    self.assertIsNotNone(model._execution_plan)
+
+    model.add(layers.Dense(5))
+    self.assertIsNone(model._execution_plan)
+    self.assertEqual(model(np.ones((1, 3))).shape, (1, 5))
+
   @combinations.generate(combinations.keras_model_type_combinations())
   def test_dependency_tracking(self):
     model = testing_utils.get_small_mlp(1, 4, input_dim=3)
@@ -1460,6 +1495,34 @@ class NetworkConstructionTest(keras_parameterized.TestCase):
     y = fn(x)
     self.assertEqual(y.shape.as_list(), [10, 1])
 
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def test_model_deeper_than_recursion_limit(self):
+    num_layers = sys.getrecursionlimit() + 10
+    inputs = input_layer_lib.Input(shape=(2,))
+    outputs = inputs
+    for _ in range(num_layers):
+      outputs = layers.ReLU()(outputs)
+    model = training_lib.Model(inputs, outputs)
+    self.assertLen(model.layers, num_layers + 1)
+    self.assertLen(model._nodes_by_depth, num_layers + 1)
+    self.assertAllEqual(
+        self.evaluate(model(array_ops.ones((1, 2)))), [[1., 1.]])
+
+  @combinations.generate(combinations.combine(mode=['graph', 'eager']))
+  def test_shared_layer_called_many_times(self):
+    shared = layers.Dense(2, kernel_initializer='ones')
+    inputs = input_layer_lib.Input(shape=(2,))
+    outputs = inputs
+    for _ in range(50):
+      outputs = shared(outputs)
+    model = training_lib.Model(inputs, outputs)
+    self.assertLen(model.layers, 2)
+    self.assertLen(model._network_nodes, 51)
+    config = model.get_config()
+    self.assertLen(config['layers'][1]['inbound_nodes'], 50)
+    new_model = training_lib.Model.from_config(config)
+    self.assertLen(new_model._network_nodes, 51)
+
 
 class DeferredModeTest(keras_parameterized.TestCase):
 
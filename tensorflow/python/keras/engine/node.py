@@ -106,13 +106,14 @@ class Node(object):
 
     # Set metadata on outputs.
     node_index = len(self.layer._inbound_nodes) - 1
-    for i, tensor in enumerate(nest.flatten(outputs)):
+    flat_outputs = nest.flatten(self.outputs)
+    for i, tensor in enumerate(flat_outputs):
       tensor._keras_history = KerasHistory(
           layer=layer, node_index=node_index, tensor_index=i)
 
     # Cached for performance.
     self.flat_input_ids = [str(id(t)) for t in self._keras_inputs]
-    self.flat_output_ids = [str(id(t)) for t in nest.flatten(self.outputs)]
+    self.flat_output_ids = [str(id(t)) for t in flat_outputs]
 
   @property
   def keras_inputs(self):
@@ -24,6 +24,7 @@ import json
 import os
 import warnings
 
+import numpy as np
 import six
 
 from tensorflow.python.autograph.lang import directives
@@ -39,6 +40,7 @@ from tensorflow.python.framework import errors
 from tensorflow.python.framework import errors_impl
 from tensorflow.python.framework import func_graph
 from tensorflow.python.framework import ops
+from tensorflow.python.framework import smart_cond
 from tensorflow.python.framework import sparse_tensor
 from tensorflow.python.framework import tensor_shape
 from tensorflow.python.keras import backend
@@ -66,6 +68,7 @@ from tensorflow.python.keras.utils.io_utils import ask_to_proceed_with_overwrite
 from tensorflow.python.keras.utils.io_utils import path_to_string
 from tensorflow.python.keras.utils.mode_keys import ModeKeys
 from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import sparse_ops
 from tensorflow.python.ops import summary_ops_v2
@@ -213,7 +216,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
   """
   _TF_MODULE_IGNORED_PROPERTIES = frozenset(
       itertools.chain(('_train_counter', '_test_counter', '_predict_counter',
-                       '_steps_per_execution'),
+                       '_steps_per_execution', '_gradient_accumulators',
+                       '_gradient_accumulation_counter'),
                       base_layer.Layer._TF_MODULE_IGNORED_PROPERTIES))  # pylint: disable=protected-access
 
   def __new__(cls, *args, **kwargs):
@@ -317,6 +321,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
         trackable_utils.saver_with_op_caching(self))
 
     self._steps_per_execution = None
+    self._gradient_accumulation_steps = 1
+    self._gradient_accumulators = None
+    self._gradient_accumulation_counter = None
 
     self._init_batch_counters()
     self._base_model_initialized = True
@@ -488,6 +495,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
               weighted_metrics=None,
               run_eagerly=None,
               steps_per_execution=None,
+              gradient_accumulation_steps=None,
               **kwargs):
     """Configures the model for training.
 
@@ -550,6 +558,17 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           `Callback.on_batch_begin` and `Callback.on_batch_end` methods
           will only be called every `N` batches
           (i.e. before/after each `tf.function` execution).
+        gradient_accumulation_steps: Int. Defaults to 1. The number of batches
+          over which gradients are accumulated before the optimizer is
+          applied. If set to `N`, the default `train_step` sums the gradients
+          of each batch into non-trainable buffers and applies their average
+          every `N` batches, which gives the effective batch size of `N`
+          batches at the memory cost of one. Metrics are still updated at
+          every batch. Gradients accumulated at the end of `fit` are kept and
+          applied together with the ones of the next call to `fit`. Sparse
+          gradients, such as the `tf.IndexedSlices` of an `Embedding` layer,
+          are converted to dense tensors at every batch to be added to their
+          buffers, which is slow for large embeddings.
         **kwargs: Arguments supported for backwards compatibility only.
 
     Raises:
@@ -575,6 +594,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           metrics, weighted_metrics, output_names=self.output_names)
 
       self._configure_steps_per_execution(steps_per_execution or 1)
+      self._configure_gradient_accumulation(gradient_accumulation_steps or 1)
 
       # Initializes attrs that are reset each time `compile` is called.
       self._reset_compile_cache()
@@ -623,6 +643,17 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
         dtype='int64',
         aggregation=variables.VariableAggregationV2.ONLY_FIRST_REPLICA)
 
+  @trackable.no_automatic_dependency_tracking
+  def _configure_gradient_accumulation(self, gradient_accumulation_steps):
+    if gradient_accumulation_steps < 1:
+      raise ValueError('`gradient_accumulation_steps` must be at least 1, got: '
+                       '{}'.format(gradient_accumulation_steps))
+    self._gradient_accumulation_steps = int(gradient_accumulation_steps)
+    # Created the first time `train_step` runs, once the variables to train
+    # are known.
+    self._gradient_accumulators = None
+    self._gradient_accumulation_counter = None
+
   @property
   def _should_compute_mask(self):
     return False
@@ -788,10 +819,92 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       y_pred = self(x, training=True)
       loss = self.compiled_loss(
           y, y_pred, sample_weight, regularization_losses=self.losses)
-    self.optimizer.minimize(loss, self.trainable_variables, tape=tape)
+    if self._gradient_accumulation_steps > 1:
+      self._accumulate_gradients(loss, self.trainable_variables, tape)
+    else:
+      self.optimizer.minimize(loss, self.trainable_variables, tape=tape)
     self.compiled_metrics.update_state(y, y_pred, sample_weight)
     return {m.name: m.result() for m in self.metrics}
 
+  def _accumulate_gradients(self, loss, var_list, tape):
+    """Accumulates the gradients of `loss`, applying them every few steps.
+
+    Must be called in a replica context. Gradients are summed into per-replica
+    buffers and, once every `gradient_accumulation_steps` calls, their average
+    is passed to `optimizer.apply_gradients` and the buffers are reset.
+
+    Args:
+      loss: Loss `Tensor` of the current batch.
+      var_list: List of variables to update.
+      tape: The `tf.GradientTape` that computed `loss`.
+    """
+    # `_compute_gradients` takes care of loss scaling, so that the buffers hold
+    # unscaled gradients.
+    grads_and_vars = [
+        (g, v) for g, v in self.optimizer._compute_gradients(  # pylint: disable=protected-access
+            loss, var_list, tape=tape) if g is not None]
+    if not grads_and_vars:
+      return
+    var_list = [v for _, v in grads_and_vars]
+    accumulators = self._get_gradient_accumulators(var_list)
+    for (grad, _), accumulator in zip(grads_and_vars, accumulators):
+      accumulator.assign_add(ops.convert_to_tensor_v2_with_dispatch(grad))
+    ds_context.get_replica_context().merge_call(
+        self._maybe_apply_accumulated_gradients,
+        args=(var_list, accumulators))
+
+  def _maybe_apply_accumulated_gradients(self, distribution, var_list,
+                                         accumulators):
+    """Applies the accumulated gradients once every few steps."""
+    # Like `LossScaleOptimizer`, the condition is evaluated in a cross-replica
+    # context, as `apply_gradients` calls `merge_call`.
+    steps = self._gradient_accumulation_steps
+    counter = self._gradient_accumulation_counter
+    with ops.control_dependencies([counter.assign_add(1)]):
+      should_apply = math_ops.equal(counter.read_value() % steps, 0)
+
+    def apply_accumulated_gradients():
+      grads = [accumulator / steps for accumulator in accumulators]
+      apply_op = self.optimizer.apply_gradients(zip(grads, var_list))
+      with ops.control_dependencies([apply_op]):
+        return control_flow_ops.group(
+            [accumulator.assign(array_ops.zeros_like(accumulator))
+             for accumulator in accumulators])
+
+    def apply_fn():
+      return distribution.extended.call_for_each_replica(
+          apply_accumulated_gradients)
+
+    return smart_cond.smart_cond(should_apply, apply_fn,
+                                 control_flow_ops.no_op)
+
+  @trackable.no_automatic_dependency_tracking
+  def _get_gradient_accumulators(self, var_list):
+    """Returns the gradient buffers of `var_list`, creating them if needed."""
+    if self._gradient_accumulators is None:
+      self._gradient_accumulators = {}
+      with ops.init_scope():
+        self._gradient_accumulation_counter = variables.Variable(
+            0,
+            dtype='int64',
+            trainable=False,
+            aggregation=variables.VariableAggregationV2.ONLY_FIRST_REPLICA)
+    strategy = ds_context.get_strategy()
+    accumulators = []
+    for var in var_list:
+      key = id(var)
+      if key not in self._gradient_accumulators:
+        # Each replica accumulates the gradients of its own batches. They are
+        # aggregated across replicas by `apply_gradients`.
+        with ops.init_scope(), strategy.extended.colocate_vars_with(var):
+          self._gradient_accumulators[key] = variables.Variable(
+              array_ops.zeros(var.shape, dtype=var.dtype),
+              trainable=False,
+              synchronization=variables.VariableSynchronization.ON_READ,
+              aggregation=variables.VariableAggregation.SUM)
+      accumulators.append(self._gradient_accumulators[key])
+    return accumulators
+
   def make_train_function(self):
     """Creates a function that executes one step of training.
 
@@ -1542,7 +1655,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
               callbacks=None,
               max_queue_size=10,
               workers=1,
-              use_multiprocessing=False):
+              use_multiprocessing=False,
+              preallocate=False,
+              out=None):
     """Generates output predictions for the input samples.
 
     Computation is done in batches. This method is designed for performance in
@@ -1592,6 +1707,17 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             `False`. Note that because this implementation relies on
             multiprocessing, you should not pass non-picklable arguments to
             the generator as they can't be passed easily to children processes.
+        preallocate: Boolean. If `True`, predictions are written batch by batch
+            into NumPy arrays allocated once from the number of samples in
+            `x` (or from the number of steps when `x` is a dataset), instead
+            of being accumulated and concatenated at the end. This halves the
+            peak memory used by the predictions. Only dense outputs are
+            supported.
+        out: Optional NumPy array, e.g. a `np.memmap`, or nested structure of
+            arrays matching the outputs of the model, to write the predictions
+            into. The first dimension of each array must be at least the
+            number of samples predicted. If provided, `preallocate` is
+            ignored and the (possibly truncated) arrays are returned.
 
     See the discussion of `Unpacking behavior for iterator-like inputs` for
     `Model.fit`. Note that Model.predict uses the same interpretation rules as
@@ -1613,7 +1739,121 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     self._check_call_args('predict')
     _disallow_inside_tf_function('predict')
 
+    batches = self._predict_batches(
+        x,
+        batch_size=batch_size,
+        verbose=verbose,
+        steps=steps,
+        callbacks=callbacks,
+        max_queue_size=max_queue_size,
+        workers=workers,
+        use_multiprocessing=use_multiprocessing)
+    if out is not None or preallocate:
+      buffers = None
+      for data_handler, batch_outputs in batches:
+        batch_outputs = tf_utils.to_numpy_or_python_type(batch_outputs)
+        if buffers is None:
+          if out is not None:
+            buffers = nest.map_structure_up_to(batch_outputs, _OutputBuffer,
+                                               out)
+          else:
+            capacity = _predict_buffer_capacity(
+                data_handler, nest.flatten(batch_outputs)[0])
+            buffers = nest.map_structure(
+                lambda _: _OutputBuffer(capacity=capacity), batch_outputs)
+        nest.map_structure_up_to(batch_outputs,
+                                 lambda buf, batch: buf.append(batch), buffers,
+                                 batch_outputs)
+      return nest.map_structure(lambda buf: buf.result(), buffers)
+
     outputs = None
+    for _, batch_outputs in batches:
+      if outputs is None:
+        outputs = nest.map_structure(lambda batch_output: [batch_output],
+                                     batch_outputs)
+      else:
+        nest.map_structure_up_to(
+            batch_outputs,
+            lambda output, batch_output: output.append(batch_output),
+            outputs, batch_outputs)
+    all_outputs = nest.map_structure_up_to(batch_outputs, concat, outputs)
+    return tf_utils.to_numpy_or_python_type(all_outputs)
+
+  def predict_iter(self,
+                   x,
+                   batch_size=None,
+                   verbose=0,
+                   steps=None,
+                   callbacks=None,
+                   max_queue_size=10,
+                   workers=1,
+                   use_multiprocessing=False):
+    """Generates output predictions for the input samples, batch by batch.
+
+    Unlike `Model.predict`, the predictions are not accumulated: each batch of
+    predictions is yielded as soon as it is computed, so inference can run over
+    inputs whose predictions do not fit in memory.
+
+    >>> model = tf.keras.Sequential([tf.keras.layers.Dense(2)])
+    >>> for batch in model.predict_iter(np.ones((10, 3)), batch_size=4):
+    ...   print(batch.shape)
+    (4, 2)
+    (4, 2)
+    (2, 2)
+
+    Args:
+        x: Input samples. See `Model.predict`.
+        batch_size: Integer or `None`. See `Model.predict`.
+        verbose: Verbosity mode, 0 or 1.
+        steps: Total number of steps (batches of samples) before declaring the
+            prediction round finished. See `Model.predict`.
+        callbacks: List of `keras.callbacks.Callback` instances.
+        max_queue_size: Integer. Used for generator or `keras.utils.Sequence`
+            input only. See `Model.predict`.
+        workers: Integer. Used for generator or `keras.utils.Sequence` input
+            only. See `Model.predict`.
+        use_multiprocessing: Boolean. Used for generator or
+            `keras.utils.Sequence` input only. See `Model.predict`.
+
+    Returns:
+        A generator of Numpy array(s) of predictions. Each element holds the
+        predictions of one execution of the predict function, i.e. of one
+        batch, or of `steps_per_execution` batches if the model was compiled
+        with `steps_per_execution > 1`.
+
+    Raises:
+        RuntimeError: If `model.predict_iter` is wrapped in `tf.function`.
+        ValueError: In case of mismatch between the provided
+            input data and the model's expectations.
+    """
+    base_layer.keras_api_gauge.get_cell('predict').set(True)
+    version_utils.disallow_legacy_graph('Model', 'predict_iter')
+    self._check_call_args('predict_iter')
+    _disallow_inside_tf_function('predict_iter')
+
+    batches = self._predict_batches(
+        x,
+        batch_size=batch_size,
+        verbose=verbose,
+        steps=steps,
+        callbacks=callbacks,
+        max_queue_size=max_queue_size,
+        workers=workers,
+        use_multiprocessing=use_multiprocessing)
+    return (tf_utils.to_numpy_or_python_type(batch_outputs)
+            for _, batch_outputs in batches)
+
+  def _predict_batches(self, x, batch_size, verbose, steps, callbacks,
+                       max_queue_size, workers, use_multiprocessing):
+    """Runs the prediction loop shared by `predict` and `predict_iter`.
+
+    The distribution strategy scope is only entered while running the loop
+    itself, so that it is not active in the caller's code between batches.
+
+    Yields:
+      `(data_handler, batch_outputs)` tuples, where `batch_outputs` are the
+      outputs of one execution of `predict_function`.
+    """
     with self.distribute_strategy.scope():
       # Creates a `tf.data.Dataset` and handles batch and epoch iteration.
       dataset_types = (dataset_ops.DatasetV1, dataset_ops.DatasetV2)
@@ -1656,30 +1896,27 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       self.predict_function = self.make_predict_function()
       self._predict_counter.assign(0)
       callbacks.on_predict_begin()
-      batch_outputs = None
+    batch_outputs = None
+    # `on_predict_end` also runs when the consumer stops iterating early.
+    try:
       for _, iterator in data_handler.enumerate_epochs():  # Single epoch.
         with data_handler.catch_stop_iteration():
           for step in data_handler.steps():
-            callbacks.on_predict_batch_begin(step)
-            tmp_batch_outputs = self.predict_function(iterator)
-            if data_handler.should_sync:
-              context.async_wait()
-            batch_outputs = tmp_batch_outputs  # No error, now safe to assign.
-            if outputs is None:
-              outputs = nest.map_structure(lambda batch_output: [batch_output],
-                                           batch_outputs)
-            else:
-              nest.map_structure_up_to(
-                  batch_outputs,
-                  lambda output, batch_output: output.append(batch_output),
-                  outputs, batch_outputs)
-            end_step = step + data_handler.step_increment
-            callbacks.on_predict_batch_end(end_step, {'outputs': batch_outputs})
+            with self.distribute_strategy.scope():
+              callbacks.on_predict_batch_begin(step)
+              tmp_batch_outputs = self.predict_function(iterator)
+              if data_handler.should_sync:
+                context.async_wait()
+              batch_outputs = tmp_batch_outputs  # No error, now safe to assign.
+              end_step = step + data_handler.step_increment
+              callbacks.on_predict_batch_end(end_step,
+                                             {'outputs': batch_outputs})
+            yield data_handler, batch_outputs
       if batch_outputs is None:
         raise ValueError('Expect x to be a non-empty array or dataset.')
-      callbacks.on_predict_end()
-    all_outputs = nest.map_structure_up_to(batch_outputs, concat, outputs)
-    return tf_utils.to_numpy_or_python_type(all_outputs)
+    finally:
+      with self.distribute_strategy.scope():
+        callbacks.on_predict_end()
 
   def reset_metrics(self):
     """Resets the state of all the metrics in the model.
@@ -2031,7 +2268,11 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             can be disabled, so that only the configs of each layer are stored.
             Defaults to `True`. Disabling this will decrease serialization time
             and reduce file size, but it requires that all custom layers/models
-            implement a `get_config()` method.
+            implement a `get_config()` method. Set to `'serving'` to only store
+            the function traces of the model itself, including its serving
+            signature, and the configs of its layers. This has the same
+            requirements, and still allows the model to be served with
+            `tf.saved_model.load`.
 
     Example:
 
@@ -2742,6 +2983,75 @@ def concat(tensors, axis=0):
   return array_ops.concat(tensors, axis=axis)
 
 
+class _OutputBuffer(object):
+  """Writes batches of predictions into a single NumPy array.
+
+  The array is either provided by the user (e.g. a `np.memmap`) or allocated
+  lazily from the first batch, with room for `capacity` samples.
+  """
+
+  def __init__(self, array=None, capacity=None):
+    if array is not None and not hasattr(array, 'shape'):
+      raise ValueError('`out` must be a NumPy array or a nested structure of '
+                       'NumPy arrays, got: {}'.format(array))
+    self._array = array
+    self._user_provided = array is not None
+    self._capacity = capacity
+    self._size = 0
+
+  def append(self, batch):
+    """Copies `batch` after the predictions written so far."""
+    if not isinstance(batch, np.ndarray):
+      raise ValueError('Only dense predictions can be written into '
+                       'preallocated arrays, got: {}'.format(batch))
+    end = self._size + batch.shape[0]
+    if self._array is None:
+      self._array = np.empty((max(self._capacity, end),) + batch.shape[1:],
+                             dtype=batch.dtype)
+    elif self._array.shape[1:] != batch.shape[1:]:
+      raise ValueError(
+          'Predictions of shape {} cannot be written into an array of shape '
+          '{}.'.format(batch.shape, self._array.shape))
+    if end > self._array.shape[0]:
+      if self._user_provided:
+        raise ValueError(
+            'The array passed as `out` is too small: it has room for {} '
+            'samples but at least {} were predicted.'.format(
+                self._array.shape[0], end))
+      # Only happens when the number of samples had to be estimated.
+      grown = np.empty((max(2 * self._array.shape[0], end),) +
+                       self._array.shape[1:], dtype=self._array.dtype)
+      grown[:self._size] = self._array[:self._size]
+      self._array = grown
+    self._array[self._size:end] = batch
+    self._size = end
+
+  def result(self):
+    if self._array.shape[0] == self._size:
+      return self._array
+    return self._array[:self._size]
+
+
+def _predict_buffer_capacity(data_handler, first_batch):
+  """Returns the number of samples to preallocate predictions for."""
+  if not isinstance(first_batch, np.ndarray):
+    raise ValueError('Only dense predictions can be written into '
+                     'preallocated arrays, got: {}'.format(first_batch))
+  samples = data_handler.inferred_samples
+  if samples is not None:
+    return samples
+  steps = data_handler.inferred_steps
+  if steps is None:
+    raise ValueError(
+        'Could not infer the number of samples to preallocate predictions '
+        'for. Pass `steps`, or a dataset with a known cardinality, when '
+        'using `preallocate=True`, or pass the arrays to write into as '
+        '`out`.')
+  # Upper bound when batches are no larger than the first one.
+  steps_in_batch = data_handler.step_increment + 1
+  return first_batch.shape[0] * -(-steps // steps_in_batch)
+
+
 def _is_tpu_multi_host(strategy):
   return (backend.is_tpu_strategy(strategy) and
           strategy.extended.num_hosts > 1)
@@ -45,6 +45,7 @@ from tensorflow.python.keras.engine import input_layer
 from tensorflow.python.keras.engine import sequential
 from tensorflow.python.keras.engine import training as training_module
 from tensorflow.python.keras.engine import training_utils_v1
+from tensorflow.python.keras.mixed_precision import loss_scale_optimizer
 from tensorflow.python.keras.utils import data_utils
 from tensorflow.python.keras.utils import np_utils
 from tensorflow.python.ops import array_ops
@@ -109,6 +110,51 @@ class TrainingTest(keras_parameterized.TestCase):
                                 'Expect x to be a non-empty array or dataset.'):
       model.fit(x=np.array([]), y=np.array([]))
 
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  @parameterized.named_parameters(
+      ('', False, 1),
+      ('_steps_per_execution', False, 3),
+      ('_loss_scale', True, 1),
+  )
+  def test_gradient_accumulation(self, loss_scale, steps_per_execution):
+    x = np.random.random((24, 4)).astype('float32')
+    y = np.random.random((24, 1)).astype('float32')
+
+    def train(batch_size, gradient_accumulation_steps):
+      model = sequential.Sequential([
+          layers_module.Dense(
+              3, kernel_initializer='ones', input_shape=(4,)),
+          layers_module.Dense(1, kernel_initializer='ones')])
+      optimizer = optimizer_v2.gradient_descent.SGD(0.01, momentum=0.9)
+      if loss_scale:
+        optimizer = loss_scale_optimizer.LossScaleOptimizer(optimizer)
+      model.compile(
+          optimizer,
+          'mse',
+          metrics=['mae'],
+          run_eagerly=testing_utils.should_run_eagerly(),
+          steps_per_execution=steps_per_execution,
+          gradient_accumulation_steps=gradient_accumulation_steps)
+      history = model.fit(
+          x, y, batch_size=batch_size, epochs=2, shuffle=False, verbose=0)
+      return model, history
+
+    model, history = train(batch_size=8, gradient_accumulation_steps=1)
+    accumulated_model, accumulated_history = train(
+        batch_size=2, gradient_accumulation_steps=4)
+    self.assertEqual(accumulated_model.optimizer.iterations.numpy(), 6)
+    self.assertAllClose(model.get_weights(), accumulated_model.get_weights())
+    # Metrics are averaged over all the batches of the epoch.
+    self.assertAllClose(history.history['loss'][0],
+                        accumulated_history.history['loss'][0])
+    self.assertAllClose(history.history['mae'][0],
+                        accumulated_history.history['mae'][0])
+
+  def test_gradient_accumulation_invalid_steps(self):
+    model = sequential.Sequential([layers_module.Dense(1)])
+    with self.assertRaisesRegex(ValueError, 'must be at least 1'):
+      model.compile('sgd', 'mse', gradient_accumulation_steps=-1)
+
   @keras_parameterized.run_all_keras_modes
   def test_run_eagerly_setting(self):
     model = sequential.Sequential([layers_module.Dense(1)])
@@ -1689,6 +1735,79 @@ class TrainingTest(keras_parameterized.TestCase):
       self.assertEqual(results_list,
                        [results_dict['mean'], results_dict['sum']])
 
+  def _get_predict_model(self):
+    inputs = layers_module.Input(shape=(3,))
+    outputs = [layers_module.Dense(2)(inputs), layers_module.Dense(1)(inputs)]
+    model = training_module.Model(inputs, outputs)
+    model.compile(run_eagerly=testing_utils.should_run_eagerly())
+    return model
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_iter(self):
+    model = self._get_predict_model()
+    x = np.random.random((10, 3))
+
+    batches = list(model.predict_iter(x, batch_size=4))
+    self.assertLen(batches, 3)
+    self.assertEqual([b[0].shape[0] for b in batches], [4, 4, 2])
+    expected = model.predict(x, batch_size=4)
+    self.assertAllClose(expected[0], np.concatenate([b[0] for b in batches]))
+    self.assertAllClose(expected[1], np.concatenate([b[1] for b in batches]))
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_iter_early_exit_calls_on_predict_end(self):
+
+    class PredictEndCounter(Callback):
+
+      def __init__(self):
+        super(PredictEndCounter, self).__init__()
+        self.predict_end_count = 0
+
+      def on_predict_end(self, logs=None):
+        self.predict_end_count += 1
+
+    model = self._get_predict_model()
+    counter = PredictEndCounter()
+    batches = model.predict_iter(
+        np.random.random((10, 3)), batch_size=4, callbacks=[counter])
+    for _ in batches:
+      break
+    batches.close()
+    self.assertEqual(counter.predict_end_count, 1)
+
+  @parameterized.named_parameters(('arrays', False), ('dataset', True))
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_preallocate(self, use_dataset):
+    model = self._get_predict_model()
+    x = np.random.random((10, 3))
+    expected = model.predict(x, batch_size=4)
+    if use_dataset:
+      x = dataset_ops.Dataset.from_tensor_slices(x).batch(4)
+
+    outputs = model.predict(x, batch_size=None if use_dataset else 4,
+                            preallocate=True)
+    self.assertEqual(outputs[0].shape, (10, 2))
+    self.assertEqual(outputs[1].shape, (10, 1))
+    self.assertAllClose(expected, outputs)
+
+  @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_into_out(self):
+    model = self._get_predict_model()
+    x = np.random.random((10, 3))
+    expected = model.predict(x, batch_size=4)
+    filename = self.create_tempfile().full_path
+    out = [np.memmap(filename, dtype='float32', mode='w+', shape=(10, 2)),
+           np.zeros((10, 1), dtype='float32')]
+
+    outputs = model.predict(x, batch_size=4, out=out)
+    self.assertIs(outputs[0], out[0])
+    self.assertIs(outputs[1], out[1])
+    self.assertAllClose(expected, out)
+
+    with self.assertRaisesRegex(ValueError, 'too small'):
+      model.predict(x, batch_size=4,
+                    out=[np.zeros((5, 2)), np.zeros((5, 1))])
+
 
 class TestExceptionsAndWarnings(keras_parameterized.TestCase):
 
@@ -37,6 +37,7 @@ from tensorflow.python.keras.layers.preprocessing.image_preprocessing import Ran
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomHeight
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomRotation
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomTranslation
+from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomTransforms
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomWidth
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import RandomZoom
 from tensorflow.python.keras.layers.preprocessing.image_preprocessing import Resizing
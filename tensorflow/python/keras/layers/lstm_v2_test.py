@@ -89,6 +89,36 @@ class LSTMV2Test(keras_parameterized.TestCase):
     layer = rnn.LSTM(1, recurrent_activation=nn.sigmoid)
     self.assertTrue(layer._could_use_gpu_kernel)
 
+  @parameterized.named_parameters(
+      # test_name, use_mask, go_backwards
+      ('normal', False, False),
+      ('masked', True, False),
+      ('go_backwards', False, True),
+  )
+  def test_unrolled_kernel(self, use_mask, go_backwards):
+    timesteps = 4
+    input_dim = 3
+    units = 5
+    x = np.random.random((6, timesteps, input_dim))
+    if use_mask:
+      x[:3, 2:] = 0.
+
+    def build_model(unroll):
+      inputs = keras.layers.Input(shape=(timesteps, input_dim))
+      masked = keras.layers.Masking()(inputs) if use_mask else inputs
+      layer = rnn.LSTM(
+          units, return_sequences=True, unroll=unroll,
+          go_backwards=go_backwards)
+      return keras.models.Model(inputs, layer(masked)), layer
+
+    model, _ = build_model(unroll=False)
+    y_ref = model.predict(x)
+
+    unrolled_model, unrolled_layer = build_model(unroll=True)
+    self.assertTrue(unrolled_layer._could_use_unrolled_kernel)
+    unrolled_model.set_weights(model.get_weights())
+    self.assertAllClose(unrolled_model.predict(x), y_ref, atol=1e-5)
+
   def test_static_shape_inference_LSTM(self):
     # Github issue: 15165
     timesteps = 3
@@ -35,8 +35,11 @@ from tensorflow.python.keras.layers import core
 from tensorflow.python.keras.layers import einsum_dense
 from tensorflow.python.keras.utils import tf_utils
 from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
+from tensorflow.python.ops import custom_gradient
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import special_math_ops
+from tensorflow.python.ops import tensor_array_ops
 from tensorflow.python.platform import tf_logging as logging
 from tensorflow.python.util.tf_export import keras_export
 
@@ -123,6 +126,109 @@ def _get_output_shape(output_rank, known_last_dims):
   return [None] * (output_rank - len(known_last_dims)) + list(known_last_dims)
 
 
+def _attend_to_key_chunks(query, key, value, attention_bias, chunk_size):
+  """Computes softmax attention for a query chunk, one key chunk at a time.
+
+  The softmax is computed online: a running maximum and sum of the
+  exponentiated scores are kept for each query, and the partial outputs are
+  rescaled whenever the maximum changes, so that only a
+  `[B, N, T, chunk_size]` block of scores is materialized at a time.
+
+  Args:
+    query: Scaled query `Tensor` of shape `[B, N, T, key_dim]`.
+    key: Key `Tensor` of shape `[B, N, S, key_dim]`.
+    value: Value `Tensor` of shape `[B, N, S, value_dim]`.
+    attention_bias: Optional `Tensor` broadcastable to `[B, N, T, S]`, added to
+      the attention scores.
+    chunk_size: Number of keys processed at a time.
+
+  Returns:
+    The attention output, of shape `[B, N, T, value_dim]`.
+  """
+  key_length = array_ops.shape(key)[2]
+  query_shape = array_ops.shape(query)
+  max_shape = array_ops.concat([query_shape[:3], [1]], axis=0)
+  output_shape = array_ops.concat(
+      [query_shape[:3], array_ops.shape(value)[3:]], axis=0)
+
+  def body(start, running_max, running_sum, output):
+    key_chunk = key[:, :, start:start + chunk_size]
+    value_chunk = value[:, :, start:start + chunk_size]
+    scores = math_ops.matmul(query, key_chunk, transpose_b=True)
+    if attention_bias is not None:
+      scores += attention_bias[..., start:start + chunk_size]
+    new_max = math_ops.maximum(
+        running_max, math_ops.reduce_max(scores, axis=-1, keepdims=True))
+    probs = math_ops.exp(scores - new_max)
+    correction = math_ops.exp(running_max - new_max)
+    running_sum = running_sum * correction + math_ops.reduce_sum(
+        probs, axis=-1, keepdims=True)
+    output = output * correction + math_ops.matmul(probs, value_chunk)
+    return start + chunk_size, new_max, running_sum, output
+
+  _, _, running_sum, output = control_flow_ops.while_loop(
+      lambda start, *_: start < key_length,
+      body,
+      [0,
+       array_ops.fill(max_shape, math_ops.cast(-np.inf, query.dtype)),
+       array_ops.zeros(max_shape, dtype=query.dtype),
+       array_ops.zeros(output_shape, dtype=query.dtype)])
+  return output / running_sum
+
+
+def _chunked_attention(query, key, value, attention_bias, chunk_size):
+  """Computes softmax attention over chunks of queries and keys.
+
+  Each chunk of queries attends to the keys with `_attend_to_key_chunks`, whose
+  intermediate values are recomputed on the backward pass instead of being
+  kept in memory.
+
+  Args:
+    query: Scaled query `Tensor` of shape `[B, T, N, key_dim]`.
+    key: Key `Tensor` of shape `[B, S, N, key_dim]`.
+    value: Value `Tensor` of shape `[B, S, N, value_dim]`.
+    attention_bias: Optional `Tensor` broadcastable to `[B, N, T, S]`, added to
+      the attention scores.
+    chunk_size: Number of queries and keys processed at a time.
+
+  Returns:
+    The attention output, of shape `[B, T, N, value_dim]`.
+  """
+  # Move the heads before the sequence axis: [B, N, T, H].
+  query = array_ops.transpose(query, [0, 2, 1, 3])
+  key = array_ops.transpose(key, [0, 2, 1, 3])
+  value = array_ops.transpose(value, [0, 2, 1, 3])
+  query_length = array_ops.shape(query)[2]
+  slice_bias = (
+      attention_bias is not None and attention_bias.shape[-2] != 1)
+
+  def body(start, outputs):
+    query_chunk = query[:, :, start:start + chunk_size]
+    bias_chunk = attention_bias
+    if slice_bias:
+      bias_chunk = attention_bias[..., start:start + chunk_size, :]
+
+    def attend(query_chunk, key, value):
+      return _attend_to_key_chunks(query_chunk, key, value, bias_chunk,
+                                   chunk_size)
+
+    output = custom_gradient.recompute_grad(attend)(query_chunk, key, value)
+    # `outputs` is concatenated along the query axis, which must come first.
+    outputs = outputs.write(
+        start // chunk_size, array_ops.transpose(output, [2, 0, 1, 3]))
+    return start + chunk_size, outputs
+
+  outputs = tensor_array_ops.TensorArray(
+      query.dtype, size=0, dynamic_size=True, infer_shape=False)
+  _, outputs = control_flow_ops.while_loop(
+      lambda start, _: start < query_length, body, [0, outputs])
+  # [T, B, N, H] -> [B, T, N, H]
+  output = array_ops.transpose(outputs.concat(), [1, 0, 2, 3])
+  output.set_shape(query.shape[:1].concatenate(query.shape[2:3]).concatenate(
+      query.shape[1:2]).concatenate(value.shape[3:]))
+  return output
+
+
 @keras_export("keras.layers.MultiHeadAttention")
 class MultiHeadAttention(Layer):
   """MultiHeadAttention layer.
@@ -186,6 +292,13 @@ class MultiHeadAttention(Layer):
     activity_regularizer: Regularizer for dense layer activity.
     kernel_constraint: Constraint for dense layer kernels.
     bias_constraint: Constraint for dense layer kernels.
+    chunk_size: Optional integer. If set, attention is computed over chunks of
+      `chunk_size` queries and keys with an online softmax, so that only a
+      `chunk_size` by `chunk_size` block of attention scores per head is kept
+      in memory, and recomputed during backpropagation. The output is the same
+      up to floating point rounding. Only supported for inputs of shape
+      `[B, T, dim]`. Chunking is not applied when `return_attention_scores` is
+      True or when dropout is active, as both require the full scores.
 
   Call arguments:
     query: Query `Tensor` of shape `[B, T, dim]`.
@@ -229,6 +342,7 @@ class MultiHeadAttention(Layer):
                activity_regularizer=None,
                kernel_constraint=None,
                bias_constraint=None,
+               chunk_size=None,
                **kwargs):
     super(MultiHeadAttention, self).__init__(**kwargs)
     self._num_heads = num_heads
@@ -248,6 +362,10 @@ class MultiHeadAttention(Layer):
       self._attention_axes = (attention_axes,)
     else:
       self._attention_axes = attention_axes
+    if chunk_size is not None and chunk_size < 1:
+      raise ValueError("`chunk_size` must be a positive integer, got: "
+                       "{}".format(chunk_size))
+    self._chunk_size = chunk_size
     self._built_from_signature = False
     self._query_shape, self._key_shape, self._value_shape = None, None, None
 
@@ -281,6 +399,8 @@ class MultiHeadAttention(Layer):
             constraints.serialize(self._kernel_constraint),
         "bias_constraint":
             constraints.serialize(self._bias_constraint),
+        "chunk_size":
+            self._chunk_size,
         "query_shape": self._query_shape,
         "key_shape": self._key_shape,
         "value_shape": self._value_shape,
@@ -413,6 +533,9 @@ class MultiHeadAttention(Layer):
         range(attn_scores_rank - len(self._attention_axes), attn_scores_rank))
     self._softmax = advanced_activations.Softmax(axis=norm_axes)
     self._dropout_layer = core.Dropout(rate=self._dropout)
+    if self._chunk_size is not None and rank != 4:
+      raise ValueError("`chunk_size` is only supported for inputs of shape "
+                       "[B, T, dim], got inputs of rank {}".format(rank - 1))
 
   def _masked_softmax(self, attention_scores, attention_mask=None):
     # Normalize the attention scores to probabilities.
@@ -473,6 +596,30 @@ class MultiHeadAttention(Layer):
                                                attention_scores_dropout, value)
     return attention_output, attention_scores
 
+  def _compute_chunked_attention(self, query, key, value, attention_mask=None):
+    """Applies dot-product attention over chunks of queries and keys.
+
+    Args:
+      query: Projected query `Tensor` of shape `[B, T, N, key_dim]`.
+      key: Projected key `Tensor` of shape `[B, S, N, key_dim]`.
+      value: Projected value `Tensor` of shape `[B, S, N, value_dim]`.
+      attention_mask: a boolean mask of shape `[B, T, S]`, that prevents
+        attention to certain positions.
+
+    Returns:
+      attention_output: Multi-headed outputs of attention computation.
+    """
+    query = math_ops.multiply(query, 1.0 / math.sqrt(float(self._key_dim)))
+    attention_bias = None
+    if attention_mask is not None:
+      # Same broadcasting and masking value as `_masked_softmax`.
+      for _ in range(4 - len(attention_mask.shape)):
+        attention_mask = array_ops.expand_dims(attention_mask, axis=-3)
+      attention_bias = (1.0 - math_ops.cast(attention_mask, query.dtype)) * (
+          advanced_activations._large_compatible_negative(query.dtype))  # pylint: disable=protected-access
+    return _chunked_attention(query, key, value, attention_bias,
+                              self._chunk_size)
+
   def call(self,
            query,
            value,
@@ -496,6 +643,13 @@ class MultiHeadAttention(Layer):
     # `value` = [B, S, N, H]
     value = self._value_dense(value)
 
+    if (self._chunk_size is not None and not return_attention_scores and
+        (not self._dropout or training is False)):
+      attention_output = self._compute_chunked_attention(
+          query, key, value, attention_mask)
+      attention_output = self._output_dense(attention_output)
+      return attention_output
+
     attention_output, attention_scores = self._compute_attention(
         query, key, value, attention_mask, training)
     attention_output = self._output_dense(attention_output)
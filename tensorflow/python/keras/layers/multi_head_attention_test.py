@@ -23,6 +23,9 @@ from absl.testing import parameterized
 import numpy as np
 
 from tensorflow.python import keras
+from tensorflow.python.eager import backprop
+from tensorflow.python.framework import constant_op
+from tensorflow.python.keras import combinations
 from tensorflow.python.keras import keras_parameterized
 from tensorflow.python.keras.layers import multi_head_attention
 from tensorflow.python.platform import test
@@ -241,6 +244,55 @@ class MultiHeadAttentionTest(keras_parameterized.TestCase):
         keras.backend.eval(train_out),
         keras.backend.eval(test_out))
 
+  @parameterized.named_parameters(
+      ("divisible", 4, False),
+      ("not_divisible", 3, False),
+      ("larger_than_sequence", 16, False),
+      ("masked", 3, True),
+  )
+  def test_chunked_attention(self, chunk_size, use_mask):
+    """Test that chunked attention matches the full computation."""
+    test_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=4)
+    chunked_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=4, chunk_size=chunk_size)
+    query = keras.Input(shape=(8, 6))
+    value = keras.Input(shape=(10, 6))
+    mask_tensor = keras.Input(shape=(8, 10)) if use_mask else None
+    inputs = [query, value] + ([mask_tensor] if use_mask else [])
+    model = keras.Model(
+        inputs, test_layer(query, value, attention_mask=mask_tensor))
+    chunked_model = keras.Model(
+        inputs, chunked_layer(query, value, attention_mask=mask_tensor))
+    chunked_model.set_weights(model.get_weights())
+
+    batch_size = 3
+    data = [10 * np.random.random_sample((batch_size, 8, 6)),
+            10 * np.random.random_sample((batch_size, 10, 6))]
+    if use_mask:
+      mask_data = np.random.randint(2, size=(batch_size, 8, 10))
+      # Every query attends to at least one key.
+      mask_data[:, :, 0] = 1
+      data.append(mask_data)
+    self.assertAllClose(
+        model.predict(data), chunked_model.predict(data), atol=1e-5)
+
+  def test_chunked_attention_with_scores(self):
+    test_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=2, chunk_size=2)
+    query = keras.Input(shape=(4, 8))
+    value = keras.Input(shape=(2, 8))
+    output, scores = test_layer(query, value, return_attention_scores=True)
+    self.assertEqual(output.shape.as_list(), [None, 4, 8])
+    self.assertEqual(scores.shape.as_list(), [None, 2, 4, 2])
+
+  def test_chunked_attention_high_dim(self):
+    test_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=2, chunk_size=2)
+    query = keras.Input(shape=(3, 4, 8))
+    with self.assertRaisesRegex(ValueError, "only supported for inputs"):
+      test_layer(query, query)
+
 
 class SubclassAttention(multi_head_attention.MultiHeadAttention):
 
@@ -334,5 +386,33 @@ class KerasModelSavingTest(keras_parameterized.TestCase):
         not_intialized_layer.get_config())
 
 
+class ChunkedAttentionGradientTest(keras_parameterized.TestCase):
+
+  @combinations.generate(combinations.combine(mode=["eager"]))
+  def test_gradients(self):
+    test_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=4)
+    chunked_layer = multi_head_attention.MultiHeadAttention(
+        num_heads=2, key_dim=4, chunk_size=3)
+    query = constant_op.constant(np.random.random_sample((2, 7, 6)), "float32")
+    value = constant_op.constant(np.random.random_sample((2, 5, 6)), "float32")
+    mask_data = np.random.randint(2, size=(2, 7, 5))
+    mask_data[:, :, 0] = 1
+    mask = constant_op.constant(mask_data, "int32")
+    test_layer(query, value, attention_mask=mask)
+    chunked_layer(query, value, attention_mask=mask)
+    chunked_layer.set_weights(test_layer.get_weights())
+
+    def gradients(layer):
+      with backprop.GradientTape() as tape:
+        tape.watch([query, value])
+        output = layer(query, value, attention_mask=mask)
+      return tape.gradient(output,
+                           [query, value] + layer.trainable_variables)
+
+    self.assertAllClose(gradients(test_layer), gradients(chunked_layer),
+                        atol=1e-5)
+
+
 if __name__ == "__main__":
   test.main()
@@ -135,6 +135,99 @@ def get_bucket_boundaries(summary, num_bins):
   return compress(summary, 1.0 / num_bins)[:-1, 0]
 
 
+def sketch_capacities(k, num_levels):
+  """Returns the capacity of each level of a quantile sketch.
+
+  The top level holds up to `k` items, and each level below holds `2/3` as many
+  items as the level above it (but at least 2).
+
+  Args:
+      k: The capacity of the top level of the sketch.
+      num_levels: The number of levels of the sketch.
+
+  Returns:
+      A 1-D `np.ndarray` holding the capacity of each level, lowest first.
+  """
+  depths = np.arange(num_levels - 1, -1, -1)
+  return np.maximum(2, np.ceil(k * (2. / 3.)**depths)).astype(np.int64)
+
+
+def compact_sketch(levels, k, random_state):
+  """Compacts a KLL quantile sketch until it fits within its capacity.
+
+  A sketch is a list of 1-D `np.ndarray`s, where each item stored at level `h`
+  stands for `2**h` items of the data. While the sketch holds more items than
+  its total capacity, the lowest level over capacity is compacted: its items
+  are sorted, and every other item (starting from a random offset) is promoted
+  to the next level while the others are discarded. With a top level capacity
+  of `k`, the rank of any value in the sketch is within `O(n / k)` of its rank
+  in the `n` summarized items with high probability, and the sketch holds
+  `O(k)` items.
+
+  Args:
+      levels: The list of levels of the sketch, updated in place.
+      k: The capacity of the top level of the sketch.
+      random_state: `np.random.RandomState` used to pick compaction offsets.
+
+  Returns:
+      The compacted list of levels.
+  """
+  while True:
+    sizes = np.array([level.size for level in levels])
+    capacities = sketch_capacities(k, len(levels))
+    if sizes.sum() <= capacities.sum():
+      return levels
+    height = int(np.argmax(sizes > capacities))
+    if height == len(levels) - 1:
+      levels.append(np.zeros((0,), dtype=levels[height].dtype))
+    items = np.sort(levels[height])
+    # An odd item out stays at its level.
+    num_kept = items.size % 2
+    offset = num_kept + random_state.randint(2)
+    levels[height + 1] = np.concatenate((levels[height + 1], items[offset::2]))
+    levels[height] = items[:num_kept]
+
+
+def merge_sketches(prev_levels, next_levels, k, random_state):
+  """Merges two KLL quantile sketches of distinct data.
+
+  Args:
+      prev_levels: Sketch to be merged with `next_levels`.
+      next_levels: Sketch to be merged with `prev_levels`.
+      k: The capacity of the top level of the sketch.
+      random_state: `np.random.RandomState` used to pick compaction offsets.
+
+  Returns:
+      The merged (and compacted) sketch.
+  """
+  num_levels = max(len(prev_levels), len(next_levels))
+  empty = np.zeros((0,))
+  merged = [
+      np.concatenate((prev_levels[h] if h < len(prev_levels) else empty,
+                      next_levels[h] if h < len(next_levels) else empty))
+      for h in range(num_levels)
+  ]
+  return compact_sketch(merged, k, random_state)
+
+
+def sketch_to_summary(levels):
+  """Converts a KLL quantile sketch into a summary.
+
+  Args:
+      levels: The list of levels of the sketch.
+
+  Returns:
+      A 2-D `np.ndarray` summary of the sketch, sorted by value. First column
+      is the values, the second is the weights (counts).
+  """
+  values = np.concatenate(levels)
+  weights = np.concatenate(
+      [np.full((level.size,), 2.**h) for h, level in enumerate(levels)])
+  order = values.argsort()
+  return np.hstack((np.expand_dims(values[order], 1),
+                    np.expand_dims(weights[order], 1)))
+
+
 @keras_export("keras.layers.experimental.preprocessing.Discretization")
 class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
   """Buckets data into discrete ranges.
@@ -159,6 +252,11 @@ class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
       0.01). Higher values of epsilon increase the quantile approximation, and
       hence result in more unequal buckets, but could improve performance
       and resource consumption.
+    use_quantile_sketch: If True, `adapt` summarizes the data with a mergeable
+      KLL quantile sketch of `O(1 / epsilon)` values. The rank of each computed
+      bin boundary is then within about `epsilon * n` of its target for `n`
+      adapted values with high probability, however many batches the data is
+      split into. Defaults to False.
 
   Examples:
 
@@ -185,11 +283,15 @@ class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
   def __init__(self,
                bins,
                epsilon=0.01,
+               use_quantile_sketch=False,
                **kwargs):
-    super(Discretization, self).__init__(
-        combiner=Discretization.DiscretizingCombiner(
-            epsilon, bins if isinstance(bins, int) else 1),
-        **kwargs)
+    if use_quantile_sketch:
+      combiner = Discretization.QuantileSketchCombiner(
+          epsilon, bins if isinstance(bins, int) else 1)
+    else:
+      combiner = Discretization.DiscretizingCombiner(
+          epsilon, bins if isinstance(bins, int) else 1)
+    super(Discretization, self).__init__(combiner=combiner, **kwargs)
     base_preprocessing_layer.keras_kpl_gauge.get_cell(
         "Discretization").set(True)
     if bins is not None and not isinstance(bins, int):
@@ -199,6 +301,7 @@ class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
     # Need this to return correct config
     self.input_bins = bins
     self.epsilon = epsilon
+    self.use_quantile_sketch = use_quantile_sketch
 
   def build(self, input_shape):
     self.bins = self._add_state_variable(
@@ -213,6 +316,7 @@ class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
         "bins": None if self.input_bins is None else (
             K.get_value(self.input_bins)),
         "epsilon": self.epsilon,
+        "use_quantile_sketch": self.use_quantile_sketch,
     }
     base_config = super(Discretization, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -346,3 +450,75 @@ class Discretization(base_preprocessing_layer.CombinerPreprocessingLayer):
     def _create_accumulator(self, summaries):
       """Represent the accumulator as one or more summaries of the dataset."""
       return collections.namedtuple("Accumulator", ["summaries"])(summaries)
+
+  class QuantileSketchCombiner(Combiner):
+    """Streaming quantile sketch combiner for the Discretization layer.
+
+    Its accumulator is a namedtuple('levels'), holding the levels of a KLL
+    quantile sketch of the data (see `compact_sketch`). Each batch is added to
+    the lowest level and compacted with vectorized sorts, and accumulators are
+    merged level by level, so the result does not depend on how the data is
+    batched or sharded.
+
+    Attributes:
+      epsilon: Error tolerance.
+      num_bins: The desired number of buckets.
+    """
+
+    def __init__(self, epsilon, num_bins, seed=None):
+      self.epsilon = epsilon
+      self.num_bins = num_bins
+      self._k = int(np.ceil(2. / epsilon))
+      self._random_state = np.random.RandomState(seed)
+
+    def compute(self, values, accumulator=None):
+      """Compute a step in this computation, returning a new accumulator."""
+      if isinstance(values, sparse_tensor.SparseTensor):
+        values = values.values
+      if tf_utils.is_ragged(values):
+        values = values.flat_values
+      levels = [np.reshape(values, newshape=(-1,)).astype(np.float64)]
+      if accumulator is None:
+        levels = compact_sketch(levels, self._k, self._random_state)
+      else:
+        levels = merge_sketches(accumulator.levels, levels, self._k,
+                                self._random_state)
+      return self._create_accumulator(levels)
+
+    def merge(self, accumulators):
+      """Merge several accumulators to a single accumulator."""
+      merged = accumulators[0].levels
+      for accumulator in accumulators[1:]:
+        merged = merge_sketches(merged, accumulator.levels, self._k,
+                                self._random_state)
+      return self._create_accumulator(merged)
+
+    def extract(self, accumulator):
+      """Convert an accumulator into a dict of output values."""
+      summary = sketch_to_summary(accumulator.levels)
+      return {
+          _BINS_NAME:
+              np.append(get_bucket_boundaries(summary, self.num_bins),
+                        [np.Inf])
+      }
+
+    def restore(self, output):
+      """Create an accumulator based on 'output'."""
+      raise NotImplementedError(
+          "Discretization does not restore or support streaming updates.")
+
+    def serialize(self, accumulator):
+      """Serialize an accumulator for a remote call."""
+      output_dict = {"levels": [level.tolist() for level in accumulator.levels]}
+      return compat.as_bytes(json.dumps(output_dict))
+
+    def deserialize(self, encoded_accumulator):
+      """Deserialize an accumulator received from 'serialize()'."""
+      value_dict = json.loads(compat.as_text(encoded_accumulator))
+      return self._create_accumulator([
+          np.array(level, dtype=np.float64) for level in value_dict["levels"]
+      ])
+
+    def _create_accumulator(self, levels):
+      """Represent the accumulator as the levels of a quantile sketch."""
+      return collections.namedtuple("Accumulator", ["levels"])(levels)
@@ -242,5 +242,46 @@ class DiscretizationTest(keras_parameterized.TestCase,
                                                                   num_bins)
     self.validate_accumulator_extract(combiner, data, expected)
 
+  def test_quantile_sketch_combiner_computation(self):
+    combiner = discretization.Discretization.QuantileSketchCombiner(
+        epsilon=0.01, num_bins=5, seed=0)
+    self.validate_accumulator_extract(
+        combiner, np.array([[1.], [2.], [3.], [4.], [5.]]),
+        {"bins": np.array([1., 2., 3., 4., np.Inf])})
+
+  def test_quantile_sketch_accuracy(self):
+    epsilon = 0.01
+    num_values = 100000
+    combiner = discretization.Discretization.QuantileSketchCombiner(
+        epsilon=epsilon, num_bins=4, seed=0)
+    data = np.random.RandomState(0).permutation(num_values).astype(np.float32)
+    shards = []
+    for shard in np.split(data, 2):
+      accumulator = None
+      for batch in np.split(shard, 100):
+        accumulator = combiner.compute(batch, accumulator)
+      shards.append(
+          combiner.deserialize(combiner.serialize(accumulator)))
+    merged = combiner.merge(shards)
+
+    self.assertLess(sum(level.size for level in merged.levels), 1000)
+    bins = combiner.extract(merged)["bins"]
+    self.assertAllClose([25000., 50000., 75000.], bins[:-1],
+                        atol=epsilon * num_values)
+
+  def test_layer_computation_with_quantile_sketch(self):
+    adapt_data = dataset_ops.Dataset.from_tensor_slices(
+        np.arange(300.)).batch(10)
+    layer = get_layer_class()(bins=3, epsilon=0.01, use_quantile_sketch=True)
+    layer.adapt(adapt_data)
+    self.assertTrue(layer.get_config()["use_quantile_sketch"])
+
+    input_data = keras.Input(shape=())
+    output = layer(input_data)
+    model = keras.Model(input_data, output)
+    model._run_eagerly = testing_utils.should_run_eagerly()
+    output_data = model.predict(np.array([0., 150., 299.]))
+    self.assertAllEqual([0, 1, 2], output_data)
+
 if __name__ == "__main__":
   test.main()
@@ -31,12 +31,14 @@ from tensorflow.python.keras.engine import base_preprocessing_layer
 from tensorflow.python.keras.engine.base_preprocessing_layer import PreprocessingLayer
 from tensorflow.python.keras.engine.input_spec import InputSpec
 from tensorflow.python.keras.utils import control_flow_util
+from tensorflow.python.keras.utils import generic_utils
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import check_ops
 from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import gen_image_ops
 from tensorflow.python.ops import image_ops
 from tensorflow.python.ops import math_ops
+from tensorflow.python.ops import random_ops
 from tensorflow.python.ops import stateful_random_ops
 from tensorflow.python.ops import stateless_random_ops
 from tensorflow.python.util.tf_export import keras_export
@@ -536,27 +538,11 @@ class RandomTranslation(PreprocessingLayer):
       """Translated inputs with random ops."""
       inputs_shape = array_ops.shape(inputs)
       batch_size = inputs_shape[0]
-      h_axis, w_axis = H_AXIS, W_AXIS
-      img_hd = math_ops.cast(inputs_shape[h_axis], dtypes.float32)
-      img_wd = math_ops.cast(inputs_shape[w_axis], dtypes.float32)
-      height_translate = self._rng.uniform(
-          shape=[batch_size, 1],
-          minval=self.height_lower,
-          maxval=self.height_upper,
-          dtype=dtypes.float32)
-      height_translate = height_translate * img_hd
-      width_translate = self._rng.uniform(
-          shape=[batch_size, 1],
-          minval=self.width_lower,
-          maxval=self.width_upper,
-          dtype=dtypes.float32)
-      width_translate = width_translate * img_wd
-      translations = math_ops.cast(
-          array_ops.concat([width_translate, height_translate], axis=1),
-          dtype=dtypes.float32)
+      img_hd = math_ops.cast(inputs_shape[H_AXIS], dtypes.float32)
+      img_wd = math_ops.cast(inputs_shape[W_AXIS], dtypes.float32)
       return transform(
           inputs,
-          get_translation_matrix(translations),
+          self._random_transforms(batch_size, img_hd, img_wd),
           interpolation=self.interpolation,
           fill_mode=self.fill_mode,
           fill_value=self.fill_value)
@@ -566,6 +552,25 @@ class RandomTranslation(PreprocessingLayer):
     output.set_shape(inputs.shape)
     return output
 
+  def _random_transforms(self, batch_size, img_hd, img_wd):
+    """Returns a batch of random translation transforms."""
+    height_translate = self._rng.uniform(
+        shape=[batch_size, 1],
+        minval=self.height_lower,
+        maxval=self.height_upper,
+        dtype=dtypes.float32)
+    height_translate = height_translate * img_hd
+    width_translate = self._rng.uniform(
+        shape=[batch_size, 1],
+        minval=self.width_lower,
+        maxval=self.width_upper,
+        dtype=dtypes.float32)
+    width_translate = width_translate * img_wd
+    translations = math_ops.cast(
+        array_ops.concat([width_translate, height_translate], axis=1),
+        dtype=dtypes.float32)
+    return get_translation_matrix(translations)
+
   def compute_output_shape(self, input_shape):
     return input_shape
 
@@ -827,13 +832,9 @@ class RandomRotation(PreprocessingLayer):
       batch_size = inputs_shape[0]
       img_hd = math_ops.cast(inputs_shape[H_AXIS], dtypes.float32)
       img_wd = math_ops.cast(inputs_shape[W_AXIS], dtypes.float32)
-      min_angle = self.lower * 2. * np.pi
-      max_angle = self.upper * 2. * np.pi
-      angles = self._rng.uniform(
-          shape=[batch_size], minval=min_angle, maxval=max_angle)
       return transform(
           inputs,
-          get_rotation_matrix(angles, img_hd, img_wd),
+          self._random_transforms(batch_size, img_hd, img_wd),
           fill_mode=self.fill_mode,
           fill_value=self.fill_value,
           interpolation=self.interpolation)
@@ -843,6 +844,14 @@ class RandomRotation(PreprocessingLayer):
     output.set_shape(inputs.shape)
     return output
 
+  def _random_transforms(self, batch_size, img_hd, img_wd):
+    """Returns a batch of random rotation transforms."""
+    min_angle = self.lower * 2. * np.pi
+    max_angle = self.upper * 2. * np.pi
+    angles = self._rng.uniform(
+        shape=[batch_size], minval=min_angle, maxval=max_angle)
+    return get_rotation_matrix(angles, img_hd, img_wd)
+
   def compute_output_shape(self, input_shape):
     return input_shape
 
@@ -962,23 +971,9 @@ class RandomZoom(PreprocessingLayer):
       batch_size = inputs_shape[0]
       img_hd = math_ops.cast(inputs_shape[H_AXIS], dtypes.float32)
       img_wd = math_ops.cast(inputs_shape[W_AXIS], dtypes.float32)
-      height_zoom = self._rng.uniform(
-          shape=[batch_size, 1],
-          minval=1. + self.height_lower,
-          maxval=1. + self.height_upper)
-      if self.width_factor is not None:
-        width_zoom = self._rng.uniform(
-            shape=[batch_size, 1],
-            minval=1. + self.width_lower,
-            maxval=1. + self.width_upper)
-      else:
-        width_zoom = height_zoom
-      zooms = math_ops.cast(
-          array_ops.concat([width_zoom, height_zoom], axis=1),
-          dtype=dtypes.float32)
       return transform(
           inputs,
-          get_zoom_matrix(zooms, img_hd, img_wd),
+          self._random_transforms(batch_size, img_hd, img_wd),
           fill_mode=self.fill_mode,
           fill_value=self.fill_value,
           interpolation=self.interpolation)
@@ -988,6 +983,24 @@ class RandomZoom(PreprocessingLayer):
     output.set_shape(inputs.shape)
     return output
 
+  def _random_transforms(self, batch_size, img_hd, img_wd):
+    """Returns a batch of random zoom transforms."""
+    height_zoom = self._rng.uniform(
+        shape=[batch_size, 1],
+        minval=1. + self.height_lower,
+        maxval=1. + self.height_upper)
+    if self.width_factor is not None:
+      width_zoom = self._rng.uniform(
+          shape=[batch_size, 1],
+          minval=1. + self.width_lower,
+          maxval=1. + self.width_upper)
+    else:
+      width_zoom = height_zoom
+    zooms = math_ops.cast(
+        array_ops.concat([width_zoom, height_zoom], axis=1),
+        dtype=dtypes.float32)
+    return get_zoom_matrix(zooms, img_hd, img_wd)
+
   def compute_output_shape(self, input_shape):
     return input_shape
 
@@ -1045,12 +1058,207 @@ def get_zoom_matrix(zooms, image_height, image_width, name=None):
         axis=1)
 
 
+def compose_transforms(transforms, name=None):
+  """Composes a list of projective transforms into a single transform.
+
+  Since projective transforms map *output* points to *input* points, the
+  composition of transforms `[t_1, ..., t_n]` corresponds to applying `t_1`
+  first and `t_n` last, i.e. resampling the images once with the composed
+  transform gives the same result as applying each transform in turn (up to
+  interpolation and fill effects at the intermediate steps).
+
+  Args:
+    transforms: A list of tensors of shape (num_images, 8), as returned by
+      `get_translation_matrix`, `get_rotation_matrix` or `get_zoom_matrix`.
+    name: The name of the op.
+
+  Returns:
+    A tensor of shape (num_images, 8) projective transforms which can be given
+      to `transform`.
+  """
+  with K.name_scope(name or 'compose_transforms'):
+    composed = None
+    for t in transforms:
+      t = ops.convert_to_tensor_v2_with_dispatch(t, dtypes.float32)
+      num_transforms = array_ops.shape(t)[0]
+      # Append the implicit last entry to get the full 3x3 matrices.
+      matrices = array_ops.reshape(
+          array_ops.concat(
+              [t, array_ops.ones((num_transforms, 1), dtypes.float32)],
+              axis=1), [-1, 3, 3])
+      if composed is None:
+        composed = matrices
+      else:
+        composed = math_ops.matmul(composed, matrices)
+    if composed is None:
+      raise ValueError('`transforms` must contain at least one transform.')
+    composed = array_ops.reshape(composed, [-1, 9])
+    # Normalize so that the implicit last entry is 1 again.
+    return composed[:, :8] / composed[:, 8:]
+
+
+@keras_export('keras.layers.experimental.preprocessing.RandomTransforms')
+class RandomTransforms(PreprocessingLayer):
+  """Applies several random geometric transformations in a single resampling.
+
+  Chaining `RandomTranslation`, `RandomRotation` and `RandomZoom` layers
+  resamples (and interpolates) the images once per layer. This layer instead
+  draws the random parameters of each given layer for every image of the
+  batch, composes them into one projective transform per image and resamples
+  the images once. This is faster and avoids compounding interpolation and fill
+  artifacts.
+
+  By default, random transformations are only applied during training.
+  At inference time, the layer does nothing. If you need to apply random
+  transformations at inference time, set `training` to True when calling the
+  layer.
+
+  Example:
+
+  >>> layer = tf.keras.layers.experimental.preprocessing.RandomTransforms([
+  ...     tf.keras.layers.experimental.preprocessing.RandomRotation(0.1),
+  ...     tf.keras.layers.experimental.preprocessing.RandomZoom(0.2),
+  ... ])
+  >>> out_img = layer(np.random.random((32, 224, 224, 3)), training=True)
+  >>> out_img.shape
+  TensorShape([32, 224, 224, 3])
+
+  Args:
+    layers: A list of `RandomTranslation`, `RandomRotation` or `RandomZoom`
+      layers, in the order in which their transformations are applied. Only the
+      random factors of these layers are used; their `fill_mode`, `fill_value`
+      and `interpolation` are ignored in favor of the ones of this layer.
+    fill_mode: Points outside the boundaries of the input are filled according
+      to the given mode (one of `{'constant', 'reflect', 'wrap', 'nearest'}`).
+    interpolation: Interpolation mode. Supported values: "nearest", "bilinear".
+    name: A string, the name of the layer.
+    fill_value: a float represents the value to be filled outside the boundaries
+      when `fill_mode` is "constant".
+  Input shape:
+    4D tensor with shape: `(samples, height, width, channels)`,
+      data_format='channels_last'.
+  Output shape:
+    4D tensor with shape: `(samples, height, width, channels)`,
+      data_format='channels_last'.
+  Raise:
+    ValueError: if `layers` is empty or contains a layer that does not apply a
+      geometric transformation.
+  """
+
+  def __init__(self,
+               layers,
+               fill_mode='reflect',
+               interpolation='bilinear',
+               name=None,
+               fill_value=0.0,
+               **kwargs):
+    layers = list(layers)
+    if not layers:
+      raise ValueError('`layers` must contain at least one layer.')
+    for layer in layers:
+      if not hasattr(layer, '_random_transforms'):
+        raise ValueError('`RandomTransforms` only supports '
+                         '`RandomTranslation`, `RandomRotation` and '
+                         '`RandomZoom` layers, '
+                         'got {}'.format(layer))
+    check_fill_mode_and_interpolation(fill_mode, interpolation)
+    self.transform_layers = layers
+    self.fill_mode = fill_mode
+    self.fill_value = fill_value
+    self.interpolation = interpolation
+    self.input_spec = InputSpec(ndim=4)
+    super(RandomTransforms, self).__init__(name=name, **kwargs)
+    base_preprocessing_layer.keras_kpl_gauge.get_cell('RandomTransforms').set(
+        True)
+
+  def call(self, inputs, training=True):
+    if training is None:
+      training = K.learning_phase()
+
+    def random_transformed_inputs():
+      """Transformed inputs with random ops."""
+      inputs_shape = array_ops.shape(inputs)
+      batch_size = inputs_shape[0]
+      img_hd = math_ops.cast(inputs_shape[H_AXIS], dtypes.float32)
+      img_wd = math_ops.cast(inputs_shape[W_AXIS], dtypes.float32)
+      transforms = [
+          layer._random_transforms(batch_size, img_hd, img_wd)  # pylint: disable=protected-access
+          for layer in self.transform_layers
+      ]
+      return transform(
+          inputs,
+          compose_transforms(transforms),
+          fill_mode=self.fill_mode,
+          fill_value=self.fill_value,
+          interpolation=self.interpolation)
+
+    output = control_flow_util.smart_cond(training, random_transformed_inputs,
+                                          lambda: inputs)
+    output.set_shape(inputs.shape)
+    return output
+
+  def compute_output_shape(self, input_shape):
+    return input_shape
+
+  def get_config(self):
+    config = {
+        'layers': [
+            generic_utils.serialize_keras_object(layer)
+            for layer in self.transform_layers
+        ],
+        'fill_mode': self.fill_mode,
+        'fill_value': self.fill_value,
+        'interpolation': self.interpolation,
+    }
+    base_config = super(RandomTransforms, self).get_config()
+    return dict(list(base_config.items()) + list(config.items()))
+
+  @classmethod
+  def from_config(cls, config, custom_objects=None):
+    from tensorflow.python.keras.layers import deserialize as deserialize_layer  # pylint: disable=g-import-not-at-top
+    config = config.copy()
+    config['layers'] = [
+        deserialize_layer(layer_config, custom_objects=custom_objects)
+        for layer_config in config['layers']
+    ]
+    return cls(**config)
+
+
+def adjust_contrast(images, contrast_factors, name=None):
+  """Adjusts the contrast of each image by its own factor.
+
+  Unlike `tf.image.adjust_contrast`, which takes a single scalar factor,
+  `contrast_factors` may hold one factor per image of the batch.
+
+  Args:
+    images: A 4D tensor of shape (num_images, height, width, channels).
+    contrast_factors: A float or a tensor broadcastable to
+      (num_images, 1, 1, 1).
+    name: The name of the op.
+
+  Returns:
+    The contrast-adjusted images, with the same dtype as `images`.
+  """
+  with K.name_scope(name or 'adjust_contrast'):
+    images = ops.convert_to_tensor_v2_with_dispatch(images, name='images')
+    orig_dtype = images.dtype
+    if orig_dtype in (dtypes.float16, dtypes.float32):
+      flt_images = images
+    else:
+      flt_images = image_ops.convert_image_dtype(images, dtypes.float32)
+    means = math_ops.reduce_mean(
+        flt_images, axis=[H_AXIS, W_AXIS], keepdims=True)
+    contrast_factors = math_ops.cast(contrast_factors, flt_images.dtype)
+    adjusted = (flt_images - means) * contrast_factors + means
+    return image_ops.convert_image_dtype(adjusted, orig_dtype, saturate=True)
+
+
 @keras_export('keras.layers.experimental.preprocessing.RandomContrast')
 class RandomContrast(PreprocessingLayer):
   """Adjust the contrast of an image or images by a random factor.
 
   Contrast is adjusted independently for each channel of each image during
-  training.
+  training. A separate contrast factor is drawn for every image of the batch.
 
   For each channel, this layer computes the mean of the image pixels in the
   channel and then adjusts each component `x` of each pixel to
@@ -1097,8 +1305,14 @@ class RandomContrast(PreprocessingLayer):
       training = K.learning_phase()
 
     def random_contrasted_inputs():
-      return image_ops.random_contrast(inputs, 1. - self.lower, 1. + self.upper,
-                                       self.seed)
+      """Contrast-adjusted inputs with one random factor per image."""
+      batch_size = array_ops.shape(inputs)[0]
+      factors = random_ops.random_uniform(
+          shape=[batch_size, 1, 1, 1],
+          minval=1. - self.lower,
+          maxval=1. + self.upper,
+          seed=self.seed)
+      return adjust_contrast(inputs, factors)
 
     output = control_flow_util.smart_cond(training, random_contrasted_inputs,
                                           lambda: inputs)
@@ -486,6 +486,27 @@ class RandomContrastTest(keras_parameterized.TestCase):
         layer = image_preprocessing.RandomContrast((0.1, 0.2))
         layer(input_images)
 
+  def test_random_contrast_per_image_factors(self):
+    np.random.seed(1337)
+    inp = np.random.random((2, 5, 8, 3)).astype(np.float32)
+    mock_random = np.reshape(np.asarray([0.2, 1.5], np.float32), (2, 1, 1, 1))
+    inp_mean = np.mean(inp, axis=(1, 2), keepdims=True)
+    expected_output = (inp - inp_mean) * mock_random + inp_mean
+    with test.mock.patch.object(
+        random_ops, 'random_uniform', return_value=mock_random):
+      with testing_utils.use_gpu():
+        layer = image_preprocessing.RandomContrast((0.8, 0.5))
+        actual_output = layer(inp, training=True)
+        self.assertAllClose(expected_output, actual_output)
+
+  def test_random_contrast_varies_across_batch(self):
+    with testing_utils.use_gpu():
+      input_image = np.random.random((1, 5, 8, 3)).astype(np.float32)
+      input_images = np.tile(input_image, (8, 1, 1, 1))
+      layer = image_preprocessing.RandomContrast((0.5, 0.5), seed=1337)
+      output_images = self.evaluate(layer(input_images, training=True))
+      self.assertNotAllClose(output_images[0], output_images[1])
+
   def test_random_contrast_invalid_bounds(self):
     with self.assertRaises(ValueError):
       image_preprocessing.RandomContrast((-0.1, .5))
@@ -1210,6 +1231,96 @@ class RandomZoomTest(keras_parameterized.TestCase):
     self.assertEqual(layer_1.name, layer.name)
 
 
+@keras_parameterized.run_all_keras_modes(always_skip_v1=True)
+class RandomTransformsTest(keras_parameterized.TestCase):
+
+  def test_compose_translations(self):
+    with testing_utils.use_gpu():
+      composed = image_preprocessing.compose_transforms([
+          image_preprocessing.get_translation_matrix([[1., 2.], [0., 1.]]),
+          image_preprocessing.get_translation_matrix([[3., -1.], [2., 2.]]),
+      ])
+      expected = image_preprocessing.get_translation_matrix([[4., 1.],
+                                                             [2., 3.]])
+      self.assertAllClose(self.evaluate(expected), self.evaluate(composed))
+
+  def test_compose_single_transform(self):
+    with testing_utils.use_gpu():
+      zoom = image_preprocessing.get_zoom_matrix([[.5, .8]], 5., 5.)
+      composed = image_preprocessing.compose_transforms([zoom])
+      self.assertAllClose(self.evaluate(zoom), self.evaluate(composed))
+
+  def test_random_transforms_matches_single_layer(self):
+    for dtype in (np.int64, np.float32):
+      with testing_utils.use_gpu():
+        input_image = np.reshape(np.arange(0, 25), (1, 5, 5, 1)).astype(dtype)
+        zoom = image_preprocessing.RandomZoom((.5, .5), (.8, .8),
+                                              fill_mode='constant',
+                                              interpolation='nearest')
+        layer = image_preprocessing.RandomTransforms(
+            [image_preprocessing.RandomZoom((.5, .5), (.8, .8))],
+            fill_mode='constant',
+            interpolation='nearest')
+        self.assertAllEqual(
+            zoom(input_image), layer(input_image, training=True))
+
+  def test_random_transforms_matches_sequential_layers(self):
+    for dtype in (np.int64, np.float32):
+      with testing_utils.use_gpu():
+        input_image = np.reshape(np.arange(0, 25), (1, 5, 5, 1)).astype(dtype)
+        kwargs = {'fill_mode': 'constant', 'interpolation': 'nearest'}
+        translation = image_preprocessing.RandomTranslation(
+            (.2, .2), (0., 0.), **kwargs)
+        rotation = image_preprocessing.RandomRotation((.25, .25), **kwargs)
+        expected_output = rotation(translation(input_image))
+        layer = image_preprocessing.RandomTransforms([
+            image_preprocessing.RandomTranslation((.2, .2), (0., 0.)),
+            image_preprocessing.RandomRotation((.25, .25)),
+        ], **kwargs)
+        self.assertAllEqual(expected_output, layer(input_image, training=True))
+
+  def test_random_transforms_per_image(self):
+    with testing_utils.use_gpu():
+      input_image = np.random.random((1, 5, 8, 3)).astype(np.float32)
+      input_images = np.tile(input_image, (8, 1, 1, 1))
+      layer = image_preprocessing.RandomTransforms([
+          image_preprocessing.RandomRotation(.2, seed=1337),
+          image_preprocessing.RandomZoom(.2, seed=1337),
+      ])
+      output_images = self.evaluate(layer(input_images, training=True))
+      self.assertNotAllClose(output_images[0], output_images[1])
+
+  def test_random_transforms_inference(self):
+    input_images = np.random.random((2, 5, 8, 3)).astype(np.float32)
+    expected_output = input_images
+    with testing_utils.use_gpu():
+      layer = image_preprocessing.RandomTransforms(
+          [image_preprocessing.RandomRotation(.5)])
+      actual_output = layer(input_images, training=0)
+      self.assertAllClose(expected_output, actual_output)
+
+  def test_random_transforms_invalid_layers(self):
+    with self.assertRaisesRegex(ValueError, 'at least one layer'):
+      image_preprocessing.RandomTransforms([])
+    with self.assertRaisesRegex(ValueError, 'only supports'):
+      image_preprocessing.RandomTransforms(
+          [image_preprocessing.RandomContrast(.5)])
+
+  @testing_utils.run_v2_only
+  def test_config_with_custom_name(self):
+    layer = image_preprocessing.RandomTransforms([
+        image_preprocessing.RandomTranslation(.2, .3),
+        image_preprocessing.RandomZoom(.5, .6),
+    ], fill_mode='constant', name='image_preproc')
+    config = layer.get_config()
+    layer_1 = image_preprocessing.RandomTransforms.from_config(config)
+    self.assertEqual(layer_1.name, layer.name)
+    self.assertEqual(layer_1.fill_mode, 'constant')
+    self.assertEqual(
+        [type(l) for l in layer_1.transform_layers],
+        [image_preprocessing.RandomTranslation, image_preprocessing.RandomZoom])
+
+
 @keras_parameterized.run_all_keras_modes(always_skip_v1=True)
 class RandomHeightTest(keras_parameterized.TestCase):
 
@@ -25,6 +25,8 @@ import operator
 import numpy as np
 
 from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import ops
+from tensorflow.python.framework import sparse_tensor
 from tensorflow.python.framework import tensor_shape
 from tensorflow.python.framework import tensor_spec
 from tensorflow.python.keras import backend as K
@@ -32,9 +34,12 @@ from tensorflow.python.keras.engine import base_preprocessing_layer
 from tensorflow.python.keras.layers.preprocessing import category_encoding
 from tensorflow.python.keras.layers.preprocessing import table_utils
 from tensorflow.python.keras.utils import layer_utils
+from tensorflow.python.keras.utils import tf_utils
+from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import init_ops
 from tensorflow.python.ops import lookup_ops
 from tensorflow.python.ops import math_ops
+from tensorflow.python.ops.ragged import ragged_factory_ops
 from tensorflow.python.util import compat
 
 INT = "int"
@@ -103,6 +108,13 @@ class IndexLookup(base_preprocessing_layer.CombinerPreprocessingLayer):
     sparse: Boolean. Only applicable to "binary" and "count" output modes.
       If true, returns a `SparseTensor` instead of a dense `Tensor`.
       Defaults to `False`.
+    vocabulary_sketch_size: If set, `adapt()` computes an approximate
+      vocabulary from a heavy-hitters sketch holding at most this many
+      candidate tokens, instead of counting every distinct token exactly. Any
+      token making up more than `1 / (vocabulary_sketch_size + 1)` of the
+      adapted data is guaranteed to be kept. Must be at least the number of
+      non-special tokens allowed by `max_tokens`. Defaults to None (exact
+      counting).
   """
 
   def __init__(self,
@@ -115,6 +127,7 @@ class IndexLookup(base_preprocessing_layer.CombinerPreprocessingLayer):
                output_mode=INT,
                sparse=False,
                pad_to_max_tokens=False,
+               vocabulary_sketch_size=None,
                **kwargs):
 
     # If max_tokens is set, the value must be greater than 1 - otherwise we
@@ -146,6 +159,7 @@ class IndexLookup(base_preprocessing_layer.CombinerPreprocessingLayer):
     self.output_mode = output_mode
     self.sparse = sparse
     self.pad_to_max_tokens = pad_to_max_tokens
+    self.vocabulary_sketch_size = vocabulary_sketch_size
     self._called = False
 
     # If there is only one OOV bucket, we can determine the OOV value (either 0
@@ -165,13 +179,27 @@ class IndexLookup(base_preprocessing_layer.CombinerPreprocessingLayer):
     else:
       vocab_size = None
 
-    super(IndexLookup, self).__init__(
-        combiner=_IndexLookupCombiner(
-            vocab_size=vocab_size,
-            mask_value=mask_token,
-            oov_value=oov_token,
-            compute_idf=(output_mode == TFIDF)),
-        **kwargs)
+    if vocabulary_sketch_size is None:
+      combiner = _IndexLookupCombiner(
+          vocab_size=vocab_size,
+          mask_value=mask_token,
+          oov_value=oov_token,
+          compute_idf=(output_mode == TFIDF))
+    else:
+      if vocabulary_sketch_size < 1 or (vocab_size is not None and
+                                        vocabulary_sketch_size < vocab_size):
+        raise ValueError(
+            "vocabulary_sketch_size must be at least 1 and no smaller than the "
+            "number of non-special tokens in the vocabulary (%s). You passed "
+            "%s" % (vocab_size, vocabulary_sketch_size))
+      combiner = _IndexLookupSketchCombiner(
+          sketch_size=vocabulary_sketch_size,
+          vocab_size=vocab_size,
+          mask_value=mask_token,
+          oov_value=oov_token,
+          compute_idf=(output_mode == TFIDF))
+
+    super(IndexLookup, self).__init__(combiner=combiner, **kwargs)
 
     # We need to save the key dtype so that we know if we're expecting int64
     # keys. If we are, we will cast int32 inputs to int64 as well.
@@ -297,6 +325,7 @@ class IndexLookup(base_preprocessing_layer.CombinerPreprocessingLayer):
         "mask_token": self.mask_token,
         "output_mode": self.output_mode,
         "pad_to_max_tokens": self.pad_to_max_tokens,
+        "vocabulary_sketch_size": self.vocabulary_sketch_size,
     }
     base_config = super(IndexLookup, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -686,12 +715,13 @@ class _IndexLookupCombiner(base_preprocessing_layer.Combiner):
   def serialize(self, accumulator):
     """Serialize an accumulator for a remote call."""
     output_dict = {}
-    output_dict["vocab"] = list(accumulator.count_dict.keys())
+    output_dict["vocab"] = _encode_tokens(accumulator.count_dict.keys())
     output_dict["vocab_counts"] = list(accumulator.count_dict.values())
 
     if self._compute_idf:
       output_dict["data"] = accumulator.data
-      output_dict["idf_vocab"] = list(accumulator.per_doc_count_dict.keys())
+      output_dict["idf_vocab"] = _encode_tokens(
+          accumulator.per_doc_count_dict.keys())
       output_dict["idf_counts"] = [
           counter["count"]
           for counter in accumulator.per_doc_count_dict.values()
@@ -704,7 +734,9 @@ class _IndexLookupCombiner(base_preprocessing_layer.Combiner):
 
     accumulator = self._create_accumulator()
     count_dict = dict(
-        zip(accumulator_dict["vocab"], accumulator_dict["vocab_counts"]))
+        zip(
+            _decode_tokens(accumulator_dict["vocab"]),
+            accumulator_dict["vocab_counts"]))
     accumulator.count_dict.update(count_dict)
 
     if self._compute_idf:
@@ -713,7 +745,8 @@ class _IndexLookupCombiner(base_preprocessing_layer.Combiner):
       idf_count_dicts = [
           create_dict(count) for count in accumulator_dict["idf_counts"]
       ]
-      idf_dict = dict(zip(accumulator_dict["idf_vocab"], idf_count_dicts))
+      idf_dict = dict(
+          zip(_decode_tokens(accumulator_dict["idf_vocab"]), idf_count_dicts))
       accumulator.per_doc_count_dict.update(idf_dict)
     return accumulator
 
@@ -745,3 +778,231 @@ class _IndexLookupCombiner(base_preprocessing_layer.Combiner):
       An array of "inverse document frequency" weights.
     """
     return np.log(1 + num_documents / (1 + np.array(document_counts)))
+
+
+class _IndexLookupSketchAccumulator(
+    collections.namedtuple("SketchAccumulator",
+                           ["data", "tokens", "counts", "doc_counts"])):
+  pass
+
+
+class _IndexLookupSketchCombiner(_IndexLookupCombiner):
+  """Approximate combiner for the IndexLookup preprocessing layer.
+
+  Instead of an exact count of every distinct token, this combiner keeps a
+  Misra-Gries heavy-hitters sketch of at most `sketch_size` candidate tokens.
+  Each batch is counted in-graph with `unique_with_counts`, and batch counts
+  are folded into the sketch with vectorized NumPy operations. Two sketches are
+  merged by summing their counts and subtracting the `(sketch_size + 1)`-th
+  largest count from every token, which keeps the merge associative across
+  shards. Counts are underestimated by at most `N / (sketch_size + 1)` for `N`
+  tokens seen, so every token whose frequency exceeds that bound is retained.
+  In TF-IDF mode, the document count of a retained token only covers the
+  documents seen while the token was held in the sketch.
+
+  Attributes:
+    sketch_size: The maximum number of candidate tokens held in the sketch.
+    vocab_size: (Optional) If set, only the top `vocab_size` tokens (based on
+      estimated frequency across the dataset) are retained in the vocabulary.
+  """
+
+  def __init__(self,
+               sketch_size,
+               vocab_size=None,
+               mask_value=None,
+               oov_value=None,
+               compute_idf=False):
+    super(_IndexLookupSketchCombiner, self).__init__(
+        vocab_size=vocab_size,
+        mask_value=mask_value,
+        oov_value=oov_value,
+        compute_idf=compute_idf)
+    self._sketch_size = sketch_size
+
+  def compute(self, values, accumulator=None):
+    """Compute a step in this computation, returning a new accumulator."""
+    if accumulator is None:
+      accumulator = self._create_accumulator()
+
+    flat_values, document_ids, num_documents = _flatten_documents(values)
+    tokens, token_ids, counts = array_ops.unique_with_counts(
+        flat_values, out_idx=dtypes.int64)
+    fetches = [tokens, counts, num_documents]
+    if self._compute_idf:
+      # Count each (document, token) pair once to get document frequencies.
+      num_tokens = array_ops.size(tokens, out_type=dtypes.int64)
+      doc_token_ids, _ = array_ops.unique(document_ids * num_tokens + token_ids)
+      fetches.append(
+          math_ops.unsorted_segment_sum(
+              array_ops.ones_like(doc_token_ids), doc_token_ids % num_tokens,
+              num_tokens))
+    fetched = K.batch_get_value(fetches)
+
+    if self._compute_idf:
+      batch_accumulator = _IndexLookupSketchAccumulator(
+          {"next_doc_id": int(fetched[2])}, fetched[0], fetched[1], fetched[3])
+    else:
+      batch_accumulator = _IndexLookupSketchAccumulator(
+          None, fetched[0], fetched[1], None)
+    return self.merge([accumulator, batch_accumulator])
+
+  def merge(self, accumulators):
+    """Merge several accumulators to a single accumulator."""
+    if not accumulators:
+      return accumulators
+
+    data = None
+    if self._compute_idf:
+      data = {
+          "next_doc_id":
+              sum(accumulator.data["next_doc_id"]
+                  for accumulator in accumulators)
+      }
+    accumulators = [
+        accumulator for accumulator in accumulators if accumulator.tokens.size
+    ]
+    if not accumulators:
+      return self._create_accumulator(data)
+
+    tokens, token_ids = np.unique(
+        np.concatenate([accumulator.tokens for accumulator in accumulators]),
+        return_inverse=True)
+    counts = self._sum_by_token(
+        [accumulator.counts for accumulator in accumulators], token_ids,
+        tokens.size)
+    doc_counts = None
+    if self._compute_idf:
+      doc_counts = self._sum_by_token(
+          [accumulator.doc_counts for accumulator in accumulators], token_ids,
+          tokens.size)
+
+    if tokens.size > self._sketch_size:
+      threshold = np.partition(counts, -self._sketch_size - 1)[
+          -self._sketch_size - 1]
+      counts -= threshold
+      kept = counts > 0
+      tokens = tokens[kept]
+      counts = counts[kept]
+      if self._compute_idf:
+        doc_counts = doc_counts[kept]
+
+    return _IndexLookupSketchAccumulator(data, tokens, counts, doc_counts)
+
+  def extract(self, accumulator):
+    """Convert an accumulator into a dict of output values.
+
+    Args:
+      accumulator: An accumulator aggregating over the full dataset.
+
+    Returns:
+      A dict of:
+        "vocab": A list of the retained items in the vocabulary.
+    """
+    tokens = accumulator.tokens.tolist()
+    count_dict = dict(zip(tokens, accumulator.counts.tolist()))
+    per_doc_count_dict = None
+    if self._compute_idf:
+      per_doc_count_dict = {
+          token: {
+              "count": count,
+              "last_doc_id": -1
+          } for token, count in zip(tokens, accumulator.doc_counts.tolist())
+      }
+    return super(_IndexLookupSketchCombiner, self).extract(
+        _IndexLookupAccumulator(accumulator.data, count_dict,
+                                per_doc_count_dict))
+
+  def serialize(self, accumulator):
+    """Serialize an accumulator for a remote call."""
+    output_dict = {}
+    output_dict["vocab"] = _encode_tokens(accumulator.tokens.tolist())
+    output_dict["vocab_counts"] = accumulator.counts.tolist()
+    if self._compute_idf:
+      output_dict["data"] = accumulator.data
+      output_dict["idf_counts"] = accumulator.doc_counts.tolist()
+    return compat.as_bytes(json.dumps(output_dict))
+
+  def deserialize(self, encoded_accumulator):
+    """Deserialize an accumulator received from 'serialize()'."""
+    accumulator_dict = json.loads(compat.as_text(encoded_accumulator))
+    tokens = _decode_tokens(accumulator_dict["vocab"])
+    if not tokens or isinstance(tokens[0], bytes):
+      tokens = np.array(tokens, dtype=object)
+    else:
+      tokens = np.array(tokens)
+    counts = np.array(accumulator_dict["vocab_counts"], dtype=np.int64)
+    if self._compute_idf:
+      return _IndexLookupSketchAccumulator(
+          accumulator_dict["data"], tokens, counts,
+          np.array(accumulator_dict["idf_counts"], dtype=np.int64))
+    return _IndexLookupSketchAccumulator(None, tokens, counts, None)
+
+  def _create_accumulator(self, data=None):
+    """Accumulate an empty sketch of vocab tokens and corresponding counts."""
+    if self._compute_idf:
+      data = data or {"next_doc_id": 0}
+      doc_counts = np.zeros((0,), dtype=np.int64)
+    else:
+      doc_counts = None
+    return _IndexLookupSketchAccumulator(
+        data, np.zeros((0,), dtype=object), np.zeros((0,), dtype=np.int64),
+        doc_counts)
+
+  def _sum_by_token(self, counts, token_ids, num_tokens):
+    totals = np.zeros((num_tokens,), dtype=np.int64)
+    np.add.at(totals, token_ids, np.concatenate(counts).astype(np.int64))
+    return totals
+
+
+def _encode_tokens(tokens):
+  """Makes a list of tokens JSON serializable, tagging byte string tokens."""
+  tokens = list(tokens)
+  if tokens and isinstance(tokens[0], bytes):
+    return {"bytes": [compat.as_text(token) for token in tokens]}
+  return tokens
+
+
+def _decode_tokens(encoded_tokens):
+  """Inverse of `_encode_tokens`."""
+  if isinstance(encoded_tokens, dict):
+    return [compat.as_bytes(token) for token in encoded_tokens["bytes"]]
+  return encoded_tokens
+
+
+def _flatten_documents(values):
+  """Flattens a batch of documents for vectorized token counting.
+
+  Args:
+    values: A dense, ragged or sparse batch of tokens, or a NumPy array or
+      (possibly ragged) Python list of tokens. Each row of a batch of rank 2 or
+      more is a document; each element of a batch of rank 1 is a document.
+
+  Returns:
+    A tuple of a 1D tensor of tokens, a 1D int64 tensor holding the document
+    index of each token, and a scalar int64 tensor holding the number of
+    documents.
+  """
+  if isinstance(values, sparse_tensor.SparseTensor):
+    return (values.values, values.indices[:, 0],
+            math_ops.cast(values.dense_shape[0], dtypes.int64))
+
+  if isinstance(values, list):
+    values = ragged_factory_ops.constant(values)
+  if tf_utils.is_ragged(values):
+    if values.shape.rank != 2:
+      values = values.merge_dims(1, -1)
+    return (values.values, math_ops.cast(values.value_rowids(), dtypes.int64),
+            math_ops.cast(values.nrows(), dtypes.int64))
+
+  values = ops.convert_to_tensor_v2_with_dispatch(values)
+  if values.shape.rank == 0:
+    values = array_ops.reshape(values, [1, 1])
+  elif values.shape.rank == 1:
+    values = array_ops.expand_dims(values, -1)
+  elif values.shape.rank > 2:
+    values = array_ops.reshape(values, [array_ops.shape(values)[0], -1])
+  shape = array_ops.shape(values, out_type=dtypes.int64)
+  document_ids = array_ops.broadcast_to(
+      array_ops.expand_dims(math_ops.range(shape[0]), 1), shape)
+  return (array_ops.reshape(values, [-1]),
+          array_ops.reshape(document_ids, [-1]), shape[0])
@@ -1789,5 +1789,64 @@ class IndexLookupIntCombinerTest(keras_parameterized.TestCase,
     self.validate_accumulator_extract(combiner, data, expected_extract_output)
 
 
+@keras_parameterized.run_all_keras_modes
+class IndexLookupSketchTest(keras_parameterized.TestCase,
+                            preprocessing_test_utils.PreprocessingLayerTest):
+
+  def test_sketch_adapt_keeps_heavy_hitters(self):
+    vocab_data = np.array([["earth", "wind", "earth", "fire"],
+                           ["wind", "earth", "and", "michigan"],
+                           ["earth", "wind", "fire", "ohio"]])
+    vocab_dataset = dataset_ops.Dataset.from_tensor_slices(vocab_data).batch(1)
+
+    layer = get_layer_class()(
+        max_tokens=5,
+        num_oov_indices=1,
+        mask_token="",
+        oov_token="[OOV]",
+        vocabulary_sketch_size=5,
+        dtype=dtypes.string)
+    layer.adapt(vocab_dataset)
+    expected_vocabulary = ["", "[OOV]", "earth", "wind", "fire"]
+    self.assertAllEqual(expected_vocabulary, layer.get_vocabulary())
+    self.assertEqual(5, layer.get_config()["vocabulary_sketch_size"])
+
+  def test_sketch_combiner_merge_is_bounded(self):
+    combiner = index_lookup._IndexLookupSketchCombiner(
+        sketch_size=2, compute_idf=True)
+    shard_1 = combiner.compute(np.array([[42, 42, 1138], [42, 725, 203]]))
+    shard_2 = combiner.compute(np.array([[42, 1729, 42], [1138, 1138, 7]]))
+    merged = combiner.merge([
+        shard_1,
+        combiner.deserialize(combiner.serialize(shard_2))
+    ])
+    self.assertLessEqual(merged.tokens.size, 2)
+    self.assertIn(42, merged.tokens.tolist())
+    self.assertEqual(4, merged.data["next_doc_id"])
+    self.assertEqual(42, combiner.extract(merged)["vocab"][0])
+
+  def test_sketch_combiner_serialize_string_tokens(self):
+    combiner = index_lookup._IndexLookupSketchCombiner(
+        sketch_size=3, compute_idf=True)
+    accumulator = combiner.compute(
+        np.array([["earth", "wind", "earth"], ["fire", "earth", "wind"]]))
+    restored = combiner.deserialize(combiner.serialize(accumulator))
+    self.assertAllEqual(accumulator.tokens, restored.tokens)
+    self.assertAllEqual(accumulator.counts, restored.counts)
+    self.assertAllEqual(accumulator.doc_counts, restored.doc_counts)
+    self.assertEqual(combiner.extract(accumulator)["vocab"],
+                     combiner.extract(restored)["vocab"])
+
+  def test_sketch_size_smaller_than_vocab_fails(self):
+    with self.assertRaisesRegex(ValueError, ".*vocabulary_sketch_size.*"):
+      _ = get_layer_class()(
+          max_tokens=5,
+          num_oov_indices=1,
+          mask_token="",
+          oov_token="[OOV]",
+          vocabulary_sketch_size=2,
+          dtype=dtypes.string)
+
+
 if __name__ == "__main__":
   test.main()
@@ -82,6 +82,12 @@ class IntegerLookup(index_lookup.IndexLookup):
     sparse: Boolean. Only applicable to "binary" and "count" output modes.
       If true, returns a `SparseTensor` instead of a dense `Tensor`.
       Defaults to `False`.
+    vocabulary_sketch_size: If set, `adapt()` computes an approximate
+      vocabulary from a heavy-hitters sketch holding at most this many
+      candidate values, instead of counting every distinct value exactly. This
+      bounds the memory used by `adapt()` on very large datasets. Must be at
+      least the number of non-special values allowed by `max_values`.
+      Defaults to None (exact counting).
 
   Examples:
 
@@ -257,6 +263,7 @@ class IntegerLookup(index_lookup.IndexLookup):
                output_mode=index_lookup.INT,
                sparse=False,
                pad_to_max_values=False,
+               vocabulary_sketch_size=None,
                **kwargs):
     allowed_dtypes = [dtypes.int64]
 
@@ -293,6 +300,7 @@ class IntegerLookup(index_lookup.IndexLookup):
         output_mode=output_mode,
         sparse=sparse,
         pad_to_max_tokens=pad_to_max_values,
+        vocabulary_sketch_size=vocabulary_sketch_size,
         **kwargs)
     base_preprocessing_layer.keras_kpl_gauge.get_cell("IntegerLookup").set(True)
 
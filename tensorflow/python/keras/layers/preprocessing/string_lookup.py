@@ -83,6 +83,12 @@ class StringLookup(index_lookup.IndexLookup):
     sparse: Boolean. Only applicable to "binary" and "count" output modes.
       If true, returns a `SparseTensor` instead of a dense `Tensor`.
       Defaults to `False`.
+    vocabulary_sketch_size: If set, `adapt()` computes an approximate
+      vocabulary from a heavy-hitters sketch holding at most this many
+      candidate tokens, instead of counting every distinct token exactly. This
+      bounds the memory used by `adapt()` on very large datasets. Must be at
+      least the number of non-special tokens allowed by `max_tokens`.
+      Defaults to None (exact counting).
 
   Examples:
 
@@ -258,6 +264,7 @@ class StringLookup(index_lookup.IndexLookup):
                output_mode=index_lookup.INT,
                sparse=False,
                pad_to_max_tokens=False,
+               vocabulary_sketch_size=None,
                **kwargs):
     allowed_dtypes = [dtypes.string]
 
@@ -287,6 +294,7 @@ class StringLookup(index_lookup.IndexLookup):
         output_mode=output_mode,
         sparse=sparse,
         pad_to_max_tokens=pad_to_max_tokens,
+        vocabulary_sketch_size=vocabulary_sketch_size,
         **kwargs)
     base_preprocessing_layer.keras_kpl_gauge.get_cell("StringLookup").set(True)
 
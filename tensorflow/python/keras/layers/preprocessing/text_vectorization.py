@@ -160,6 +160,12 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
       containing a vocabulary to load into this layer. The file should contain
       one token per line. If the list or file contains the same token multiple
       times, an error will be thrown.
+    vocabulary_sketch_size: If set, `adapt()` computes an approximate
+      vocabulary from a heavy-hitters sketch holding at most this many
+      candidate tokens, instead of counting every distinct token exactly. This
+      bounds the memory used by `adapt()` on very large datasets. Must be at
+      least the number of non-special tokens allowed by `max_tokens`.
+      Defaults to None (exact counting).
 
   Example:
 
@@ -252,6 +258,7 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
                output_sequence_length=None,
                pad_to_max_tokens=True,
                vocabulary=None,
+               vocabulary_sketch_size=None,
                **kwargs):
 
     # This layer only applies to string processing, and so should only have
@@ -330,6 +337,7 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
     self._output_mode = output_mode
     self._output_sequence_length = output_sequence_length
     self._pad_to_max = pad_to_max_tokens
+    self._vocabulary_sketch_size = vocabulary_sketch_size
     self._vocab_size = 0
 
     super(TextVectorization, self).__init__(
@@ -344,7 +352,8 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
         mask_token=mask_token,
         vocabulary=vocabulary,
         pad_to_max_tokens=pad_to_max_tokens,
-        output_mode=output_mode if output_mode is not None else INT)
+        output_mode=output_mode if output_mode is not None else INT,
+        vocabulary_sketch_size=vocabulary_sketch_size)
 
   def _get_index_lookup_class(self):
     return string_lookup.StringLookup
@@ -393,6 +402,17 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
     if not reset_state:
       raise ValueError("TextVectorization does not support streaming adapts.")
 
+    self._index_lookup_layer.adapt(self._preprocess_adapt_data(data))
+
+  def adapt_shard(self, data, batch_size=None, steps=None):
+    return self._index_lookup_layer.adapt_shard(
+        self._preprocess_adapt_data(data), batch_size=batch_size, steps=steps)
+
+  def merge_shards(self, shards):
+    self._index_lookup_layer.merge_shards(shards)
+
+  def _preprocess_adapt_data(self, data):
+    """Builds the layer and applies the preprocessing steps to `adapt` data."""
     # Build the layer explicitly with the original data shape instead of relying
     # on an implicit call to `build` in the base layer's `adapt`, since
     # preprocessing changes the input shape.
@@ -402,7 +422,7 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
     if isinstance(data, ops.Tensor):
       if data.shape.rank == 1:
         data = array_ops.expand_dims(data, axis=-1)
-      self.build(data.shape)
+      self._build_for_adapt(data.shape)
       preprocessed_inputs = self._preprocess(data)
     elif isinstance(data, dataset_ops.DatasetV2):
       # TODO(momernick): Replace this with a more V2-friendly API.
@@ -415,14 +435,18 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
         shape = dataset_ops.get_legacy_output_shapes(data)
       if shape.rank == 1:
         data = data.map(lambda tensor: array_ops.expand_dims(tensor, -1))
-      self.build(dataset_ops.get_legacy_output_shapes(data))
+      self._build_for_adapt(dataset_ops.get_legacy_output_shapes(data))
       preprocessed_inputs = data.map(self._preprocess)
     else:
       raise ValueError(
           "adapt() requires a Dataset or an array as input, got {}".format(
               type(data)))
+    return preprocessed_inputs
 
-    self._index_lookup_layer.adapt(preprocessed_inputs)
+  def _build_for_adapt(self, input_shape):
+    # `adapt_shard` may be called on the same layer from several threads.
+    with base_preprocessing_layer._adapt_build_lock:  # pylint: disable=protected-access
+      self.build(input_shape)
 
   def get_vocabulary(self):
     return self._index_lookup_layer.get_vocabulary()
@@ -439,6 +463,7 @@ class TextVectorization(base_preprocessing_layer.CombinerPreprocessingLayer):
         "output_mode": self._output_mode,
         "output_sequence_length": self._output_sequence_length,
         "pad_to_max_tokens": self._pad_to_max,
+        "vocabulary_sketch_size": self._vocabulary_sketch_size,
     }
     base_config = super(TextVectorization, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -338,6 +338,23 @@ class TextVectorizationLayerTest(keras_parameterized.TestCase,
     if context.executing_eagerly():
       self.assertAllClose(out.numpy(), [[2, 3], [4, 5]])
 
+  def test_adapt_in_parallel(self):
+    if not context.executing_eagerly():
+      self.skipTest("Sharded adapt is only supported eagerly.")
+    vocab_data = ["two two two", "two three three", "three four four five"]
+    input_data = ["two three", "four five"]
+
+    def dataset_fn(input_context):
+      dataset = dataset_ops.Dataset.from_tensor_slices(vocab_data)
+      return dataset.shard(input_context.num_input_pipelines,
+                           input_context.input_pipeline_id).batch(1)
+
+    layer = get_layer_class()()
+    layer.adapt_in_parallel(dataset_fn, num_shards=2)
+    self.assertAllEqual(["", "[UNK]", "two", "three", "four", "five"],
+                        layer.get_vocabulary())
+    self.assertAllClose(layer(input_data).numpy(), [[2, 3], [4, 5]])
+
   def test_tensor_inputs(self):
     vocab_data = constant_op.constant(
         ["two two two", "two three three", "three four four five"])
@@ -318,6 +318,9 @@ class GRU(recurrent.DropoutRNNCellMixin, recurrent.GRU):
       Unrolling can speed-up a RNN,
       although it tends to be more memory-intensive.
       Unrolling is only suitable for short sequences.
+      If the other requirements of the cuDNN kernel (except masking and
+      eager execution) are met, an unrolled layer uses a fused kernel on
+      any device.
     time_major: The shape format of the `inputs` and `outputs` tensors.
       If True, the inputs and outputs will be in shape
       `[timesteps, batch, feature]`, whereas in the False case, it will be
@@ -407,6 +410,12 @@ class GRU(recurrent.DropoutRNNCellMixin, recurrent.GRU):
         self.recurrent_activation in (activations.sigmoid, nn.sigmoid) and
         recurrent_dropout == 0 and not unroll and use_bias and
         reset_after and ops.executing_eagerly_outside_functions())
+    # Unrolled layers can not use cuDNN, but can still use the fused kernel of
+    # `standard_gru` on any device.
+    self._could_use_unrolled_kernel = (
+        self.activation in (activations.tanh, nn.tanh) and
+        self.recurrent_activation in (activations.sigmoid, nn.sigmoid) and
+        recurrent_dropout == 0 and unroll and use_bias and reset_after)
     if config.list_logical_devices('GPU'):
       # Only show the message when there is GPU available, user will not care
       # about the cuDNN if there isn't any GPU.
@@ -436,7 +445,8 @@ class GRU(recurrent.DropoutRNNCellMixin, recurrent.GRU):
 
     # TODO(b/156447398) Investigate why the cuDNN kernel fails with ragged
     # inputs.
-    if is_ragged_input or not self._could_use_gpu_kernel:
+    if is_ragged_input or not (self._could_use_gpu_kernel or
+                               self._could_use_unrolled_kernel):
       kwargs = {'training': training}
       self._maybe_reset_cell_dropout_mask(self.cell)
 
@@ -487,7 +497,20 @@ class GRU(recurrent.DropoutRNNCellMixin, recurrent.GRU):
     if dropout_mask is not None:
       inputs = inputs * dropout_mask[0]
 
-    if _use_new_code():
+    if self.unroll:
+      last_output, outputs, new_h, runtime = standard_gru(
+          inputs=inputs,
+          init_h=_read_variable_value(initial_state[0]),
+          kernel=_read_variable_value(self.cell.kernel),
+          recurrent_kernel=_read_variable_value(self.cell.recurrent_kernel),
+          bias=_read_variable_value(self.cell.bias),
+          mask=mask,
+          time_major=self.time_major,
+          go_backwards=self.go_backwards,
+          sequence_lengths=sequence_lengths,
+          zero_output_for_mask=self.zero_output_for_mask,
+          unroll=True)
+    elif _use_new_code():
       gru_kwargs = {
           'inputs': inputs,
           'init_h': _read_variable_value(initial_state[0]),
@@ -542,7 +565,7 @@ class GRU(recurrent.DropoutRNNCellMixin, recurrent.GRU):
 
 def standard_gru(inputs, init_h, kernel, recurrent_kernel, bias, mask,
                  time_major, go_backwards, sequence_lengths,
-                 zero_output_for_mask):
+                 zero_output_for_mask, unroll=False):
   """GRU with standard kernel implementation.
 
   This implementation can be run on all types of hardware.
@@ -552,6 +575,9 @@ def standard_gru(inputs, init_h, kernel, recurrent_kernel, bias, mask,
   counterpart. The RNN step logic has been simplified, eg dropout and mask is
   removed since CuDNN implementation does not support that.
 
+  The inputs of all timesteps are projected by the kernel with a single matmul
+  before the recurrent loop, which then only multiplies by the recurrent kernel.
+
   Args:
     inputs: Input tensor of GRU layer.
     init_h: Initial state tensor for the cell output.
@@ -571,6 +597,8 @@ def standard_gru(inputs, init_h, kernel, recurrent_kernel, bias, mask,
       input, such as ragged tensors. If the input has a fixed timestep size,
       this should be None.
     zero_output_for_mask: Boolean, whether to output zero for masked timestep.
+    unroll: Boolean (default False). If True, the recurrent loop is unrolled.
+      Requires a fixed number of timesteps and `sequence_lengths` to be None.
 
   Returns:
     last_output: output tensor for the last timestep, which has shape
@@ -586,15 +614,14 @@ def standard_gru(inputs, init_h, kernel, recurrent_kernel, bias, mask,
 
   input_bias, recurrent_bias = array_ops.unstack(bias)
 
+  # inputs of all timesteps projected by all gate matrices at once
+  matrix_x = K.bias_add(K.dot(inputs, kernel), input_bias)
+
   def step(cell_inputs, cell_states):
     """Step function that will be used by Keras RNN backend."""
     h_tm1 = cell_states[0]
 
-    # inputs projected by all gate matrices at once
-    matrix_x = K.dot(cell_inputs, kernel)
-    matrix_x = K.bias_add(matrix_x, input_bias)
-
-    x_z, x_r, x_h = array_ops.split(matrix_x, 3, axis=1)
+    x_z, x_r, x_h = array_ops.split(cell_inputs, 3, axis=1)
 
     # hidden state projected by all gate matrices at once
     matrix_inner = K.dot(h_tm1, recurrent_kernel)
@@ -612,9 +639,9 @@ def standard_gru(inputs, init_h, kernel, recurrent_kernel, bias, mask,
 
   last_output, outputs, new_states = K.rnn(
       step,
-      inputs, [init_h],
+      matrix_x, [init_h],
       constants=None,
-      unroll=False,
+      unroll=unroll,
       time_major=time_major,
       mask=mask,
       go_backwards=go_backwards,
@@ -1051,7 +1078,9 @@ class LSTM(recurrent.DropoutRNNCellMixin, recurrent.LSTM):
     unroll: Boolean (default `False`). If True, the network will be unrolled,
       else a symbolic loop will be used. Unrolling can speed-up a RNN, although
       it tends to be more memory-intensive. Unrolling is only suitable for short
-      sequences.
+      sequences. If the other requirements of the cuDNN kernel (except masking
+      and eager execution) are met, an unrolled layer uses a fused kernel on
+      any device.
 
   Call arguments:
     inputs: A 3D tensor with shape `[batch, timesteps, feature]`.
@@ -1133,6 +1162,12 @@ class LSTM(recurrent.DropoutRNNCellMixin, recurrent.LSTM):
         self.recurrent_activation in (activations.sigmoid, nn.sigmoid) and
         recurrent_dropout == 0 and not unroll and use_bias and
         ops.executing_eagerly_outside_functions())
+    # Unrolled layers can not use cuDNN, but can still use the fused kernel of
+    # `standard_lstm` on any device.
+    self._could_use_unrolled_kernel = (
+        self.activation in (activations.tanh, nn.tanh) and
+        self.recurrent_activation in (activations.sigmoid, nn.sigmoid) and
+        recurrent_dropout == 0 and unroll and use_bias)
     if config.list_logical_devices('GPU'):
       # Only show the message when there is GPU available, user will not care
       # about the cuDNN if there isn't any GPU.
@@ -1162,7 +1197,8 @@ class LSTM(recurrent.DropoutRNNCellMixin, recurrent.LSTM):
 
     # TODO(b/156447398) Investigate why the cuDNN kernel fails with ragged
     # inputs.
-    if is_ragged_input or not self._could_use_gpu_kernel:
+    if is_ragged_input or not (self._could_use_gpu_kernel or
+                               self._could_use_unrolled_kernel):
       # Fall back to use the normal LSTM.
       kwargs = {'training': training}
       self._maybe_reset_cell_dropout_mask(self.cell)
@@ -1192,7 +1228,21 @@ class LSTM(recurrent.DropoutRNNCellMixin, recurrent.LSTM):
       dropout_mask = self.get_dropout_mask_for_cell(inputs, training, count=4)
       if dropout_mask is not None:
         inputs = inputs * dropout_mask[0]
-      if _use_new_code():
+      if self.unroll:
+        (last_output, outputs, new_h, new_c, runtime) = standard_lstm(
+            inputs=inputs,
+            init_h=_read_variable_value(initial_state[0]),
+            init_c=_read_variable_value(initial_state[1]),
+            kernel=_read_variable_value(self.cell.kernel),
+            recurrent_kernel=_read_variable_value(self.cell.recurrent_kernel),
+            bias=_read_variable_value(self.cell.bias),
+            mask=mask,
+            time_major=self.time_major,
+            go_backwards=self.go_backwards,
+            sequence_lengths=row_lengths,
+            zero_output_for_mask=self.zero_output_for_mask,
+            unroll=True)
+      elif _use_new_code():
         lstm_kwargs = {
             'inputs':
                 inputs,
@@ -1322,7 +1372,7 @@ def _canonical_to_params(weights, biases, shape, transpose_weights=False):
 
 def standard_lstm(inputs, init_h, init_c, kernel, recurrent_kernel, bias,
                   mask, time_major, go_backwards, sequence_lengths,
-                  zero_output_for_mask):
+                  zero_output_for_mask, unroll=False):
   """LSTM with standard kernel implementation.
 
   This implementation can be run on all types for hardware.
@@ -1332,6 +1382,9 @@ def standard_lstm(inputs, init_h, init_c, kernel, recurrent_kernel, bias,
   counterpart. The RNN step logic has been simplified, eg dropout and mask is
   removed since CuDNN implementation does not support that.
 
+  The inputs of all timesteps are projected by the kernel with a single matmul
+  before the recurrent loop, which then only multiplies by the recurrent kernel.
+
   Note that the first half of the bias tensor should be ignored by this impl.
   The CuDNN impl need an extra set of input gate bias. In order to make the both
   function take same shape of parameter, that extra set of bias is also feed
@@ -1357,6 +1410,8 @@ def standard_lstm(inputs, init_h, init_c, kernel, recurrent_kernel, bias,
       input, such as ragged tensors. If the input has a fixed timestep size,
       this should be None.
     zero_output_for_mask: Boolean, whether to output zero for masked timestep.
+    unroll: Boolean (default False). If True, the recurrent loop is unrolled.
+      Requires a fixed number of timesteps and `sequence_lengths` to be None.
 
   Returns:
     last_output: output tensor for the last timestep, which has shape
@@ -1371,14 +1426,15 @@ def standard_lstm(inputs, init_h, init_c, kernel, recurrent_kernel, bias,
   input_shape = K.int_shape(inputs)
   timesteps = input_shape[0] if time_major else input_shape[1]
 
+  # inputs of all timesteps projected by all gate matrices at once
+  matrix_x = K.bias_add(K.dot(inputs, kernel), bias)
+
   def step(cell_inputs, cell_states):
     """Step function that will be used by Keras RNN backend."""
     h_tm1 = cell_states[0]  # previous memory state
     c_tm1 = cell_states[1]  # previous carry state
 
-    z = K.dot(cell_inputs, kernel)
-    z += K.dot(h_tm1, recurrent_kernel)
-    z = K.bias_add(z, bias)
+    z = cell_inputs + K.dot(h_tm1, recurrent_kernel)
 
     z0, z1, z2, z3 = array_ops.split(z, 4, axis=1)
 
@@ -1392,9 +1448,9 @@ def standard_lstm(inputs, init_h, init_c, kernel, recurrent_kernel, bias,
 
   last_output, outputs, new_states = K.rnn(
       step,
-      inputs, [init_h, init_c],
+      matrix_x, [init_h, init_c],
       constants=None,
-      unroll=False,
+      unroll=unroll,
       time_major=time_major,
       mask=mask,
       go_backwards=go_backwards,
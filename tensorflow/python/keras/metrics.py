@@ -78,6 +78,11 @@ from tensorflow.python.util import nest
 from tensorflow.python.util.tf_export import keras_export
 from tensorflow.tools.docs import doc_controls
 
+# The bin edges of `AUC(histogram_bins=...)` are evenly spaced logits in
+# [-_HISTOGRAM_LOGIT_RANGE, _HISTOGRAM_LOGIT_RANGE], i.e. probabilities in
+# [6e-6, 1 - 6e-6], which are distinct in float32.
+_HISTOGRAM_LOGIT_RANGE = 12.
+
 
 @keras_export('keras.metrics.Metric')
 @six.add_metaclass(abc.ABCMeta)
@@ -1881,6 +1886,16 @@ class AUC(Metric):
   If `sample_weight` is `None`, weights default to 1.
   Use `sample_weight` of 0 to mask values.
 
+  When `histogram_bins` is set, the metric instead keeps two weighted
+  histograms of the predictions, one for positive and one for negative labels,
+  and derives the confusion matrix at every bin edge in `result()`. Updates
+  find the bin of each prediction with a binary search, so their cost grows
+  with `log(histogram_bins)` rather than with the number of thresholds, and
+  thousands of bins can be used. The bin edges are evenly spaced in logit
+  space, which gives fine resolution close to 0 and 1 where the scores of
+  skewed problems (e.g. click-through rates) concentrate. Histograms are merged
+  across replicas by summation.
+
   Args:
     num_thresholds: (Optional) Defaults to 200. The number of thresholds to
       use when discretizing the roc curve. Values must be > 1.
@@ -1926,6 +1941,10 @@ class AUC(Metric):
       `update_state`) are probabilities or sigmoid logits. As a rule of thumb,
       when using a keras loss, the `from_logits` constructor argument of the
       loss should match the AUC `from_logits` constructor argument.
+    histogram_bins: (Optional) If set, the number of bins of the prediction
+      histograms used instead of a fixed set of thresholds. The
+      `histogram_bins - 1` bin edges are the thresholds of the curve, and
+      `num_thresholds` and `thresholds` must not be set. Values must be > 1.
 
   Standalone usage:
 
@@ -1969,7 +1988,8 @@ class AUC(Metric):
                multi_label=False,
                num_labels=None,
                label_weights=None,
-               from_logits=False):
+               from_logits=False,
+               histogram_bins=None):
     # Validate configurations.
     if isinstance(curve, metrics_utils.AUCCurve) and curve not in list(
         metrics_utils.AUCCurve):
@@ -1984,7 +2004,19 @@ class AUC(Metric):
               summation_method, list(metrics_utils.AUCSummationMethod)))
 
     # Update properties.
-    if thresholds is not None:
+    self.histogram_bins = histogram_bins
+    if histogram_bins is not None:
+      if thresholds is not None:
+        raise ValueError('`thresholds` and `histogram_bins` can not both be '
+                         'set.')
+      if histogram_bins <= 1:
+        raise ValueError('`histogram_bins` must be > 1.')
+      # The thresholds are the bin edges, evenly spaced in logit space.
+      self.num_thresholds = histogram_bins + 1
+      thresholds = list(1. / (1. + np.exp(-np.linspace(
+          -_HISTOGRAM_LOGIT_RANGE, _HISTOGRAM_LOGIT_RANGE,
+          histogram_bins - 1))))
+    elif thresholds is not None:
       # If specified, use the supplied thresholds.
       self.num_thresholds = len(thresholds) + 2
       thresholds = sorted(thresholds)
@@ -2049,19 +2081,46 @@ class AUC(Metric):
 
   def _build(self, shape):
     """Initialize TP, FP, TN, and FN tensors, given the shape of the data."""
+    if self.histogram_bins is not None:
+      num_rows = self.histogram_bins
+    else:
+      num_rows = self.num_thresholds
     if self.multi_label:
       if shape.ndims != 2:
         raise ValueError('`y_true` must have rank=2 when `multi_label` is '
                          'True. Found rank %s.' % shape.ndims)
       self._num_labels = shape[1]
       variable_shape = tensor_shape.TensorShape(
-          [tensor_shape.Dimension(self.num_thresholds), self._num_labels])
+          [tensor_shape.Dimension(num_rows), self._num_labels])
 
     else:
       variable_shape = tensor_shape.TensorShape(
-          [tensor_shape.Dimension(self.num_thresholds)])
+          [tensor_shape.Dimension(num_rows)])
     self._build_input_shape = shape
     # Create metric variables
+    if self.histogram_bins is not None:
+      self.positives_histogram = self.add_weight(
+          'positives_histogram',
+          shape=variable_shape,
+          initializer=init_ops.zeros_initializer)
+      self.negatives_histogram = self.add_weight(
+          'negatives_histogram',
+          shape=variable_shape,
+          initializer=init_ops.zeros_initializer)
+    else:
+      self._build_confusion_matrix(variable_shape)
+
+    if self.multi_label:
+      with ops.init_scope():
+        # This should only be necessary for handling v1 behavior. In v2, AUC
+        # should be initialized outside of any tf.functions, and therefore in
+        # eager mode.
+        if not context.executing_eagerly():
+          K._initialize_variables(K._get_session())  # pylint: disable=protected-access
+
+    self._built = True
+
+  def _build_confusion_matrix(self, variable_shape):
     self.true_positives = self.add_weight(
         'true_positives',
         shape=variable_shape,
@@ -2079,15 +2138,13 @@ class AUC(Metric):
         shape=variable_shape,
         initializer=init_ops.zeros_initializer)
 
-    if self.multi_label:
-      with ops.init_scope():
-        # This should only be necessary for handling v1 behavior. In v2, AUC
-        # should be initialized outside of any tf.functions, and therefore in
-        # eager mode.
-        if not context.executing_eagerly():
-          K._initialize_variables(K._get_session())  # pylint: disable=protected-access
-
-    self._built = True
+  def _confusion_matrix(self):
+    """Returns the TP, TN, FP and FN at each threshold."""
+    if self.histogram_bins is not None:
+      return metrics_utils.histograms_to_confusion_matrix(
+          self.positives_histogram, self.negatives_histogram)
+    return (self.true_positives, self.true_negatives, self.false_positives,
+            self.false_negatives)
 
   def update_state(self, y_true, y_pred, sample_weight=None):
     """Accumulates confusion matrix statistics.
@@ -2112,12 +2169,9 @@ class AUC(Metric):
           (y_true, ('N', 'L'))
       ]
       if self.multi_label:
-        # TP, TN, FP, and FN should all have shape
-        # (number of thresholds, number of labels).
-        shapes.extend([(self.true_positives, ('T', 'L')),
-                       (self.true_negatives, ('T', 'L')),
-                       (self.false_positives, ('T', 'L')),
-                       (self.false_negatives, ('T', 'L'))])
+        # TP, TN, FP, and FN, or the histograms, should all have shape
+        # (number of thresholds or bins, number of labels).
+        shapes.extend([(v, ('T', 'L')) for v in self.variables])
       if self.label_weights is not None:
         # label_weights should be of length equal to the number of labels.
         shapes.append((self.label_weights, ('L',)))
@@ -2134,6 +2188,18 @@ class AUC(Metric):
     if self._from_logits:
       y_pred = activations.sigmoid(y_pred)
 
+    if self.histogram_bins is not None:
+      with ops.control_dependencies(deps):
+        return metrics_utils.update_histogram_variables(
+            self.positives_histogram,
+            self.negatives_histogram,
+            y_true,
+            y_pred,
+            self._thresholds[1:-1],
+            sample_weight=sample_weight,
+            multi_label=self.multi_label,
+            label_weights=label_weights)
+
     with ops.control_dependencies(deps):
       return metrics_utils.update_confusion_matrix_variables(
           {
@@ -2197,13 +2263,14 @@ class AUC(Metric):
     Returns:
       pr_auc: an approximation of the area under the P-R curve.
     """
-    dtp = self.true_positives[:self.num_thresholds -
-                              1] - self.true_positives[1:]
-    p = self.true_positives + self.false_positives
+    true_positives, _, false_positives, false_negatives = (
+        self._confusion_matrix())
+    dtp = true_positives[:self.num_thresholds - 1] - true_positives[1:]
+    p = true_positives + false_positives
     dp = p[:self.num_thresholds - 1] - p[1:]
     prec_slope = math_ops.div_no_nan(
         dtp, math_ops.maximum(dp, 0), name='prec_slope')
-    intercept = self.true_positives[1:] - math_ops.multiply(prec_slope, p[1:])
+    intercept = true_positives[1:] - math_ops.multiply(prec_slope, p[1:])
 
     safe_p_ratio = array_ops.where(
         math_ops.logical_and(p[:self.num_thresholds - 1] > 0, p[1:] > 0),
@@ -2215,7 +2282,7 @@ class AUC(Metric):
 
     pr_auc_increment = math_ops.div_no_nan(
         prec_slope * (dtp + intercept * math_ops.log(safe_p_ratio)),
-        math_ops.maximum(self.true_positives[1:] + self.false_negatives[1:], 0),
+        math_ops.maximum(true_positives[1:] + false_negatives[1:], 0),
         name='pr_auc_increment')
 
     if self.multi_label:
@@ -2241,17 +2308,19 @@ class AUC(Metric):
       # This use case is different and is handled separately.
       return self.interpolate_pr_auc()
 
+    true_positives, true_negatives, false_positives, false_negatives = (
+        self._confusion_matrix())
     # Set `x` and `y` values for the curves based on `curve` config.
-    recall = math_ops.div_no_nan(self.true_positives,
-                                 self.true_positives + self.false_negatives)
+    recall = math_ops.div_no_nan(true_positives,
+                                 true_positives + false_negatives)
     if self.curve == metrics_utils.AUCCurve.ROC:
-      fp_rate = math_ops.div_no_nan(self.false_positives,
-                                    self.false_positives + self.true_negatives)
+      fp_rate = math_ops.div_no_nan(false_positives,
+                                    false_positives + true_negatives)
       x = fp_rate
       y = recall
     else:  # curve == 'PR'.
       precision = math_ops.div_no_nan(
-          self.true_positives, self.true_positives + self.false_positives)
+          true_positives, true_positives + false_positives)
       x = recall
       y = precision
 
@@ -2287,13 +2356,8 @@ class AUC(Metric):
           name=self.name)
 
   def reset_states(self):
-    if self.multi_label:
-      K.batch_set_value([(v, np.zeros((self.num_thresholds, self._num_labels)))
-                         for v in self.variables])
-    else:
-      K.batch_set_value([
-          (v, np.zeros((self.num_thresholds,))) for v in self.variables
-      ])
+    K.batch_set_value(
+        [(v, np.zeros(v.shape.as_list())) for v in self.variables])
 
   def get_config(self):
     if is_tensor_or_variable(self.label_weights):
@@ -2306,10 +2370,13 @@ class AUC(Metric):
         'summation_method': self.summation_method.value,
         # We remove the endpoint thresholds as an inverse of how the thresholds
         # were initialized. This ensures that a metric initialized from this
-        # config has the same thresholds.
-        'thresholds': self.thresholds[1:-1],
+        # config has the same thresholds. With histograms, the thresholds are
+        # derived from `histogram_bins`.
+        'thresholds': (self.thresholds[1:-1]
+                       if self.histogram_bins is None else None),
         'multi_label': self.multi_label,
-        'label_weights': label_weights
+        'label_weights': label_weights,
+        'histogram_bins': self.histogram_bins,
     }
     base_config = super(AUC, self).get_config()
     return dict(list(base_config.items()) + list(config.items()))
@@ -1425,6 +1425,62 @@ class AUCTest(test.TestCase, parameterized.TestCase):
     result = auc_obj(labels, logits)
     self.assertEqual(self.evaluate(result), 0.5)
 
+  @parameterized.parameters(
+      ('ROC', 'interpolation'),
+      ('PR', 'interpolation'),
+      ('PR', 'majoring'),
+  )
+  def test_histogram_matches_thresholds(self, curve, summation_method):
+    y_pred = np.random.beta(0.5, 20., size=(1000,)).astype(np.float32)
+    y_true = (np.random.random_sample((1000,)) < 5 * y_pred).astype(np.int32)
+    sample_weight = np.random.random_sample((1000,))
+    histogram_obj = metrics.AUC(
+        histogram_bins=500, curve=curve, summation_method=summation_method)
+    thresholds_obj = metrics.AUC(
+        thresholds=histogram_obj.thresholds[1:-1],
+        curve=curve,
+        summation_method=summation_method)
+    self.assertEqual(histogram_obj.num_thresholds, 501)
+    self.assertEqual(thresholds_obj.num_thresholds, 501)
+    self.evaluate(variables.variables_initializer(histogram_obj.variables))
+    self.evaluate(variables.variables_initializer(thresholds_obj.variables))
+    for i in range(0, 1000, 250):
+      batch = slice(i, i + 250)
+      self.evaluate(histogram_obj.update_state(
+          y_true[batch], y_pred[batch], sample_weight[batch]))
+      self.evaluate(thresholds_obj.update_state(
+          y_true[batch], y_pred[batch], sample_weight[batch]))
+    self.assertAllClose(
+        self.evaluate(thresholds_obj.result()),
+        self.evaluate(histogram_obj.result()), atol=1e-5)
+
+    self.evaluate(histogram_obj.reset_states())
+    self.assertAllClose(
+        self.evaluate(histogram_obj.variables), np.zeros((2, 500)))
+
+  def test_histogram_config(self):
+    self.setup()
+    auc_obj = metrics.AUC(histogram_bins=64, curve='PR', name='auc_1')
+    auc_obj.update_state(self.y_true, self.y_pred)
+    self.assertLen(auc_obj.variables, 2)
+    self.assertEqual(auc_obj.num_thresholds, 65)
+    old_config = auc_obj.get_config()
+    self.assertDictEqual(old_config, json.loads(json.dumps(old_config)))
+
+    auc_obj2 = metrics.AUC.from_config(old_config)
+    auc_obj2.update_state(self.y_true, self.y_pred)
+    self.assertLen(auc_obj2.variables, 2)
+    self.assertEqual(auc_obj2.histogram_bins, 64)
+    self.assertDictEqual(old_config, auc_obj2.get_config())
+    self.assertAllClose(auc_obj.thresholds, auc_obj2.thresholds)
+
+  def test_invalid_histogram_bins(self):
+    with self.assertRaisesRegex(ValueError, '`histogram_bins` must be > 1.'):
+      metrics.AUC(histogram_bins=1)
+
+    with self.assertRaisesRegex(ValueError, 'can not both be set'):
+      metrics.AUC(histogram_bins=10, thresholds=[0.5])
+
 
 @combinations.generate(combinations.combine(mode=['graph', 'eager']))
 class MultiAUCTest(test.TestCase, parameterized.TestCase):
@@ -1711,6 +1767,21 @@ class MultiAUCTest(test.TestCase, parameterized.TestCase):
       auc_obj.reset_states()
       self.assertAllEqual(auc_obj.true_positives, np.zeros((5, 2)))
 
+  def test_histogram_label_weights(self):
+    self.setup()
+    histogram_obj = metrics.AUC(
+        histogram_bins=16, multi_label=True, label_weights=[0.75, 0.25])
+    thresholds_obj = metrics.AUC(
+        thresholds=histogram_obj.thresholds[1:-1],
+        multi_label=True,
+        label_weights=[0.75, 0.25])
+    self.evaluate(variables.variables_initializer(histogram_obj.variables))
+    self.evaluate(variables.variables_initializer(thresholds_obj.variables))
+    self.assertAllClose(
+        self.evaluate(thresholds_obj(self.y_true_good, self.y_pred)),
+        self.evaluate(histogram_obj(self.y_true_good, self.y_pred)))
+    self.assertEqual(histogram_obj.positives_histogram.shape, (16, 2))
+
 
 if __name__ == '__main__':
   test.main()
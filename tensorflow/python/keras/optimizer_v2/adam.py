@@ -63,6 +63,9 @@ class Adam(optimizer_v2.OptimizerV2):
       the paper "On the Convergence of Adam and beyond". Defaults to `False`.
     name: Optional name for the operations created when applying gradients.
       Defaults to `"Adam"`.
+    lazy_sparse_updates: Boolean. If `True`, sparse gradients only update the
+      rows of the variable and of its moments that appear in the gradient (see
+      the notes below). Defaults to `False`.
     **kwargs: Keyword arguments. Allowed to be one of
       `"clipnorm"` or `"clipvalue"`.
       `"clipnorm"` (float) clips gradients by norm; `"clipvalue"` (float) clips
@@ -99,10 +102,20 @@ class Adam(optimizer_v2.OptimizerV2):
   to zero). Momentum decay (beta1) is also applied to the entire momentum
   accumulator. This means that the sparse behavior is equivalent to the dense
   behavior (in contrast to some momentum implementations which ignore momentum
-  unless a variable slice was actually used).
+  unless a variable slice was actually used). Each sparse update therefore
+  reads and writes the whole variable and its moments, which dominates the
+  cost of training large embedding tables.
+
+  With `lazy_sparse_updates=True`, sparse updates instead only read and write
+  the rows of the variable and of its moments that appear in the gradient:
+  the moments of the other rows are not decayed, and these rows are not
+  updated. This usually works well in practice for embeddings, at a cost
+  proportional to the number of rows in the batch rather than to the size of
+  the table.
   """
 
   _HAS_AGGREGATE_GRAD = True
+  _HAS_GROUPED_APPLY = True
 
   def __init__(self,
                learning_rate=0.001,
@@ -111,6 +124,7 @@ class Adam(optimizer_v2.OptimizerV2):
                epsilon=1e-7,
                amsgrad=False,
                name='Adam',
+               lazy_sparse_updates=False,
                **kwargs):
     super(Adam, self).__init__(name, **kwargs)
     self._set_hyper('learning_rate', kwargs.get('lr', learning_rate))
@@ -119,6 +133,7 @@ class Adam(optimizer_v2.OptimizerV2):
     self._set_hyper('beta_2', beta_2)
     self.epsilon = epsilon or backend_config.epsilon()
     self.amsgrad = amsgrad
+    self.lazy_sparse_updates = lazy_sparse_updates
 
   def _create_slots(self, var_list):
     # Create slots for the first and second moments.
@@ -204,6 +219,8 @@ class Adam(optimizer_v2.OptimizerV2):
     var_device, var_dtype = var.device, var.dtype.base_dtype
     coefficients = ((apply_state or {}).get((var_device, var_dtype))
                     or self._fallback_apply_state(var_device, var_dtype))
+    if self.lazy_sparse_updates:
+      return self._resource_apply_sparse_lazy(grad, var, indices, coefficients)
 
     # m_t = beta1 * m + (1 - beta1) * g_t
     m = self.get_slot(var, 'm')
@@ -240,6 +257,38 @@ class Adam(optimizer_v2.OptimizerV2):
           use_locking=self._use_locking)
       return control_flow_ops.group(*[var_update, m_t, v_t, v_hat_t])
 
+  def _resource_apply_sparse_lazy(self, grad, var, indices, coefficients):
+    """Updates only the rows of `var` and of its slots given by `indices`."""
+    # m_t = beta1 * m + (1 - beta1) * g_t, on the rows in `indices` only.
+    m = self.get_slot(var, 'm')
+    m_t_slices = (array_ops.gather(m, indices) * coefficients['beta_1_t'] +
+                  grad * coefficients['one_minus_beta_1_t'])
+    m_update = state_ops.scatter_update(
+        m, indices, m_t_slices, use_locking=self._use_locking)
+
+    # v_t = beta2 * v + (1 - beta2) * (g_t * g_t), on the rows in `indices`.
+    v = self.get_slot(var, 'v')
+    v_t_slices = (array_ops.gather(v, indices) * coefficients['beta_2_t'] +
+                  (grad * grad) * coefficients['one_minus_beta_2_t'])
+    v_update = state_ops.scatter_update(
+        v, indices, v_t_slices, use_locking=self._use_locking)
+    updates = [m_update, v_update]
+
+    if self.amsgrad:
+      v_hat = self.get_slot(var, 'vhat')
+      v_t_slices = math_ops.maximum(array_ops.gather(v_hat, indices),
+                                    v_t_slices)
+      updates.append(state_ops.scatter_update(
+          v_hat, indices, v_t_slices, use_locking=self._use_locking))
+
+    var_update = state_ops.scatter_sub(
+        var, indices,
+        coefficients['lr'] * m_t_slices /
+        (math_ops.sqrt(v_t_slices) + coefficients['epsilon']),
+        use_locking=self._use_locking)
+    updates.append(var_update)
+    return control_flow_ops.group(*updates)
+
   def get_config(self):
     config = super(Adam, self).get_config()
     config.update({
@@ -250,6 +299,8 @@ class Adam(optimizer_v2.OptimizerV2):
         'epsilon': self.epsilon,
         'amsgrad': self.amsgrad,
     })
+    if self.lazy_sparse_updates:
+      config['lazy_sparse_updates'] = True
     return config
 
 
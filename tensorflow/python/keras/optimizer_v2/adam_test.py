@@ -99,6 +99,31 @@ def adam_sparse_update_numpy_amsgrad(param,
   return param_t, m_t, v_t, vhat_t
 
 
+def adam_lazy_sparse_update_numpy(param,
+                                  indices,
+                                  g_t,
+                                  t,
+                                  m,
+                                  v,
+                                  vhat=None,
+                                  lr=0.001,
+                                  beta1=0.9,
+                                  beta2=0.999,
+                                  epsilon=1e-7):
+  m_t, v_t, param_t = np.copy(m), np.copy(v), np.copy(param)
+  lr_t = lr * np.sqrt(1 - beta2**(t + 1)) / (1 - beta1**(t + 1))
+  m_t[indices] = beta1 * m[indices] + (1 - beta1) * g_t
+  v_t[indices] = beta2 * v[indices] + (1 - beta2) * g_t * g_t
+  denom = v_t[indices]
+  if vhat is not None:
+    vhat = np.copy(vhat)
+    vhat[indices] = np.maximum(vhat[indices], v_t[indices])
+    denom = vhat[indices]
+  param_t[indices] = param[indices] - lr_t * m_t[indices] / (
+      np.sqrt(denom) + epsilon)
+  return param_t, m_t, v_t, vhat
+
+
 def get_beta_accumulators(opt, dtype):
   local_step = math_ops.cast(opt.iterations + 1, dtype)
   beta_1_t = math_ops.cast(opt._get_hyper("beta_1"), dtype)
@@ -201,6 +226,50 @@ class AdamOptimizerTest(test.TestCase, parameterized.TestCase):
           self.assertAllClose(aggregated_update_var,
                               self.evaluate(repeated_index_update_var))
 
+  @combinations.generate(
+      combinations.combine(mode=["graph", "eager"], amsgrad=[False, True]))
+  def testSparseLazy(self, amsgrad):
+    for dtype in [dtypes.float32, dtypes.float64]:
+      with self.cached_session():
+        var_np = np.array([[1.0, 1.5], [2.0, 2.5], [3.0, 3.5]],
+                          dtype=dtype.as_numpy_dtype)
+        m = np.zeros_like(var_np)
+        v = np.zeros_like(var_np)
+        vhat = np.zeros_like(var_np) if amsgrad else None
+        var = variables.Variable(var_np)
+        # Row 2 appears twice and row 1 never appears.
+        grad = ops.IndexedSlices(
+            constant_op.constant([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+                                 dtype=dtype),
+            constant_op.constant([2, 0, 2]), constant_op.constant([3, 2]))
+        indices_np = np.array([0, 2])
+        grad_np = np.array([[0.3, 0.4], [0.6, 0.8]], dtype=dtype.as_numpy_dtype)
+        opt = adam.Adam(amsgrad=amsgrad, lazy_sparse_updates=True)
+        if not context.executing_eagerly():
+          update = opt.apply_gradients([(grad, var)])
+        self.evaluate(variables.global_variables_initializer())
+        for t in range(3):
+          if not context.executing_eagerly():
+            self.evaluate(update)
+          else:
+            opt.apply_gradients([(grad, var)])
+          var_np, m, v, vhat = adam_lazy_sparse_update_numpy(
+              var_np, indices_np, grad_np, t, m, v, vhat)
+          self.assertAllCloseAccordingToType(var_np, self.evaluate(var))
+          self.assertAllCloseAccordingToType(
+              m, self.evaluate(opt.get_slot(var, "m")))
+          self.assertAllCloseAccordingToType(
+              v, self.evaluate(opt.get_slot(var, "v")))
+        # The row without gradient is left untouched.
+        self.assertAllClose([2.0, 2.5], self.evaluate(var)[1])
+
+  def testLazySparseUpdatesConfig(self):
+    opt = adam.Adam(lazy_sparse_updates=True)
+    self.assertTrue(opt.get_config()["lazy_sparse_updates"])
+    self.assertTrue(
+        adam.Adam.from_config(opt.get_config()).lazy_sparse_updates)
+    self.assertNotIn("lazy_sparse_updates", adam.Adam().get_config())
+
   def doTestBasic(self, use_callable_params=False):
     for i, dtype in enumerate([dtypes.half, dtypes.float32, dtypes.float64]):
       with self.cached_session(use_gpu=True):
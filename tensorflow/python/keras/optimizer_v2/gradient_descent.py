@@ -99,6 +99,7 @@ class SGD(optimizer_v2.OptimizerV2):
   """
 
   _HAS_AGGREGATE_GRAD = True
+  _HAS_GROUPED_APPLY = True
 
   def __init__(self,
                learning_rate=0.01,
@@ -20,6 +20,7 @@ from __future__ import division
 from __future__ import print_function
 
 import abc
+import collections
 import contextlib
 import functools
 
@@ -86,6 +87,33 @@ def _deduplicate_indexed_slices(values, indices):
   return (summed_values, unique_indices)
 
 
+def _group_dense_grads_and_vars(grads_and_vars):
+  """Groups dense gradients of unconstrained variables by device and dtype.
+
+  Args:
+    grads_and_vars: List of (gradient, variable) pairs.
+
+  Returns:
+    A tuple of (`groups`, `remaining`) where `groups` is an ordered dict mapping
+    (device, dtype) to a pair of lists (gradients, variables), and `remaining`
+    contains the pairs which can not be grouped (sparse gradients, variables
+    with a constraint or anything that is not a variable), in their original
+    order.
+  """
+  groups = collections.OrderedDict()
+  remaining = []
+  for grad, var in grads_and_vars:
+    if (isinstance(grad, ops.Tensor) and not isinstance(var, ops.Tensor) and
+        getattr(var, "constraint", None) is None):
+      grads, var_list = groups.setdefault(
+          (var.device, var.dtype.base_dtype), ([], []))
+      grads.append(grad)
+      var_list.append(var)
+    else:
+      remaining.append((grad, var))
+  return groups, remaining
+
+
 class NullContextmanager(object):
 
   def __init__(self, *args, **kwargs):
@@ -316,6 +344,13 @@ class OptimizerV2(trackable.Trackable):
   # Note: This attribute will likely be removed in an upcoming release.
   _HAS_AGGREGATE_GRAD = False
 
+  # Subclasses whose `_resource_apply_dense` only touches the variable and its
+  # slots can set this to True. Outside of a `tf.distribute.Strategy`, dense
+  # updates are then issued per (device, dtype) group through
+  # `_resource_apply_dense_group` instead of going through
+  # `distribution.extended.update` once per variable.
+  _HAS_GROUPED_APPLY = False
+
   def __init__(self,
                name,
                gradient_aggregator=None,
@@ -703,6 +738,14 @@ class OptimizerV2(trackable.Trackable):
     eagerly_outside_functions = ops.executing_eagerly_outside_functions()
     update_ops = []
     with name_scope_only_in_function_or_graph(name or self._name):
+      if self._HAS_GROUPED_APPLY and not distribute_ctx.has_strategy():
+        dense_groups, grads_and_vars = _group_dense_grads_and_vars(
+            grads_and_vars)
+        for grads, var_list in dense_groups.values():
+          with name_scope_only_in_function_or_graph("update"):
+            update_ops.extend(
+                self._resource_apply_dense_group(grads, var_list, apply_state))
+
       for grad, var in grads_and_vars:
         # TODO(crccw): It's not allowed to assign PerReplica value to
         # MirroredVariable.  Remove this after we relax this restriction.
@@ -1247,6 +1290,35 @@ class OptimizerV2(trackable.Trackable):
     """
     raise NotImplementedError("Must be implemented in subclasses.")
 
+  def _resource_apply_dense_group(self, grads, var_list, apply_state):
+    """Add ops to apply dense gradients to a group of variables.
+
+    All variables in `var_list` live on the same device, have the same dtype
+    and no constraint. By default this calls `_resource_apply_dense` for each
+    variable, opening a single device scope for the whole group when executing
+    eagerly.
+
+    Args:
+      grads: a list of `Tensor`s representing the gradients.
+      var_list: a list of variables to be updated, matching `grads`.
+      apply_state: A dict which is used across multiple apply calls.
+
+    Returns:
+      A list of `Operation`s which update the values of the variables.
+    """
+    apply_kwargs = {}
+    if "apply_state" in self._dense_apply_args:
+      apply_kwargs["apply_state"] = apply_state
+    if context.executing_eagerly():
+      with ops.device(var_list[0].device):
+        return [self._resource_apply_dense(grad, var, **apply_kwargs)
+                for grad, var in zip(grads, var_list)]
+    update_ops = []
+    for grad, var in zip(grads, var_list):
+      with ops.colocate_with(var):
+        update_ops.append(self._resource_apply_dense(grad, var, **apply_kwargs))
+    return update_ops
+
   def _resource_apply_sparse_duplicate_indices(self, grad, handle, indices,
                                                **kwargs):
     """Add ops to apply sparse gradients to `handle`, with repeated indices.
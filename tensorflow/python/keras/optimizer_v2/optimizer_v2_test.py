@@ -681,6 +681,51 @@ class OptimizerTest(test.TestCase, parameterized.TestCase):
     self.evaluate(opt_op)
     self.assertAllClose([0.7, 1.7], self.evaluate(var))
 
+  @combinations.generate(
+      combinations.combine(
+          mode=['graph', 'eager'],
+          optimizer_fn=[
+              lambda: gradient_descent.SGD(0.1, momentum=0.9),
+              lambda: adam.Adam(0.1, amsgrad=True),
+              lambda: rmsprop.RMSprop(0.1, centered=True),
+          ]))
+  def testGroupedApplyMatchesPerVariableApply(self, optimizer_fn):
+    constraint = lambda x: clip_ops.clip_by_value(x, -1., 1.)
+
+    def make_vars():
+      return [variables.Variable([1., 2.]),
+              variables.Variable([3., 4.], dtype=dtypes.float64),
+              variables.Variable([[5., 6.], [7., 8.]]),
+              variables.Variable([0.5, 0.6], constraint=constraint),
+              variables.Variable([[1., 2.], [3., 4.]])]
+
+    def make_grads():
+      return [constant_op.constant([0.1, 0.2]),
+              constant_op.constant([0.3, 0.4], dtype=dtypes.float64),
+              constant_op.constant([[0.5, 0.6], [0.7, 0.8]]),
+              constant_op.constant([-0.5, 0.5]),
+              ops.IndexedSlices(
+                  constant_op.constant([[0.1, 0.2]]),
+                  constant_op.constant([1]),
+                  constant_op.constant([2, 2]))]
+
+    with testing_utils.use_gpu():
+      results = []
+      for grouped in (True, False):
+        var_list = make_vars()
+        opt = optimizer_fn()
+        opt._HAS_GROUPED_APPLY = grouped
+        opt_op = opt.apply_gradients(zip(make_grads(), var_list))
+        self.evaluate(variables.global_variables_initializer())
+        for _ in range(3):
+          if context.executing_eagerly():
+            opt.apply_gradients(zip(make_grads(), var_list))
+          else:
+            self.evaluate(opt_op)
+        results.append(self.evaluate(var_list))
+    for grouped_value, value in zip(*results):
+      self.assertAllClose(value, grouped_value)
+
   @combinations.generate(combinations.combine(mode=['eager']))
   def testRestoringIterationsWithoutAnOptimizer(self):
     opt = gradient_descent.SGD(3.0)
@@ -94,6 +94,7 @@ class RMSprop(optimizer_v2.OptimizerV2):
   """
 
   _HAS_AGGREGATE_GRAD = True
+  _HAS_GROUPED_APPLY = True
 
   def __init__(self,
                learning_rate=0.001,
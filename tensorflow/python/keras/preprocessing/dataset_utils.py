@@ -18,6 +18,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import json
 import multiprocessing
 import os
 
@@ -27,6 +28,10 @@ from tensorflow.python.data.ops import dataset_ops
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import math_ops
 
+# Name of the file index cache written at the root of indexed directories.
+FILE_INDEX_CACHE_NAME = '.keras_file_index.json'
+_FILE_INDEX_CACHE_VERSION = 1
+
 
 def index_directory(directory,
                     labels,
@@ -34,7 +39,8 @@ def index_directory(directory,
                     class_names=None,
                     shuffle=True,
                     seed=None,
-                    follow_links=False):
+                    follow_links=False,
+                    cache_file_index=False):
   """Make list of all files in the subdirs of `directory`, with their labels.
 
   Args:
@@ -55,6 +61,13 @@ def index_directory(directory,
         If set to False, sorts the data in alphanumeric order.
     seed: Optional random seed for shuffling.
     follow_links: Whether to visits subdirectories pointed to by symlinks.
+    cache_file_index: Whether to cache the list of files in a file named
+        `FILE_INDEX_CACHE_NAME` at the root of `directory`. The cached list of
+        files of a subdirectory is reused as long as the modification times of
+        the directories it was listed from are unchanged, so that only the
+        subdirectories in which files were added or removed are listed again.
+        If the cache cannot be written (e.g. the directory is read-only),
+        files are indexed as usual.
 
   Returns:
     tuple (file_paths, labels, class_names).
@@ -82,21 +95,46 @@ def index_directory(directory,
             (subdirs, class_names))
   class_indices = dict(zip(class_names, range(len(class_names))))
 
+  cache = None
+  if cache_file_index:
+    cache_path = os.path.join(directory, FILE_INDEX_CACHE_NAME)
+    cache = load_file_index_cache(cache_path, formats, follow_links)
+    if cache is None:
+      # Create the cache file before listing any file: adding it to
+      # `directory` modifies the modification time of `directory`.
+      cache = {'subdirs': {}}
+      if not _touch(cache_path):
+        cache_file_index = False
+
   # Build an index of the files
   # in the different class subfolders.
   pool = multiprocessing.pool.ThreadPool()
   results = []
   filenames = []
 
-  for dirpath in (os.path.join(directory, subdir) for subdir in subdirs):
-    results.append(
-        pool.apply_async(index_subdirectory,
-                         (dirpath, class_indices, follow_links, formats)))
+  for subdir in subdirs:
+    dirpath = os.path.join(directory, subdir)
+    if cache_file_index:
+      results.append(
+          pool.apply_async(
+              index_subdirectory_with_cache,
+              (directory, subdir, class_indices, follow_links, formats,
+               cache['subdirs'].get(subdir))))
+    else:
+      results.append(
+          pool.apply_async(index_subdirectory,
+                           (dirpath, class_indices, follow_links, formats)))
   labels_list = []
-  for res in results:
-    partial_filenames, partial_labels = res.get()
+  cache_entries = {}
+  for subdir, res in zip(subdirs, results):
+    if cache_file_index:
+      partial_filenames, partial_labels, cache_entries[subdir] = res.get()
+    else:
+      partial_filenames, partial_labels = res.get()
     labels_list.append(partial_labels)
     filenames += partial_filenames
+  if cache_file_index and cache_entries != cache['subdirs']:
+    save_file_index_cache(cache_path, formats, follow_links, cache_entries)
   if labels not in ('inferred', None):
     if len(labels) != len(filenames):
       raise ValueError('Expected the lengths of `labels` to match the number '
@@ -130,15 +168,18 @@ def index_directory(directory,
   return file_paths, labels, class_names
 
 
-def iter_valid_files(directory, follow_links, formats):
+def iter_valid_files(directory, follow_links, formats, dir_mtimes=None):
   walk = os.walk(directory, followlinks=follow_links)
   for root, _, files in sorted(walk, key=lambda x: x[0]):
+    if dir_mtimes is not None:
+      dir_mtimes[root] = os.stat(root).st_mtime
     for fname in sorted(files):
       if fname.lower().endswith(formats):
         yield root, fname
 
 
-def index_subdirectory(directory, class_indices, follow_links, formats):
+def index_subdirectory(directory, class_indices, follow_links, formats,
+                       dir_mtimes=None):
   """Recursively walks directory and list image paths and their class index.
 
   Args:
@@ -147,6 +188,8 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
     follow_links: boolean, whether to recursively follow subdirectories
       (if False, we only list top-level images in `directory`).
     formats: Allowlist of file extensions to index (e.g. ".jpg", ".txt").
+    dir_mtimes: Optional dict, filled with the modification time of every
+      directory that was listed.
 
   Returns:
     tuple `(filenames, labels)`. `filenames` is a list of relative file
@@ -154,7 +197,7 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
       files.
   """
   dirname = os.path.basename(directory)
-  valid_files = iter_valid_files(directory, follow_links, formats)
+  valid_files = iter_valid_files(directory, follow_links, formats, dir_mtimes)
   labels = []
   filenames = []
   for root, fname in valid_files:
@@ -166,6 +209,85 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
   return filenames, labels
 
 
+def index_subdirectory_with_cache(directory, subdir, class_indices,
+                                  follow_links, formats, cache_entry):
+  """Same as `index_subdirectory`, but reuses a valid cached list of files.
+
+  Args:
+    directory: string, root directory of the dataset.
+    subdir: string, subdirectory of `directory` to index.
+    class_indices: dict mapping class names to their index.
+    follow_links: boolean, whether to recursively follow subdirectories.
+    formats: Allowlist of file extensions to index (e.g. ".jpg", ".txt").
+    cache_entry: The cache entry of `subdir`, or None.
+
+  Returns:
+    tuple `(filenames, labels, cache_entry)`, where `cache_entry` is the
+      (possibly updated) cache entry of `subdir`.
+  """
+  dirpath = os.path.join(directory, subdir)
+  if cache_entry is not None and _mtimes_match(directory,
+                                               cache_entry['mtimes']):
+    filenames = cache_entry['filenames']
+    labels = [class_indices[os.path.basename(dirpath)]] * len(filenames)
+    return filenames, labels, cache_entry
+  dir_mtimes = {}
+  filenames, labels = index_subdirectory(
+      dirpath, class_indices, follow_links, formats, dir_mtimes)
+  mtimes = {os.path.relpath(path, directory): mtime
+            for path, mtime in dir_mtimes.items()}
+  return filenames, labels, {'filenames': filenames, 'mtimes': mtimes}
+
+
+def load_file_index_cache(cache_path, formats, follow_links):
+  """Loads a file index cache, returns None if missing or incompatible."""
+  try:
+    with open(cache_path) as f:
+      cache = json.load(f)
+  except (IOError, OSError, ValueError):
+    return None
+  if (not isinstance(cache, dict) or
+      cache.get('version') != _FILE_INDEX_CACHE_VERSION or
+      cache.get('formats') != sorted(formats) or
+      cache.get('follow_links') != bool(follow_links)):
+    return None
+  return cache
+
+
+def save_file_index_cache(cache_path, formats, follow_links, subdirs):
+  """Writes a file index cache, silently gives up on I/O errors."""
+  cache = {
+      'version': _FILE_INDEX_CACHE_VERSION,
+      'formats': sorted(formats),
+      'follow_links': bool(follow_links),
+      'subdirs': subdirs,
+  }
+  try:
+    with open(cache_path, 'w') as f:
+      json.dump(cache, f)
+  except (IOError, OSError):
+    pass
+
+
+def _mtimes_match(directory, mtimes):
+  for path, mtime in mtimes.items():
+    try:
+      if os.stat(os.path.join(directory, path)).st_mtime != mtime:
+        return False
+    except OSError:
+      return False
+  return True
+
+
+def _touch(path):
+  try:
+    with open(path, 'a'):
+      pass
+  except (IOError, OSError):
+    return False
+  return True
+
+
 def get_training_or_validation_split(samples, labels, validation_split, subset):
   """Potentially restict samples & labels to a training or validation split.
 
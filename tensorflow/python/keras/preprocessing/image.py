@@ -118,7 +118,35 @@ def smart_resize(x, size, interpolation='bilinear'):
           'Expected an image array with shape `(height, width, channels)`, but '
           'got input with incorrect rank, of shape %s' % (img.shape,))
   shape = array_ops.shape(img)
-  height, width = shape[0], shape[1]
+  crop_box_hstart, crop_box_wstart, crop_height, crop_width = (
+      smart_resize_crop_box(shape[0], shape[1], size))
+
+  crop_box_start = array_ops.stack([crop_box_hstart, crop_box_wstart, 0])
+  crop_box_size = array_ops.stack([crop_height, crop_width, -1])
+
+  img = array_ops.slice(img, crop_box_start, crop_box_size)
+  img = image_ops.resize_images_v2(
+      images=img,
+      size=size,
+      method=interpolation)
+  if isinstance(x, np.ndarray):
+    return img.numpy()
+  return img
+
+
+def smart_resize_crop_box(height, width, size):
+  """Returns the crop box used by `smart_resize`.
+
+  Args:
+    height: Scalar int32 tensor, height of the image.
+    width: Scalar int32 tensor, width of the image.
+    size: Tuple of `(height, width)` integer. Target size.
+
+  Returns:
+    Tuple of scalar int32 tensors `(offset_height, offset_width, crop_height,
+    crop_width)`: the largest centered crop of the image that has the same
+    aspect ratio as `size`.
+  """
   target_height, target_width = size
 
   crop_height = math_ops.cast(
@@ -134,18 +162,7 @@ def smart_resize(x, size, interpolation='bilinear'):
       math_ops.cast(height - crop_height, 'float32') / 2, 'int32')
   crop_box_wstart = math_ops.cast(
       math_ops.cast(width - crop_width, 'float32') / 2, 'int32')
-
-  crop_box_start = array_ops.stack([crop_box_hstart, crop_box_wstart, 0])
-  crop_box_size = array_ops.stack([crop_height, crop_width, -1])
-
-  img = array_ops.slice(img, crop_box_start, crop_box_size)
-  img = image_ops.resize_images_v2(
-      images=img,
-      size=size,
-      method=interpolation)
-  if isinstance(x, np.ndarray):
-    return img.numpy()
-  return img
+  return crop_box_hstart, crop_box_wstart, crop_height, crop_width
 
 
 @keras_export('keras.preprocessing.image.array_to_img')
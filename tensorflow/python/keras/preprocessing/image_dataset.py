@@ -24,6 +24,8 @@ from tensorflow.python.data.ops import dataset_ops
 from tensorflow.python.keras.layers.preprocessing import image_preprocessing
 from tensorflow.python.keras.preprocessing import dataset_utils
 from tensorflow.python.keras.preprocessing import image as keras_image_ops
+from tensorflow.python.ops import array_ops
+from tensorflow.python.ops import control_flow_ops
 from tensorflow.python.ops import image_ops
 from tensorflow.python.ops import io_ops
 from tensorflow.python.util.tf_export import keras_export
@@ -46,7 +48,8 @@ def image_dataset_from_directory(directory,
                                  subset=None,
                                  interpolation='bilinear',
                                  follow_links=False,
-                                 smart_resize=False):
+                                 smart_resize=False,
+                                 cache_file_index=False):
   """Generates a `tf.data.Dataset` from image files in a directory.
 
   If your directory structure is:
@@ -119,7 +122,12 @@ def image_dataset_from_directory(directory,
       `tf.keras.preprocessing.image.smart_resize`, which preserves the aspect
       ratio of the original image by using a mixture of resizing and cropping.
       If False (default), the resizing function is `tf.image.resize`, which
-      does not preserve aspect ratio.
+      does not preserve aspect ratio. JPEG images are then only decoded within
+      the crop window when `color_mode` is "grayscale" or "rgb".
+    cache_file_index: Whether to cache the list of image files in a hidden file
+      at the root of `directory`, to speed up subsequent calls on large
+      directories. The cached list of files of a subdirectory is reused until
+      a file or directory is added to or removed from it. Defaults to False.
 
   Returns:
     A `tf.data.Dataset` object.
@@ -190,7 +198,8 @@ def image_dataset_from_directory(directory,
       class_names=class_names,
       shuffle=shuffle,
       seed=seed,
-      follow_links=follow_links)
+      follow_links=follow_links,
+      cache_file_index=cache_file_index)
 
   if label_mode == 'binary' and len(class_names) != 2:
     raise ValueError(
@@ -231,11 +240,11 @@ def paths_and_labels_to_dataset(image_paths,
                                 interpolation,
                                 smart_resize=False):
   """Constructs a dataset of images and labels."""
-  # TODO(fchollet): consider making num_parallel_calls settable
   path_ds = dataset_ops.Dataset.from_tensor_slices(image_paths)
   args = (image_size, num_channels, interpolation, smart_resize)
   img_ds = path_ds.map(
-      lambda x: load_image(x, *args))
+      lambda x: load_image(x, *args),
+      num_parallel_calls=dataset_ops.AUTOTUNE)
   if label_mode:
     label_ds = dataset_utils.labels_to_dataset(labels, label_mode, num_classes)
     img_ds = dataset_ops.Dataset.zip((img_ds, label_ds))
@@ -245,13 +254,31 @@ def paths_and_labels_to_dataset(image_paths,
 def load_image(path, image_size, num_channels, interpolation,
                smart_resize=False):
   """Load an image from a path and resize it."""
-  img = io_ops.read_file(path)
-  img = image_ops.decode_image(
-      img, channels=num_channels, expand_animations=False)
-  if smart_resize:
-    img = keras_image_ops.smart_resize(img, image_size,
-                                       interpolation=interpolation)
+  contents = io_ops.read_file(path)
+
+  def decode_and_resize():
+    img = image_ops.decode_image(
+        contents, channels=num_channels, expand_animations=False)
+    if smart_resize:
+      return keras_image_ops.smart_resize(img, image_size,
+                                          interpolation=interpolation)
+    return image_ops.resize_images_v2(img, image_size, method=interpolation)
+
+  def decode_and_crop_jpeg_and_resize():
+    # Only decodes the part of the image kept by `smart_resize`.
+    shape = image_ops.extract_jpeg_shape(contents)
+    crop_window = array_ops.stack(
+        keras_image_ops.smart_resize_crop_box(shape[0], shape[1], image_size))
+    img = image_ops.decode_and_crop_jpeg(
+        contents, crop_window, channels=num_channels)
+    return image_ops.resize_images_v2(img, image_size, method=interpolation)
+
+  # JPEG decoding does not support 4 channels.
+  if smart_resize and num_channels in (1, 3):
+    img = control_flow_ops.cond(
+        image_ops.is_jpeg(contents), decode_and_crop_jpeg_and_resize,
+        decode_and_resize)
   else:
-    img = image_ops.resize_images_v2(img, image_size, method=interpolation)
+    img = decode_and_resize()
   img.set_shape((image_size[0], image_size[1], num_channels))
   return img
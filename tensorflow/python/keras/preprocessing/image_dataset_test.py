@@ -27,7 +27,10 @@ from tensorflow.python.compat import v2_compat
 from tensorflow.python.eager import def_function
 from tensorflow.python.keras import keras_parameterized
 from tensorflow.python.keras.preprocessing import image as image_preproc
+from tensorflow.python.keras.preprocessing import dataset_utils
 from tensorflow.python.keras.preprocessing import image_dataset
+from tensorflow.python.ops import image_ops
+from tensorflow.python.ops import io_ops
 from tensorflow.python.platform import test
 
 try:
@@ -295,6 +298,44 @@ class ImageDatasetFromDirectoryTest(keras_parameterized.TestCase):
     self.assertLen(batch, 2)
     self.assertEqual(batch[0].shape, (5, 18, 18, 3))
 
+  def test_smart_resize_jpeg_decodes_crop_window(self):
+    if PIL is None:
+      return  # Skip test if PIL is not available.
+
+    directory = self._prepare_directory(num_classes=1, count=1)
+    path = os.path.join(directory, 'class_0', 'image_0.jpg')
+    for image_size in [(18, 12), (12, 18)]:
+      img = image_dataset.load_image(
+          path, image_size, 3, 'bilinear', smart_resize=True)
+      expected = image_preproc.smart_resize(
+          image_ops.decode_image(io_ops.read_file(path), channels=3),
+          image_size)
+      self.assertAllClose(expected, img)
+
+  def test_image_dataset_from_directory_cache_file_index(self):
+    if PIL is None:
+      return  # Skip test if PIL is not available.
+
+    directory = self._prepare_directory(num_classes=2, count=8)
+    dataset = image_dataset.image_dataset_from_directory(
+        directory, image_size=(18, 18), shuffle=False, cache_file_index=True)
+    self.assertTrue(os.path.exists(
+        os.path.join(directory, dataset_utils.FILE_INDEX_CACHE_NAME)))
+    self.assertLen(dataset.file_paths, 8)
+
+    cached_dataset = image_dataset.image_dataset_from_directory(
+        directory, image_size=(18, 18), shuffle=False, cache_file_index=True)
+    self.assertEqual(dataset.file_paths, cached_dataset.file_paths)
+
+    # Adding a file invalidates the cached index of its class.
+    self._get_images(1)[0].save(
+        os.path.join(directory, 'class_1', 'image_new.jpg'))
+    dataset = image_dataset.image_dataset_from_directory(
+        directory, image_size=(18, 18), shuffle=False, cache_file_index=True)
+    self.assertLen(dataset.file_paths, 9)
+    labels = np.concatenate([y for _, y in dataset])
+    self.assertEqual(list(labels), [0] * 4 + [1] * 5)
+
   def test_image_dataset_from_directory_errors(self):
     if PIL is None:
       return  # Skip test if PIL is not available.
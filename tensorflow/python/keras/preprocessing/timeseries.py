@@ -21,8 +21,9 @@ from __future__ import print_function
 import numpy as np
 
 from tensorflow.python.data.ops import dataset_ops
-from tensorflow.python.ops import array_ops
-from tensorflow.python.ops import math_ops
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import tensor_shape
+from tensorflow.python.ops import script_ops
 from tensorflow.python.util.tf_export import keras_export
 
 
@@ -49,7 +50,11 @@ def timeseries_dataset_from_array(
     data: Numpy array or eager tensor
       containing consecutive data points (timesteps).
       Axis 0 is expected to be the time dimension.
+      If `data` is a `np.memmap` (e.g. obtained with
+      `np.load(path, mmap_mode='r')`), windows are read from disk as they
+      are needed instead of loading the whole array in memory.
     targets: Targets corresponding to timesteps in `data`.
+      Can be a `np.memmap` as well.
       `targets[i]` should be the target
       corresponding to the window that starts at index `i`
       (see example 2 below).
@@ -192,28 +197,18 @@ def timeseries_dataset_from_array(
     rng = np.random.RandomState(seed)
     rng.shuffle(start_positions)
 
-  sequence_length = math_ops.cast(sequence_length, dtype=index_dtype)
-  sampling_rate = math_ops.cast(sampling_rate, dtype=index_dtype)
-
   positions_ds = dataset_ops.Dataset.from_tensors(start_positions).repeat()
 
-  # For each initial window position, generates indices of the window elements
-  indices = dataset_ops.Dataset.zip(
+  # For each initial window position, generates the start of the window.
+  starts = dataset_ops.Dataset.zip(
       (dataset_ops.Dataset.range(len(start_positions)), positions_ds)).map(
-          lambda i, positions: math_ops.range(  # pylint: disable=g-long-lambda
-              positions[i],
-              positions[i] + sequence_length * sampling_rate,
-              sampling_rate),
+          lambda i, positions: positions[i],
           num_parallel_calls=dataset_ops.AUTOTUNE)
 
-  dataset = sequences_from_indices(data, indices, start_index, end_index)
+  dataset = sequences_from_starts(data, starts, start_index, end_index,
+                                  sequence_length, sampling_rate)
   if targets is not None:
-    indices = dataset_ops.Dataset.zip(
-        (dataset_ops.Dataset.range(len(start_positions)), positions_ds)).map(
-            lambda i, positions: positions[i],
-            num_parallel_calls=dataset_ops.AUTOTUNE)
-    target_ds = sequences_from_indices(
-        targets, indices, start_index, end_index)
+    target_ds = sequences_from_starts(targets, starts, start_index, end_index)
     dataset = dataset_ops.Dataset.zip((dataset, target_ds))
   if shuffle:
     # Shuffle locally at each iteration
@@ -222,9 +217,62 @@ def timeseries_dataset_from_array(
   return dataset
 
 
-def sequences_from_indices(array, indices_ds, start_index, end_index):
-  dataset = dataset_ops.Dataset.from_tensors(array[start_index : end_index])
-  dataset = dataset_ops.Dataset.zip((dataset.repeat(), indices_ds)).map(
-      lambda steps, inds: array_ops.gather(steps, inds),  # pylint: disable=unnecessary-lambda
-      num_parallel_calls=dataset_ops.AUTOTUNE)
+def sequences_from_starts(array, starts_ds, start_index, end_index,
+                          sequence_length=None, sampling_rate=1):
+  """Slices windows of `array[start_index:end_index]` at the given starts.
+
+  Windows are strided slices of the array, so that no index tensor is built
+  and gathered from for each window.
+
+  Args:
+    array: Numpy array, `np.memmap` or eager tensor.
+    starts_ds: Dataset of scalar window starts, relative to `start_index`.
+    start_index: Index of the first step of `array` to use.
+    end_index: Index (exclusive) of the last step of `array` to use.
+    sequence_length: Number of steps in each window, or None to yield single
+      steps instead of windows.
+    sampling_rate: Period between successive steps within a window.
+
+  Returns:
+    A dataset of windows (or single steps).
+  """
+  array = array[start_index:end_index]
+  if isinstance(array, np.memmap):
+    return _sequences_from_memmap(array, starts_ds, sequence_length,
+                                  sampling_rate)
+
+  def slice_window(steps, start):
+    if sequence_length is None:
+      return steps[start]
+    window = steps[start:start + sequence_length * sampling_rate:sampling_rate]
+    window.set_shape(
+        tensor_shape.TensorShape([sequence_length]).concatenate(
+            steps.shape[1:]))
+    return window
+
+  dataset = dataset_ops.Dataset.from_tensors(array)
+  dataset = dataset_ops.Dataset.zip((dataset.repeat(), starts_ds)).map(
+      slice_window, num_parallel_calls=dataset_ops.AUTOTUNE)
   return dataset
+
+
+def _sequences_from_memmap(array, starts_ds, sequence_length, sampling_rate):
+  """Same as `sequences_from_starts`, reading the windows from a memmap."""
+  dtype = dtypes.as_dtype(array.dtype)
+  if sequence_length is None:
+    shape = array.shape[1:]
+  else:
+    shape = (sequence_length,) + array.shape[1:]
+
+  def read_window(start):
+    if sequence_length is None:
+      return np.asarray(array[start])
+    return np.ascontiguousarray(
+        array[start:start + sequence_length * sampling_rate:sampling_rate])
+
+  def map_fn(start):
+    window = script_ops.numpy_function(read_window, [start], dtype)
+    window.set_shape(shape)
+    return window
+
+  return starts_ds.map(map_fn, num_parallel_calls=dataset_ops.AUTOTUNE)
@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import os
+
 import numpy as np
 
 from tensorflow.python.compat import v2_compat
@@ -155,6 +157,26 @@ class TimeseriesDatasetTest(test.TestCase):
       self.assertAllLess(batch[0], 90)
       self.assertAllGreater(batch[0], 9)
 
+  def test_memmap(self):
+    data = np.arange(300, dtype='float32').reshape((100, 3))
+    targets = np.arange(100, dtype='int64') * 2
+    data_path = os.path.join(self.get_temp_dir(), 'data.npy')
+    targets_path = os.path.join(self.get_temp_dir(), 'targets.npy')
+    np.save(data_path, data)
+    np.save(targets_path, targets)
+    kwargs = {'sequence_length': 9, 'batch_size': 5, 'sampling_rate': 2,
+              'sequence_stride': 3, 'start_index': 10, 'end_index': 90}
+    expected = timeseries.timeseries_dataset_from_array(
+        data, targets, **kwargs)
+    dataset = timeseries.timeseries_dataset_from_array(
+        np.load(data_path, mmap_mode='r'),
+        np.load(targets_path, mmap_mode='r'), **kwargs)
+    self.assertEqual(dataset.element_spec, expected.element_spec)
+    for (inputs, targets), (expected_inputs, expected_targets) in zip(
+        dataset, expected):
+      self.assertAllEqual(inputs, expected_inputs)
+      self.assertAllEqual(targets, expected_targets)
+
   def test_errors(self):
     # bad start index
     with self.assertRaisesRegex(ValueError, 'start_index must be '):
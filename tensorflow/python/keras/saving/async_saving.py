@@ -0,0 +1,308 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# pylint: disable=protected-access
+"""Utilities for writing Keras checkpoints from a background thread.
+
+Saving is split in two phases. A snapshot phase runs on the training thread and
+copies the values to save into host memory. Reading a resource variable returns
+a tensor that shares its buffer with the variable, and variable updates copy the
+buffer when it is still referenced, so holding on to the read values is a cheap
+copy-on-write snapshot. A write phase then serializes the snapshot to disk from
+a background thread while training continues.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import sys
+import threading
+import time
+
+import six
+from six.moves import queue
+
+from tensorflow.python.eager import context
+from tensorflow.python.framework import constant_op
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import ops
+from tensorflow.python.keras.saving import hdf5_format
+from tensorflow.python.keras.saving import saving_utils
+from tensorflow.python.lib.io import file_io
+from tensorflow.python.ops import array_ops
+from tensorflow.python.platform import gfile
+from tensorflow.python.training import checkpoint_management
+from tensorflow.python.training.saving import functional_saver
+from tensorflow.python.training.saving import saveable_hook
+from tensorflow.python.training.saving import saveable_object
+from tensorflow.python.training.tracking import base
+from tensorflow.python.util import nest
+
+# pylint: disable=g-import-not-at-top
+try:
+  import h5py
+except ImportError:
+  h5py = None
+# pylint: enable=g-import-not-at-top
+
+
+class BackgroundSaver(object):
+  """Runs checkpoint writes on a single background thread.
+
+  Writes are executed in submission order. At most `max_pending_saves` writes
+  can be in flight at any time; `submit` blocks the calling thread until a slot
+  frees up. An exception raised by a write is re-raised on the calling thread
+  by the next call to `submit` or `join`, and all writes submitted after a
+  failure are dropped.
+
+  Attributes:
+    blocked_time: Total number of seconds the calling thread spent inside
+      `submit` and `join`, i.e. taking snapshots and waiting for pending
+      writes.
+  """
+
+  def __init__(self, max_pending_saves=1):
+    if max_pending_saves < 1:
+      raise ValueError('`max_pending_saves` must be at least 1, got: '
+                       '{}'.format(max_pending_saves))
+    self._slots = threading.Semaphore(max_pending_saves)
+    self._queue = queue.Queue()
+    self._thread = None
+    self._error = None
+    self.blocked_time = 0.
+
+  def submit(self, snapshot_fn):
+    """Takes a snapshot on the calling thread and writes it in the background.
+
+    Args:
+      snapshot_fn: Callable without arguments, run on the calling thread. It
+        must return a callable without arguments that writes the snapshot.
+
+    Raises:
+      Exception: The exception raised by a previously submitted write, if any.
+    """
+    start = time.time()
+    try:
+      self._raise_error()
+      self._slots.acquire()
+      try:
+        write_fn = snapshot_fn()
+      except:  # pylint: disable=bare-except
+        self._slots.release()
+        raise
+      if self._thread is None:
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+      self._queue.put(write_fn)
+    finally:
+      self.blocked_time += time.time() - start
+
+  def join(self):
+    """Waits for all pending writes to finish.
+
+    Raises:
+      Exception: The exception raised by a submitted write, if any.
+    """
+    start = time.time()
+    try:
+      self._queue.join()
+      self._raise_error()
+    finally:
+      self.blocked_time += time.time() - start
+
+  def _raise_error(self):
+    if self._error is not None:
+      error, self._error = self._error, None
+      six.reraise(*error)
+
+  def _run(self):
+    while True:
+      write_fn = self._queue.get()
+      try:
+        if self._error is None:
+          write_fn()
+      except:  # pylint: disable=bare-except
+        self._error = sys.exc_info()
+      finally:
+        self._slots.release()
+        self._queue.task_done()
+
+
+class _SnapshotSaveable(saveable_object.SaveableObject):
+  """A `SaveableObject` holding host copies of another saveable's tensors."""
+
+  def __init__(self, saveable):
+    specs = []
+    for spec in saveable.specs:
+      tensor = spec.tensor
+      # A tensor value of `None` indicates that this SaveableObject gets
+      # recorded in the object graph, but that no value is saved in the
+      # checkpoint.
+      if tensor is not None:
+        specs.append(saveable_object.SaveSpec(
+            _copy_to_host(tensor), spec.slice_spec, spec.name))
+    super(_SnapshotSaveable, self).__init__(None, specs, saveable.name)
+
+  def restore(self, restored_tensors, restored_shapes):
+    raise ValueError('Checkpoint snapshots are write-only: restore the '
+                     'checkpoint written from the snapshot instead.')
+
+
+def snapshot_trackable_saver(saver):
+  """Snapshots the state a `TrackableSaver` would write.
+
+  Must be called eagerly, on the thread that owns the saved objects.
+
+  Args:
+    saver: A `TrackableSaver`, e.g. `Model._trackable_saver` or the `_saver` of
+      a `tf.train.Checkpoint`.
+
+  Returns:
+    A list of `SaveableObject`s to pass to `write_trackable_snapshot`.
+  """
+  if not context.executing_eagerly():
+    raise RuntimeError('Checkpoints can only be snapshotted eagerly.')
+  named_saveable_objects, graph_proto, _ = (
+      saver._graph_view.serialize_object_graph())
+  snapshot = []
+  for saveable in named_saveable_objects:
+    if isinstance(saveable, saveable_hook.SaveableHook):
+      saveable.before_save()
+    if isinstance(saveable, saveable_object.SaveableObject):
+      snapshot.append(_SnapshotSaveable(saveable))
+  with ops.device('/cpu:0'):
+    object_graph_tensor = constant_op.constant(
+        graph_proto.SerializeToString(), dtype=dtypes.string)
+  snapshot.append(
+      _SnapshotSaveable(base.NoRestoreSaveable(
+          tensor=object_graph_tensor, name=base.OBJECT_GRAPH_PROTO_KEY)))
+  return [saveable for saveable in snapshot if saveable.specs]
+
+
+def write_trackable_snapshot(snapshot, file_prefix, options=None):
+  """Writes a snapshot taken by `snapshot_trackable_saver` to a checkpoint.
+
+  The checkpoint is recorded in the `checkpoint` state file of its directory,
+  as `Model.save_weights` does.
+
+  Args:
+    snapshot: Value returned by `snapshot_trackable_saver`.
+    file_prefix: Prefix of the checkpoint files.
+    options: Optional `tf.train.CheckpointOptions` object.
+
+  Returns:
+    The `file_prefix`.
+  """
+  file_io.recursive_create_dir(os.path.dirname(file_prefix))
+  with ops.device('/cpu:0'):
+    file_prefix_tensor = constant_op.constant(file_prefix, dtype=dtypes.string)
+  functional_saver.MultiDeviceSaver(snapshot).save(
+      file_prefix_tensor, options=options)
+  checkpoint_management.update_checkpoint_state_internal(
+      save_dir=os.path.dirname(file_prefix),
+      model_checkpoint_path=file_prefix,
+      save_relative_paths=True,
+      all_model_checkpoint_paths=[file_prefix])
+  return file_prefix
+
+
+def snapshot_model_weights(model, filepath, options=None):
+  """Snapshots `model.save_weights(filepath)` for a deferred write.
+
+  Args:
+    model: Keras model instance.
+    filepath: Path passed to `save_weights`. A path ending in `.h5` or `.keras`
+      is written in HDF5 format, anything else in TensorFlow format.
+    options: Optional `tf.train.CheckpointOptions` object.
+
+  Returns:
+    A callable without arguments that writes the weights.
+  """
+  model._assert_weights_created()
+  if saving_utils.is_hdf5_filepath(filepath):
+    _check_h5py()
+    layer_weight_values = hdf5_format.get_layer_weight_values(model.layers)
+
+    def write_hdf5_weights():
+      _maybe_create_parent_dir(filepath)
+      with h5py.File(filepath, 'w') as f:
+        hdf5_format.save_layer_weight_values_to_hdf5_group(
+            f, layer_weight_values)
+
+    return write_hdf5_weights
+
+  snapshot = snapshot_trackable_saver(model._trackable_saver)
+  return lambda: write_trackable_snapshot(snapshot, filepath, options)
+
+
+def snapshot_model(model, filepath, include_optimizer=True):
+  """Snapshots `model.save(filepath)` in HDF5 format for a deferred write.
+
+  Args:
+    model: Keras model instance.
+    filepath: Path of the HDF5 file to write.
+    include_optimizer: If True, save the optimizer's state together.
+
+  Returns:
+    A callable without arguments that writes the model.
+  """
+  _check_h5py()
+  model_values = hdf5_format.get_model_values(model, include_optimizer)
+
+  def write_hdf5_model():
+    _maybe_create_parent_dir(filepath)
+    with h5py.File(filepath, 'w') as f:
+      hdf5_format.save_model_values_to_hdf5_group(f, *model_values)
+      f.flush()
+
+  return write_hdf5_model
+
+
+def snapshot_to_host(structure):
+  """Snapshots the tensors and variables of a nested structure.
+
+  Must be called eagerly, on the thread that owns the variables.
+
+  Args:
+    structure: A nested structure of tensors, variables and strings.
+
+  Returns:
+    The structure, with each tensor and variable replaced by a copy of its
+    value in host memory. Strings are returned as is.
+  """
+
+  def snapshot(value):
+    if isinstance(value, six.string_types):
+      return value
+    return _copy_to_host(value)
+
+  return nest.map_structure(snapshot, structure)
+
+
+def _copy_to_host(value):
+  with ops.device('/cpu:0'):
+    return array_ops.identity(value)
+
+
+def _check_h5py():
+  if h5py is None:
+    raise ImportError('Saving in HDF5 format requires h5py.')
+
+
+def _maybe_create_parent_dir(filepath):
+  dirpath = os.path.dirname(filepath)
+  if dirpath and not os.path.exists(dirpath):
+    gfile.MakeDirs(dirpath)
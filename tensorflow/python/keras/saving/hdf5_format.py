@@ -19,12 +19,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import collections
 import json
+from multiprocessing import pool
 import os
 
 import numpy as np
 from six.moves import zip  # pylint: disable=redefined-builtin
 
+from tensorflow.python.framework import ops
 from tensorflow.python.keras import backend as K
 from tensorflow.python.keras import optimizer_v1
 from tensorflow.python.keras.saving import model_config as model_config_lib
@@ -32,6 +35,7 @@ from tensorflow.python.keras.saving import saving_utils
 from tensorflow.python.keras.saving.saved_model import json_utils
 from tensorflow.python.keras.utils.generic_utils import LazyLoader
 from tensorflow.python.keras.utils.io_utils import ask_to_proceed_with_overwrite
+from tensorflow.python.ops import resource_variable_ops
 from tensorflow.python.ops import variables as variables_module
 from tensorflow.python.platform import gfile
 from tensorflow.python.platform import tf_logging as logging
@@ -53,6 +57,18 @@ sequential_lib = LazyLoader(
     "tensorflow.python.keras.engine.sequential")
 # pylint:enable=g-inconsistent-quotes
 
+# Saved weights are read and assigned in slices of at most this many bytes, so
+# that loading does not hold a second copy of large weights in host memory.
+_LOAD_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Layers whose saved weights `preprocess_weights_for_loading` may convert.
+# The weights of all other layers are assigned as they are saved.
+_PREPROCESSED_LAYER_CLASSES = frozenset([
+    'Bidirectional', 'TimeDistributed', 'Model', 'Sequential', 'Conv1D',
+    'Conv2D', 'Conv3D', 'Conv2DTranspose', 'ConvLSTM2D', 'GRU', 'LSTM',
+    'CuDNNGRU', 'CuDNNLSTM'
+])
+
 
 def save_model_to_hdf5(model, filepath, overwrite=True, include_optimizer=True):
   """Saves a model to a HDF5 file.
@@ -112,30 +128,61 @@ def save_model_to_hdf5(model, filepath, overwrite=True, include_optimizer=True):
     opened_new_file = False
 
   try:
-    model_metadata = saving_utils.model_metadata(model, include_optimizer)
-    for k, v in model_metadata.items():
-      if isinstance(v, (dict, list, tuple)):
-        f.attrs[k] = json.dumps(
-            v, default=json_utils.get_json_type).encode('utf8')
-      else:
-        f.attrs[k] = v
-
-    model_weights_group = f.create_group('model_weights')
-    model_layers = model.layers
-    save_weights_to_hdf5_group(model_weights_group, model_layers)
-
-    # TODO(b/128683857): Add integration tests between tf.keras and external
-    # Keras, to avoid breaking TF.js users.
-    if (include_optimizer and model.optimizer and
-        not isinstance(model.optimizer, optimizer_v1.TFOptimizer)):
-      save_optimizer_weights_to_hdf5_group(f, model.optimizer)
-
+    model_values = get_model_values(model, include_optimizer)
+    save_model_values_to_hdf5_group(f, *model_values)
     f.flush()
   finally:
     if opened_new_file:
       f.close()
 
 
+def get_model_values(model, include_optimizer=True):
+  """Reads everything `save_model_to_hdf5` writes into host memory.
+
+  Args:
+      model: Keras model instance.
+      include_optimizer: If True, include the optimizer's state.
+
+  Returns:
+      A `(model_metadata, layer_weight_values, optimizer_weight_values)` tuple
+      that can be passed to `save_model_values_to_hdf5_group`.
+  """
+  model_metadata = saving_utils.model_metadata(model, include_optimizer)
+  layer_weight_values = get_layer_weight_values(model.layers)
+  # TODO(b/128683857): Add integration tests between tf.keras and external
+  # Keras, to avoid breaking TF.js users.
+  if (include_optimizer and model.optimizer and
+      not isinstance(model.optimizer, optimizer_v1.TFOptimizer)):
+    optimizer_weight_values = get_optimizer_weight_values(model.optimizer)
+  else:
+    optimizer_weight_values = []
+  return model_metadata, layer_weight_values, optimizer_weight_values
+
+
+def save_model_values_to_hdf5_group(f, model_metadata, layer_weight_values,
+                                    optimizer_weight_values):
+  """Writes values returned by `get_model_values` to a HDF5 group.
+
+  Args:
+      f: HDF5 group, usually an open `h5py.File`.
+      model_metadata: Dict of model metadata attributes.
+      layer_weight_values: Layer weights, see `get_layer_weight_values`.
+      optimizer_weight_values: Optimizer weights, see
+        `get_optimizer_weight_values`.
+  """
+  for k, v in model_metadata.items():
+    if isinstance(v, (dict, list, tuple)):
+      f.attrs[k] = json.dumps(
+          v, default=json_utils.get_json_type).encode('utf8')
+    else:
+      f.attrs[k] = v
+
+  model_weights_group = f.create_group('model_weights')
+  save_layer_weight_values_to_hdf5_group(model_weights_group,
+                                         layer_weight_values)
+  save_optimizer_weight_values_to_hdf5_group(f, optimizer_weight_values)
+
+
 def load_model_from_hdf5(filepath, custom_objects=None, compile=True):  # pylint: disable=redefined-builtin
   """Loads a model saved via `save_model_to_hdf5`.
 
@@ -588,21 +635,42 @@ def save_optimizer_weights_to_hdf5_group(hdf5_group, optimizer):
       hdf5_group: HDF5 group.
       optimizer: optimizer instance.
   """
+  save_optimizer_weight_values_to_hdf5_group(
+      hdf5_group, get_optimizer_weight_values(optimizer))
+
+
+def get_optimizer_weight_values(optimizer):
+  """Reads the weights of an optimizer into host memory.
 
+  Args:
+      optimizer: optimizer instance.
+
+  Returns:
+      A list of `(weight_name, value)` tuples, where `weight_name` is the
+      utf8-encoded weight name and `value` a NumPy array.
+  """
   symbolic_weights = getattr(optimizer, 'weights')
-  if symbolic_weights:
+  if not symbolic_weights:
+    return []
+  weight_names = [str(w.name).encode('utf8') for w in symbolic_weights]
+  weight_values = K.batch_get_value(symbolic_weights)
+  return list(zip(weight_names, weight_values))
+
+
+def save_optimizer_weight_values_to_hdf5_group(hdf5_group, weight_values):
+  """Writes optimizer weight values to a HDF5 group.
+
+  Args:
+      hdf5_group: HDF5 group.
+      weight_values: A list of `(weight_name, value)` tuples, as returned by
+        `get_optimizer_weight_values`.
+  """
+  if weight_values:
     weights_group = hdf5_group.create_group('optimizer_weights')
-    weight_names = [str(w.name).encode('utf8') for w in symbolic_weights]
-    save_attributes_to_hdf5_group(weights_group, 'weight_names', weight_names)
-    weight_values = K.batch_get_value(symbolic_weights)
-    for name, val in zip(weight_names, weight_values):
-      param_dset = weights_group.create_dataset(
-          name, val.shape, dtype=val.dtype)
-      if not val.shape:
-        # scalar
-        param_dset[()] = val
-      else:
-        param_dset[:] = val
+    save_attributes_to_hdf5_group(
+        weights_group, 'weight_names', [name for name, _ in weight_values])
+    for name, val in weight_values:
+      _write_weight_dataset(weights_group, name, val)
 
 
 def load_optimizer_weights_from_hdf5_group(hdf5_group):
@@ -627,28 +695,66 @@ def save_weights_to_hdf5_group(f, layers):
       f: HDF5 group.
       layers: List of layer instances.
   """
+  save_layer_weight_values_to_hdf5_group(f, get_layer_weight_values(layers))
+
+
+def get_layer_weight_values(layers):
+  """Reads the weights of a list of layers into host memory.
+
+  The returned values can be written later with
+  `save_layer_weight_values_to_hdf5_group`, e.g. from a background thread,
+  without touching the layers again.
+
+  Args:
+      layers: List of layer instances.
+
+  Returns:
+      A list of `(layer_name, weight_names, weight_values)` tuples, one per
+      layer and in the same order as `layers`.
+  """
+  layer_weight_values = []
+  for layer in layers:
+    weights = _legacy_weights(layer)
+    weight_values = K.batch_get_value(weights)
+    weight_names = [w.name.encode('utf8') for w in weights]
+    layer_weight_values.append((layer.name, weight_names, weight_values))
+  return layer_weight_values
+
+
+def save_layer_weight_values_to_hdf5_group(f, layer_weight_values):
+  """Writes layer weight values to a HDF5 group.
+
+  Args:
+      f: HDF5 group.
+      layer_weight_values: A list of `(layer_name, weight_names,
+        weight_values)` tuples, as returned by `get_layer_weight_values`.
+  """
   from tensorflow.python.keras import __version__ as keras_version  # pylint: disable=g-import-not-at-top
 
   save_attributes_to_hdf5_group(
-      f, 'layer_names', [layer.name.encode('utf8') for layer in layers])
+      f, 'layer_names',
+      [layer_name.encode('utf8') for layer_name, _, _ in layer_weight_values])
   f.attrs['backend'] = K.backend().encode('utf8')
   f.attrs['keras_version'] = str(keras_version).encode('utf8')
 
   # Sort model layers by layer name to ensure that group names are strictly
   # growing to avoid prefix issues.
-  for layer in sorted(layers, key=lambda x: x.name):
-    g = f.create_group(layer.name)
-    weights = _legacy_weights(layer)
-    weight_values = K.batch_get_value(weights)
-    weight_names = [w.name.encode('utf8') for w in weights]
+  for layer_name, weight_names, weight_values in sorted(
+      layer_weight_values, key=lambda x: x[0]):
+    g = f.create_group(layer_name)
     save_attributes_to_hdf5_group(g, 'weight_names', weight_names)
     for name, val in zip(weight_names, weight_values):
-      param_dset = g.create_dataset(name, val.shape, dtype=val.dtype)
-      if not val.shape:
-        # scalar
-        param_dset[()] = val
-      else:
-        param_dset[:] = val
+      _write_weight_dataset(g, name, val)
+
+
+def _write_weight_dataset(group, name, val):
+  """Writes a single weight value as a dataset of `group`."""
+  param_dset = group.create_dataset(name, val.shape, dtype=val.dtype)
+  if not val.shape:
+    # scalar
+    param_dset[()] = val
+  else:
+    param_dset[:] = val
 
 
 def load_weights_from_hdf5_group(f, layers):
@@ -695,17 +801,16 @@ def load_weights_from_hdf5_group(f, layers):
                      ' layers into a model with ' + str(len(filtered_layers)) +
                      ' layers.')
 
-  # We batch weight value assignments in a single backend call
-  # which provides a speedup in TensorFlow.
+  # All weights are checked before any of them is assigned, so that a
+  # mismatch leaves the model unchanged.
   weight_value_tuples = []
   for k, name in enumerate(layer_names):
     g = f[name]
     weight_names = load_attributes_from_hdf5_group(g, 'weight_names')
-    weight_values = [np.asarray(g[weight_name]) for weight_name in weight_names]
     layer = filtered_layers[k]
     symbolic_weights = _legacy_weights(layer)
-    weight_values = preprocess_weights_for_loading(
-        layer, weight_values, original_keras_version, original_backend)
+    weight_values = _get_saved_weight_values(
+        layer, g, weight_names, original_keras_version, original_backend)
     if len(weight_values) != len(symbolic_weights):
       raise ValueError('Layer #' + str(k) + ' (named "' + layer.name +
                        '" in the current model) was found to '
@@ -715,7 +820,7 @@ def load_weights_from_hdf5_group(f, layers):
                        ' weights, but the saved weights have ' +
                        str(len(weight_values)) + ' elements.')
     weight_value_tuples += zip(symbolic_weights, weight_values)
-  K.batch_set_value(weight_value_tuples)
+  _assign_weight_values(weight_value_tuples)
 
 
 def load_weights_from_hdf5_group_by_name(
@@ -759,18 +864,17 @@ def load_weights_from_hdf5_group_by_name(
     if layer.name:
       index.setdefault(layer.name, []).append(layer)
 
-  # We batch weight value assignments in a single backend call
-  # which provides a speedup in TensorFlow.
+  # All weights are checked before any of them is assigned, so that a
+  # mismatch leaves the model unchanged.
   weight_value_tuples = []
   for k, name in enumerate(layer_names):
     g = f[name]
     weight_names = load_attributes_from_hdf5_group(g, 'weight_names')
-    weight_values = [np.asarray(g[weight_name]) for weight_name in weight_names]
 
     for layer in index.get(name, []):
       symbolic_weights = _legacy_weights(layer)
-      weight_values = preprocess_weights_for_loading(
-          layer, weight_values, original_keras_version, original_backend)
+      weight_values = _get_saved_weight_values(
+          layer, g, weight_names, original_keras_version, original_backend)
       if len(weight_values) != len(symbolic_weights):
         if skip_mismatch:
           logging.warning('Skipping loading of weights for '
@@ -801,7 +905,107 @@ def load_weights_from_hdf5_group_by_name(
 
         else:
           weight_value_tuples.append((symbolic_weights[i], weight_values[i]))
-  K.batch_set_value(weight_value_tuples)
+  _assign_weight_values(weight_value_tuples)
+
+
+def _get_saved_weight_values(layer, group, weight_names,
+                             original_keras_version, original_backend):
+  """Returns the saved weight values to assign to `layer`.
+
+  Weights that `preprocess_weights_for_loading` leaves unchanged are returned
+  as `h5py.Dataset`s, which are only read by `_assign_weight_values`.
+
+  Args:
+      layer: Layer instance.
+      group: A pointer to the HDF5 group of the layer.
+      weight_names: Names of the weights in `group`.
+      original_keras_version: Keras version for the weights, as a string.
+      original_backend: Keras backend the weights were trained with,
+          as a string.
+
+  Returns:
+      A list of `h5py.Dataset`s or Numpy arrays.
+  """
+  if layer.__class__.__name__ not in _PREPROCESSED_LAYER_CLASSES:
+    return [group[weight_name] for weight_name in weight_names]
+  weight_values = [
+      np.asarray(group[weight_name]) for weight_name in weight_names
+  ]
+  return preprocess_weights_for_loading(
+      layer, weight_values, original_keras_version, original_backend)
+
+
+def _assign_weight_values(weight_value_tuples):
+  """Assigns saved weight values to variables.
+
+  Values that are `h5py.Dataset`s are read on a background thread while the
+  previously read values are assigned. Datasets larger than `_LOAD_CHUNK_BYTES`
+  are read and assigned one slice of rows at a time, so that only a few slices
+  are held in host memory in addition to the variables.
+
+  Args:
+      weight_value_tuples: A list of tuples `(variable, value)`, where `value`
+          is a Numpy array or a `h5py.Dataset`.
+  """
+  if not ops.executing_eagerly_outside_functions():
+    # Batch the assignments in a few backend calls, each feeding at most
+    # `_LOAD_CHUNK_BYTES` of weight values.
+    batch, batch_bytes = [], 0
+    for x, value in weight_value_tuples:
+      value = np.asarray(value)
+      batch.append((x, value))
+      batch_bytes += value.nbytes
+      if batch_bytes >= _LOAD_CHUNK_BYTES:
+        K.batch_set_value(batch)
+        batch, batch_bytes = [], 0
+    K.batch_set_value(batch)
+    return
+
+  def read_slices():
+    for x, value in weight_value_tuples:
+      dtype = K.dtype_numpy(x)
+      if _is_chunkable(x, value):
+        row_bytes = value.dtype.itemsize * np.prod(value.shape[1:], dtype=int)
+        rows = max(1, _LOAD_CHUNK_BYTES // max(1, row_bytes))
+        for start in range(0, value.shape[0], rows):
+          key = slice(start, start + rows)
+          yield x, key, _slice_reader(value, key, dtype)
+      else:
+        yield x, None, _slice_reader(value, Ellipsis, dtype)
+
+  # Reading is done on a single thread since h5py serializes all accesses to
+  # HDF5 files. At most one slice is read ahead of the assignments.
+  reader = pool.ThreadPool(1)
+  try:
+    pending = collections.deque()
+    for x, key, read in read_slices():
+      pending.append((x, key, reader.apply_async(read)))
+      if len(pending) > 1:
+        _assign_slice(*pending.popleft())
+    while pending:
+      _assign_slice(*pending.popleft())
+  finally:
+    reader.terminate()
+
+
+def _is_chunkable(x, value):
+  """Whether `value` can be assigned to `x` one slice of rows at a time."""
+  return (h5py is not None and isinstance(value, h5py.Dataset) and
+          isinstance(x, resource_variable_ops.BaseResourceVariable) and
+          value.shape and tuple(value.shape) == K.int_shape(x) and
+          value.size * value.dtype.itemsize > _LOAD_CHUNK_BYTES)
+
+
+def _slice_reader(value, key, dtype):
+  return lambda: np.asarray(value[key], dtype=dtype)
+
+
+def _assign_slice(x, key, result):
+  value = result.get()
+  if key is None:
+    x.assign(value)
+  else:
+    x[key].assign(value)
 
 
 def save_attributes_to_hdf5_group(group, name, data):
@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import functools
+
 import six
 
 from tensorflow.python import tf2
@@ -119,7 +121,11 @@ def save_model(model,
         can be disabled, so that only the configs of each layer are stored.
         Defaults to `True`. Disabling this will decrease serialization time and
         reduce file size, but it requires that all custom layers/models
-        implement a `get_config()` method.
+        implement a `get_config()` method. Set to `'serving'` to only store
+        the function traces of the model itself, including its serving
+        signature, and the configs of its layers. This has the same
+        requirements, and still allows the model to be served with
+        `tf.saved_model.load`.
 
   Raises:
       ImportError: If save format is hdf5, and h5py is not available.
@@ -154,7 +160,8 @@ def save_model(model,
 
 
 @keras_export('keras.models.load_model')
-def load_model(filepath, custom_objects=None, compile=True, options=None):  # pylint: disable=redefined-builtin
+def load_model(filepath, custom_objects=None, compile=True, options=None,  # pylint: disable=redefined-builtin
+               lazy=False):
   """Loads a model saved via `model.save()`.
 
   Usage:
@@ -183,13 +190,19 @@ def load_model(filepath, custom_objects=None, compile=True, options=None):  # py
           after loading.
       options: Optional `tf.saved_model.LoadOptions` object that specifies
         options for loading from SavedModel.
+      lazy: Boolean, whether to defer the revival of the Keras model when
+          loading from SavedModel. The returned object can be called, and its
+          `signatures` used, with the functions stored in the SavedModel. The
+          Keras model is revived the first time any other attribute is
+          accessed. Has no effect when loading from an HDF5 file.
 
   Returns:
       A Keras model instance. If the original model was compiled, and saved with
       the optimizer, then the returned model will be compiled. Otherwise, the
       model will be left uncompiled. In the case that an uncompiled model is
       returned, a warning is displayed if the `compile` argument is set to
-      `True`.
+      `True`. If `lazy` is True and a SavedModel is loaded, an object standing
+      in for the Keras model until it is revived.
 
   Raises:
       ImportError: if loading from an hdf5 file and h5py is not available.
@@ -206,6 +219,12 @@ def load_model(filepath, custom_objects=None, compile=True, options=None):  # py
         filepath = path_to_string(filepath)
         if isinstance(filepath, six.string_types):
           loader_impl.parse_saved_model(filepath)
+          if lazy:
+            return saved_model_load.LazyRevivedModel(
+                filepath,
+                functools.partial(load_model, filepath, custom_objects,
+                                  compile, options),
+                options)
           return saved_model_load.load(filepath, compile, options)
 
   raise IOError(
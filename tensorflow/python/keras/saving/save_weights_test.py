@@ -361,6 +361,38 @@ class TestWeightSavingAndLoading(test.TestCase, parameterized.TestCase):
       self.assertAllClose([3.5] * num_classes,
                           keras.backend.get_value(model.layers[1].bias))
 
+  def test_weight_loading_in_chunks(self):
+    if h5py is None:
+      return
+
+    h5_path = self._save_model_dir('test.h5')
+    with self.cached_session():
+      ref_model = keras.models.Sequential([
+          keras.layers.Embedding(100, 8, input_length=1, name='embedding'),
+          keras.layers.Flatten(),
+          keras.layers.Dense(2, name='dense')])
+      ref_model.save_weights(h5_path)
+
+      model = keras.models.Sequential([
+          keras.layers.Embedding(100, 8, input_length=1, name='embedding'),
+          keras.layers.Flatten(),
+          keras.layers.Dense(2, name='dense')])
+      # Each slice of the embedding table holds 10 rows of 8 float32 values.
+      with test.mock.patch.object(hdf5_format, '_LOAD_CHUNK_BYTES', 320):
+        model.load_weights(h5_path)
+        for ref_weight, weight in zip(ref_model.get_weights(),
+                                      model.get_weights()):
+          self.assertAllClose(ref_weight, weight)
+
+        model = keras.models.Sequential([
+            keras.layers.Embedding(100, 8, input_length=1, name='embedding'),
+            keras.layers.Flatten(),
+            keras.layers.Dense(2, name='other')])
+        model.load_weights(h5_path, by_name=True)
+        self.assertAllClose(
+            keras.backend.get_value(ref_model.layers[0].embeddings),
+            keras.backend.get_value(model.layers[0].embeddings))
+
   @keras_parameterized.run_with_all_saved_model_formats(
       exclude_formats=['tf_no_traces'])
   @keras_parameterized.run_with_all_model_types
@@ -72,7 +72,7 @@ class SavedModelSaver(object):
       A dictionary mapping attribute names to trackable objects. The entire list
       of attributes are listed in the `saved_model._LayerAttributes` class.
     """
-    if not utils.should_save_traces():
+    if not utils.should_save_traces(self.obj):
       return {}
 
     return self.objects_to_serialize(serialization_cache)
@@ -88,7 +88,7 @@ class SavedModelSaver(object):
         A dictionary mapping attribute names to `Function` or
         `ConcreteFunction`.
     """
-    if not utils.should_save_traces():
+    if not utils.should_save_traces(self.obj):
       return {}
 
     fns = self.functions_to_serialize(serialization_cache)
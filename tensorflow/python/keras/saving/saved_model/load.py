@@ -184,6 +184,69 @@ def load(path, compile=True, options=None):  # pylint: disable=redefined-builtin
   return model
 
 
+class LazyRevivedModel(object):
+  """A Keras model loaded from a SavedModel, revived on first use.
+
+  Reviving the Keras objects of a SavedModel recreates and rebuilds every
+  layer, which is slow for large models. Inference does not need it: until
+  the model is revived, calling the model or using its `signatures` runs the
+  functions stored in the SavedModel, as loaded by `tf.saved_model.load`.
+
+  Accessing or setting any other attribute (e.g. `fit`, `layers` or
+  `trainable`) revives the Keras model with `tf.keras.models.load_model`.
+  From then on, all calls and attributes are delegated to the revived model,
+  which can also be obtained with `keras_model`.
+  """
+
+  def __init__(self, path, revive_fn, options=None):
+    """Loads the functions stored in the SavedModel at `path`.
+
+    Args:
+      path: Path to SavedModel.
+      revive_fn: Callable without arguments that returns the revived Keras
+        model.
+      options: Optional `tf.saved_model.LoadOptions` object that specifies
+        options for loading from SavedModel.
+    """
+    object.__setattr__(self, '_revive_fn', revive_fn)
+    object.__setattr__(self, '_model', None)
+    object.__setattr__(self, '_restored', tf_load.load(path, options=options))
+
+  @property
+  def revived(self):
+    """Whether the Keras model has been revived."""
+    return self._model is not None
+
+  @property
+  def keras_model(self):
+    """The revived Keras model. Revives the model if needed."""
+    if self._model is None:
+      object.__setattr__(self, '_model', self._revive_fn())
+      # The revived model holds its own copy of the variables.
+      object.__setattr__(self, '_restored', None)
+    return self._model
+
+  @property
+  def signatures(self):
+    if self._model is None:
+      return self._restored.signatures
+    return self._model.signatures
+
+  def __call__(self, *args, **kwargs):
+    if self._model is None:
+      return self._restored(*args, **kwargs)
+    return self._model(*args, **kwargs)
+
+  def __getattr__(self, name):
+    if name in ('_revive_fn', '_model', '_restored'):
+      # Not set yet, e.g. while the object is being copied.
+      raise AttributeError(name)
+    return getattr(self.keras_model, name)
+
+  def __setattr__(self, name, value):
+    setattr(self.keras_model, name, value)
+
+
 def _read_legacy_metadata(object_graph_def, metadata):
   """Builds a KerasMetadata proto from the SavedModel ObjectGraphDef."""
   # Older SavedModels store the metadata directly in the proto instead of the
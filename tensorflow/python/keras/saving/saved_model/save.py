@@ -63,7 +63,9 @@ def save(model, filepath, overwrite, include_optimizer, signatures=None,
       can be disabled, so that only the configs of each layer are stored.
       Defaults to `True`. Disabling this will decrease serialization time
       and reduce file size, but it requires that all custom layers/models
-      implement a `get_config()` method.
+      implement a `get_config()` method. Set to `'serving'` to only store
+      the function traces of `model` itself, including its serving
+      signature, and the configs of the other layers.
 
   Raises:
     ValueError: if the model's inputs have not been defined.
@@ -74,6 +76,9 @@ def save(model, filepath, overwrite, include_optimizer, signatures=None,
     if not proceed:
       return
 
+  if save_traces and save_traces not in (True, utils.SERVING_TRACES):
+    raise ValueError('`save_traces` must be True, False or {!r}, got: '
+                     '{!r}'.format(utils.SERVING_TRACES, save_traces))
   if save_traces:
     if save_impl.should_skip_serialization(model):
       saving_utils.raise_model_input_error(model)
@@ -91,7 +96,7 @@ def save(model, filepath, overwrite, include_optimizer, signatures=None,
     # the replica context is not available when calling `add_update()`, and thus
     # we use the default replica context here.
     with distribution_strategy_context._get_default_replica_context():  # pylint: disable=protected-access
-      with utils.keras_option_scope(save_traces):
+      with utils.keras_option_scope(save_traces, root=model):
         saved_nodes, node_paths = save_lib.save_and_return_nodes(
             model, filepath, signatures, options)
 
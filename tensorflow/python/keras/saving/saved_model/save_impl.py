@@ -266,6 +266,10 @@ def _replace_child_layer_functions(layer, serialization_cache):
   for child_layer in utils.list_all_layers(layer):
     if isinstance(child_layer, input_layer.InputLayer):
       continue
+    if not utils.should_save_traces(child_layer):
+      # The child layer's functions are not serialized, so the ops of the
+      # child layer are traced directly into the functions of this layer.
+      continue
 
     if child_layer not in serialization_cache[constants.KERAS_CACHE_KEY]:
       serialized_functions = (
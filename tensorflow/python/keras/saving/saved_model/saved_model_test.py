@@ -920,6 +920,57 @@ class TestSavedModelFormat(test.TestCase):
     with self.assertRaisesRegex(ValueError, 'I said do not trace'):
       loaded.attached_layer(constant_op.constant([1.]))
 
+  def test_save_serving_traces_only(self):
+    model = testing_utils.get_small_functional_mlp(1, 4, input_dim=3)
+    input_arr = constant_op.constant(
+        np.random.random((2, 3)).astype(np.float32))
+    expected = model(input_arr)
+    saved_model_dir = self._save_model_dir()
+
+    with self.assertRaisesRegex(ValueError, '`save_traces` must be'):
+      model.save(saved_model_dir, save_format='tf', save_traces='all')
+
+    # Falsy values only save the configs, like `False`.
+    model.save(saved_model_dir, save_format='tf', save_traces=None)
+    loaded = keras_load.load(saved_model_dir)
+    self.assertAllClose(expected, loaded(input_arr))
+
+    model.save(saved_model_dir, save_format='tf', save_traces='serving')
+    loaded = tf_load.load(saved_model_dir)
+    self.assertAllClose(expected, loaded(input_arr, training=False))
+    self.assertIn('serving_default', loaded.signatures)
+    for layer in loaded.keras_api.layers:
+      self.assertFalse(hasattr(layer, 'call_and_return_conditional_losses'))
+
+    loaded = keras_load.load(saved_model_dir)
+    self.assertAllClose(expected, loaded(input_arr))
+
+  def test_lazy_load(self):
+    model = testing_utils.get_small_functional_mlp(1, 4, input_dim=3)
+    model.compile('rmsprop', 'mse')
+    input_arr = constant_op.constant(
+        np.random.random((2, 3)).astype(np.float32))
+    expected = model(input_arr)
+    saved_model_dir = self._save_model_dir()
+    model.save(saved_model_dir, save_format='tf')
+
+    loaded = keras.models.load_model(saved_model_dir, lazy=True)
+    self.assertIsInstance(loaded, keras_load.LazyRevivedModel)
+    self.assertAllClose(expected, loaded(input_arr, training=False))
+    self.assertAllClose(
+        expected,
+        loaded.signatures['serving_default'](input_arr)[model.output_names[0]])
+    self.assertFalse(loaded.revived)
+
+    # Any Keras attribute revives the model.
+    self.assertAllClose(expected, loaded.predict(input_arr))
+    self.assertTrue(loaded.revived)
+    self.assertIsInstance(loaded.keras_model, keras.Model)
+    self.assertLen(loaded.layers, len(model.layers))
+    self.assertAllClose(expected, loaded(input_arr))
+    loaded.trainable = False
+    self.assertFalse(loaded.keras_model.trainable)
+
 
 class TestLayerCallTracing(test.TestCase, parameterized.TestCase):
 
@@ -249,25 +249,38 @@ def remove_training_arg(index, args, kwargs):
     kwargs.pop('training', None)
 
 
+# Value of `save_traces` that only saves the traced functions of the object
+# passed to `save`, e.g. the model serving signature and call functions.
+SERVING_TRACES = 'serving'
+
+
 class SaveOptionsContext(threading.local):
 
   def __init__(self):
     super(SaveOptionsContext, self).__init__()
     self.save_traces = True
+    self.root = None
 
 
 _save_options_context = SaveOptionsContext()
 
 
 @tf_contextlib.contextmanager
-def keras_option_scope(save_traces):
+def keras_option_scope(save_traces, root=None):
   previous_value = _save_options_context.save_traces
+  previous_root = _save_options_context.root
   try:
     _save_options_context.save_traces = save_traces
+    _save_options_context.root = root
     yield
   finally:
     _save_options_context.save_traces = previous_value
+    _save_options_context.root = previous_root
 
 
-def should_save_traces():
-  return _save_options_context.save_traces
+def should_save_traces(obj=None):
+  """Whether to save the traced functions of `obj`, or of any object."""
+  save_traces = _save_options_context.save_traces
+  if save_traces == SERVING_TRACES:
+    return obj is None or obj is _save_options_context.root
+  return save_traces
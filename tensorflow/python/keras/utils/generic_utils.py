@@ -762,6 +762,13 @@ def has_arg(fn, name, accept_all=False):
   return name in arg_spec.args or name in arg_spec.kwonlyargs
 
 
+def is_interactive_stdout():
+  """Returns whether stdout is a terminal or a notebook, i.e. not a file."""
+  return ((hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()) or
+          'ipykernel' in sys.modules or
+          'PYCHARM_HOSTED' in os.environ)
+
+
 @keras_export('keras.utils.Progbar')
 class Progbar(object):
   """Displays a progress bar.
@@ -775,6 +782,11 @@ class Progbar(object):
         others will be averaged by the progbar before display.
       interval: Minimum visual progress update interval (in seconds).
       unit_name: Display name for step counts (usually "step" or "sample").
+
+  Values passed to `update` can be eager tensors. They are only converted to
+  NumPy when the progress bar is displayed, i.e. at most once per `interval`,
+  and running averages are accumulated with tensor operations in between, so
+  updates do not wait for the values to be computed.
   """
 
   def __init__(self,
@@ -794,11 +806,8 @@ class Progbar(object):
     else:
       self.stateful_metrics = set()
 
-    self._dynamic_display = ((hasattr(sys.stdout, 'isatty') and
-                              sys.stdout.isatty()) or
-                             'ipykernel' in sys.modules or
-                             'posix' in sys.modules or
-                             'PYCHARM_HOSTED' in os.environ)
+    self._dynamic_display = (is_interactive_stdout() or
+                             'posix' in sys.modules)
     self._total_width = 0
     self._seen_so_far = 0
     # We use a dict + list to avoid garbage collection
@@ -850,11 +859,11 @@ class Progbar(object):
     self._seen_so_far = current
 
     now = time.time()
-    info = ' - %.0fs' % (now - self._start)
     if self.verbose == 1:
       if now - self._last_update < self.interval and not finalize:
         return
 
+      info = ' - %.0fs' % (now - self._start)
       prev_total_width = self._total_width
       if self._dynamic_display:
         sys.stdout.write('\b' * prev_total_width)
@@ -905,7 +914,7 @@ class Progbar(object):
       for k in self._values_order:
         info += ' - %s:' % k
         if isinstance(self._values[k], list):
-          avg = np.mean(self._values[k][0] / max(1, self._values[k][1]))
+          avg = self._average(k)
           if abs(avg) > 1e-3:
             info += ' %.4f' % avg
           else:
@@ -927,10 +936,10 @@ class Progbar(object):
       if finalize:
         numdigits = int(np.log10(self.target)) + 1
         count = ('%' + str(numdigits) + 'd/%d') % (current, self.target)
-        info = count + info
+        info = count + ' - %.0fs' % (now - self._start)
         for k in self._values_order:
           info += ' - %s:' % k
-          avg = np.mean(self._values[k][0] / max(1, self._values[k][1]))
+          avg = self._average(k)
           if avg > 1e-3:
             info += ' %.4f' % avg
           else:
@@ -945,6 +954,12 @@ class Progbar(object):
   def add(self, n, values=None):
     self.update(self._seen_so_far + n, values)
 
+  def _average(self, k):
+    """Returns the average of value `k` as a NumPy value."""
+    value_sum, count = self._values[k]
+    # Materializes the value if it is a tensor.
+    return np.mean(np.asarray(value_sum) / max(1, count))
+
   def _estimate_step_duration(self, current, now):
     """Estimate the duration of a single step.
 
@@ -0,0 +1,330 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# pylint: disable=protected-access
+"""Utilities to estimate the memory used by a training step of a model.
+
+The training step is traced into a graph, the same way `Model.train_function`
+traces `Model.train_step`. Operations are attributed to the top-level layers of
+the model by their name scope: a layer called by the model creates its ops under
+`<model name>/<layer name>/`, and `GradientTape` creates the gradient ops of an
+op under `gradient_tape/<forward name scope>/`. Forward tensors consumed by
+gradient ops are the activations kept for backprop.
+
+All sizes are computed from static shapes, so they are estimates. Tensors whose
+shape is not fully known are counted as zero bytes and reported separately.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+
+import numpy as np
+
+from tensorflow.python.eager import def_function
+from tensorflow.python.framework import dtypes
+from tensorflow.python.framework import ops
+from tensorflow.python.keras import backend
+from tensorflow.python.keras.utils import object_identity
+from tensorflow.python.util import nest
+
+_GRADIENT_SCOPE = 'gradient_tape'
+
+# Ops whose outputs alias existing buffers or are negligible.
+_NON_ACTIVATION_OP_TYPES = frozenset(
+    ['Const', 'Identity', 'NoOp', 'ReadVariableOp', 'VarHandleOp'])
+
+
+class LayerMemory(
+    collections.namedtuple('LayerMemory', [
+        'name', 'parameter_bytes', 'optimizer_slot_bytes',
+        'saved_activation_bytes'
+    ])):
+  """Memory attributed to a single layer.
+
+  Attributes:
+    name: Name of the layer.
+    parameter_bytes: Bytes of the weights of the layer.
+    optimizer_slot_bytes: Bytes of the optimizer slots of the trainable weights
+      of the layer, e.g. the moments of `Adam`.
+    saved_activation_bytes: Bytes of the tensors computed by the layer in the
+      forward pass that are kept for the backward pass.
+  """
+
+
+class MemoryProfile(
+    collections.namedtuple('MemoryProfile', [
+        'layers', 'other_saved_activation_bytes', 'peak_live_bytes',
+        'num_unknown_shape_tensors'
+    ])):
+  """Memory estimate of a training step.
+
+  Attributes:
+    layers: List of `LayerMemory`, one per layer of `Model.layers`.
+    other_saved_activation_bytes: Bytes of the tensors kept for the backward
+      pass that could not be attributed to a layer, e.g. those of the loss.
+    peak_live_bytes: Largest total size of the tensors alive at the same time
+      while running the step in graph order, excluding weights and slots.
+    num_unknown_shape_tensors: Number of tensors counted as zero bytes because
+      their shape is not fully known.
+  """
+
+  @property
+  def parameter_bytes(self):
+    return sum(layer.parameter_bytes for layer in self.layers)
+
+  @property
+  def optimizer_slot_bytes(self):
+    return sum(layer.optimizer_slot_bytes for layer in self.layers)
+
+  @property
+  def saved_activation_bytes(self):
+    return (sum(layer.saved_activation_bytes for layer in self.layers) +
+            self.other_saved_activation_bytes)
+
+  @property
+  def peak_bytes(self):
+    """Estimated peak memory of the step, including weights and slots."""
+    return (self.parameter_bytes + self.optimizer_slot_bytes +
+            self.peak_live_bytes)
+
+
+def profile_memory(model, x, y=None, sample_weight=None):
+  """Estimates the memory used by one training step of `model`.
+
+  The step is traced, not run: weights are not updated. Tracing creates the
+  optimizer slots if they do not exist yet.
+
+  Args:
+    model: A compiled Keras model.
+    x: One batch of input data. See `x` in `Model.fit`.
+    y: One batch of target data. See `y` in `Model.fit`.
+    sample_weight: Optional sample weights of the batch.
+
+  Returns:
+    A `MemoryProfile`.
+
+  Raises:
+    RuntimeError: If the model is not compiled, or if called in graph mode.
+  """
+  if not ops.executing_eagerly_outside_functions():
+    raise RuntimeError('`profile_memory` requires eager execution.')
+  model._assert_compile_was_called()
+
+  x, y, sample_weight = nest.map_structure(_convert_to_tensor,
+                                           (x, y, sample_weight))
+  if y is None:
+    data = (x,)
+  elif sample_weight is None:
+    data = (x, y)
+  else:
+    data = (x, y, sample_weight)
+  graph = def_function.function(
+      model.train_step).get_concrete_function(data).graph
+
+  layer_names = set(layer.name for layer in model.layers)
+  saved_bytes, other_saved_bytes = _saved_activation_bytes(
+      graph, model.name, layer_names)
+  peak_live_bytes, num_unknown_shape_tensors = _peak_live_bytes(graph)
+
+  layers = []
+  for layer in model.layers:
+    slots = _optimizer_slots(model.optimizer, layer.trainable_weights)
+    layers.append(LayerMemory(
+        name=layer.name,
+        parameter_bytes=sum(_variable_bytes(w) for w in layer.weights),
+        optimizer_slot_bytes=sum(_variable_bytes(s) for s in slots),
+        saved_activation_bytes=saved_bytes.get(layer.name, 0)))
+  return MemoryProfile(
+      layers=layers,
+      other_saved_activation_bytes=other_saved_bytes,
+      peak_live_bytes=peak_live_bytes,
+      num_unknown_shape_tensors=num_unknown_shape_tensors)
+
+
+def print_memory_profile(profile, line_length=80, print_fn=None):
+  """Prints a `MemoryProfile` as a table, one row per layer.
+
+  Args:
+    profile: A `MemoryProfile`.
+    line_length: Total length of printed lines.
+    print_fn: Print function to use. It will be called on each line of the
+      table. It defaults to `print` (prints to stdout).
+  """
+  if print_fn is None:
+    print_fn = print
+  positions = [int(line_length * p) for p in [.4, .6, .8, 1.]]
+
+  def print_row(fields):
+    line = ''
+    for i, field in enumerate(fields):
+      if i > 0:
+        line = line[:-1] + ' '
+      line += str(field)
+      line = line[:positions[i]]
+      line += ' ' * (positions[i] - len(line))
+    print_fn(line)
+
+  print_fn('_' * line_length)
+  print_row(['Layer', 'Params (MB)', 'Slots (MB)', 'Saved act. (MB)'])
+  print_fn('=' * line_length)
+  for layer in profile.layers:
+    print_row([
+        layer.name,
+        _format_mb(layer.parameter_bytes),
+        _format_mb(layer.optimizer_slot_bytes),
+        _format_mb(layer.saved_activation_bytes)
+    ])
+  print_row(['(other)', '', '',
+             _format_mb(profile.other_saved_activation_bytes)])
+  print_fn('=' * line_length)
+  print_fn('Parameters: {} MB'.format(_format_mb(profile.parameter_bytes)))
+  print_fn('Optimizer slots: {} MB'.format(
+      _format_mb(profile.optimizer_slot_bytes)))
+  print_fn('Saved activations: {} MB'.format(
+      _format_mb(profile.saved_activation_bytes)))
+  print_fn('Peak: {} MB'.format(_format_mb(profile.peak_bytes)))
+  if profile.num_unknown_shape_tensors:
+    print_fn('Tensors of unknown shape (not counted): {}'.format(
+        profile.num_unknown_shape_tensors))
+  print_fn('_' * line_length)
+
+
+def _format_mb(num_bytes):
+  return '{:.2f}'.format(num_bytes / 2.**20)
+
+
+def _convert_to_tensor(x):
+  if isinstance(x, np.ndarray):
+    dtype = None
+    if issubclass(x.dtype.type, np.floating):
+      dtype = backend.floatx()
+    return ops.convert_to_tensor_v2_with_dispatch(x, dtype=dtype)
+  return x
+
+
+def _variable_bytes(v):
+  return v.shape.num_elements() * v.dtype.base_dtype.size
+
+
+def _optimizer_slots(optimizer, var_list):
+  """Returns the slot variables of `optimizer` for `var_list`."""
+  get_slot_names = getattr(optimizer, 'get_slot_names', None)
+  if get_slot_names is None:
+    return []
+  slot_names = get_slot_names()
+  slots = []
+  for var in var_list:
+    for slot_name in slot_names:
+      try:
+        slots.append(optimizer.get_slot(var, slot_name))
+      except KeyError:
+        # Variables without gradient have no slots.
+        pass
+  return slots
+
+
+def _tensor_bytes(t):
+  """Returns the size of `t` in bytes, or None if its shape is unknown."""
+  dtype = t.dtype.base_dtype
+  if dtype in (dtypes.resource, dtypes.variant, dtypes.string):
+    return 0
+  num_elements = t.shape.num_elements()
+  if num_elements is None:
+    return None
+  return num_elements * dtype.size
+
+
+def _is_backward(op):
+  return op.name.split('/', 1)[0] == _GRADIENT_SCOPE
+
+
+def _is_activation(op):
+  return not _is_backward(op) and op.type not in _NON_ACTIVATION_OP_TYPES
+
+
+def _saved_activation_bytes(graph, model_scope, layer_names):
+  """Sums the forward tensors consumed by gradient ops, per layer."""
+  saved = object_identity.ObjectIdentitySet()
+  for op in graph.get_operations():
+    if _is_backward(op):
+      for t in op.inputs:
+        while t.op.type == 'Identity':
+          t = t.op.inputs[0]
+        if _is_activation(t.op):
+          saved.add(t)
+
+  saved_bytes = collections.defaultdict(int)
+  other_saved_bytes = 0
+  for t in saved:
+    num_bytes = _tensor_bytes(t) or 0
+    scopes = t.op.name.split('/')
+    if (len(scopes) > 2 and scopes[0] == model_scope and
+        scopes[1] in layer_names):
+      saved_bytes[scopes[1]] += num_bytes
+    else:
+      other_saved_bytes += num_bytes
+  return saved_bytes, other_saved_bytes
+
+
+def _peak_live_bytes(graph):
+  """Simulates the live set of tensors when running ops in graph order.
+
+  A tensor is alive from the op that computes it to its last consumer, or to
+  the end of the step if it is an output of the graph. The consumers of an
+  `Identity` of a tensor count as consumers of the tensor.
+
+  Args:
+    graph: A `FuncGraph`, whose operations are in topological order.
+
+  Returns:
+    A tuple `(peak_live_bytes, num_unknown_shape_tensors)`.
+  """
+  operations = graph.get_operations()
+  op_index = {op: i for i, op in enumerate(operations)}
+  graph_outputs = object_identity.ObjectIdentitySet(graph.outputs)
+
+  def last_use(t, default):
+    if t in graph_outputs:
+      return len(operations)
+    uses = [default]
+    for consumer in t.consumers():
+      if consumer.type == 'Identity':
+        uses.append(last_use(consumer.outputs[0], op_index[consumer]))
+      else:
+        uses.append(op_index[consumer])
+    return max(uses)
+
+  frees = collections.defaultdict(int)
+  allocations = collections.defaultdict(int)
+  num_unknown_shape_tensors = 0
+  for i, op in enumerate(operations):
+    if op.type in _NON_ACTIVATION_OP_TYPES:
+      continue
+    for t in op.outputs:
+      num_bytes = _tensor_bytes(t)
+      if num_bytes is None:
+        num_unknown_shape_tensors += 1
+        continue
+      allocations[i] += num_bytes
+      frees[last_use(t, i)] += num_bytes
+
+  live_bytes = 0
+  peak_live_bytes = 0
+  for i in range(len(operations)):
+    live_bytes += allocations[i]
+    peak_live_bytes = max(peak_live_bytes, live_bytes)
+    live_bytes -= frees[i]
+  return peak_live_bytes, num_unknown_shape_tensors
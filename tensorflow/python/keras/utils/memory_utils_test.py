@@ -0,0 +1,99 @@
+# Copyright 2020 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for memory_utils."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from absl.testing import parameterized
+import numpy as np
+
+from tensorflow.python import keras
+from tensorflow.python.keras import combinations
+from tensorflow.python.keras.utils import memory_utils
+from tensorflow.python.platform import test
+
+
+def _get_model():
+  inputs = keras.Input(shape=(16,))
+  x = keras.layers.Dense(32, activation='relu', name='hidden')(inputs)
+  outputs = keras.layers.Dense(4, name='output')(x)
+  return keras.Model(inputs, outputs)
+
+
+@combinations.generate(combinations.combine(mode=['eager']))
+class MemoryProfileTest(test.TestCase, parameterized.TestCase):
+
+  def test_profile_memory(self):
+    model = _get_model()
+    model.compile('adam', 'mse')
+    x = np.ones((8, 16))
+    y = np.ones((8, 4))
+    weights_before = model.get_weights()
+    profile = memory_utils.profile_memory(model, x, y)
+
+    # Tracing the step does not update the weights.
+    for w_before, w_after in zip(weights_before, model.get_weights()):
+      self.assertAllEqual(w_before, w_after)
+
+    self.assertEqual([layer.name for layer in profile.layers],
+                     [layer.name for layer in model.layers])
+    layers = {layer.name: layer for layer in profile.layers}
+    self.assertEqual(layers['hidden'].parameter_bytes, 4 * (16 * 32 + 32))
+    self.assertEqual(layers['output'].parameter_bytes, 4 * (32 * 4 + 4))
+    # Adam keeps two moments per trainable weight.
+    self.assertEqual(layers['hidden'].optimizer_slot_bytes,
+                     2 * layers['hidden'].parameter_bytes)
+    self.assertEqual(layers['output'].optimizer_slot_bytes,
+                     2 * layers['output'].parameter_bytes)
+    # At least the output of the hidden layer is kept for the gradient of the
+    # output kernel.
+    self.assertGreaterEqual(layers['hidden'].saved_activation_bytes, 4 * 8 * 32)
+    self.assertGreater(profile.peak_live_bytes, 0)
+    self.assertEqual(profile.num_unknown_shape_tensors, 0)
+    self.assertEqual(
+        profile.peak_bytes,
+        profile.parameter_bytes + profile.optimizer_slot_bytes +
+        profile.peak_live_bytes)
+
+  def test_sgd_has_no_slots(self):
+    model = _get_model()
+    model.compile('sgd', 'mse')
+    profile = memory_utils.profile_memory(
+        model, np.ones((8, 16)), np.ones((8, 4)))
+    self.assertEqual(profile.optimizer_slot_bytes, 0)
+    self.assertGreater(profile.parameter_bytes, 0)
+
+  def test_requires_compile(self):
+    model = _get_model()
+    with self.assertRaisesRegex(RuntimeError, 'must compile'):
+      memory_utils.profile_memory(model, np.ones((8, 16)), np.ones((8, 4)))
+
+  def test_print_memory_profile(self):
+    model = _get_model()
+    model.compile('adam', 'mse')
+    profile = memory_utils.profile_memory(
+        model, np.ones((8, 16)), np.ones((8, 4)))
+    lines = []
+    memory_utils.print_memory_profile(profile, print_fn=lines.append)
+    text = '\n'.join(lines)
+    self.assertIn('hidden', text)
+    self.assertIn('output', text)
+    self.assertIn('Peak:', text)
+
+
+if __name__ == '__main__':
+  test.main()
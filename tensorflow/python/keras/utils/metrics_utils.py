@@ -457,6 +457,147 @@ def update_confusion_matrix_variables(variables_to_update,
   return control_flow_ops.group(update_ops)
 
 
+def update_histogram_variables(positives,
+                               negatives,
+                               y_true,
+                               y_pred,
+                               bin_edges,
+                               sample_weight=None,
+                               multi_label=False,
+                               label_weights=None):
+  """Returns op to add predictions to histograms of positives and negatives.
+
+  Each prediction is assigned to the bin `i` such that
+  `bin_edges[i - 1] < y_pred <= bin_edges[i]` with a binary search, so the
+  cost of an update is `O(batch_size * log(num_bins))`. Its weight is added to
+  bin `i` of `positives` if `y_true` is True, and of `negatives` otherwise.
+
+  Histograms are merged by summing them, so variables aggregated with `SUM`
+  merge correctly across replicas. The confusion matrix at any bin edge can be
+  recovered with `histograms_to_confusion_matrix`.
+
+  Args:
+    positives: Variable of shape `[num_bins]`, or `[num_bins, num_labels]` if
+      `multi_label` is True, holding the histogram of positive predictions.
+    negatives: Variable of the same shape as `positives`, holding the histogram
+      of negative predictions.
+    y_true: A `Tensor` whose shape matches `y_pred`. Will be cast to `bool`.
+    y_pred: A floating point `Tensor` of arbitrary shape and whose values are in
+      the range `[0, 1]`.
+    bin_edges: A sorted list of `num_bins - 1` floats in `[0, 1]`.
+    sample_weight: Optional `Tensor` whose rank is either 0, or the same rank as
+      `y_true`, and must be broadcastable to `y_true`.
+    multi_label: Optional boolean indicating whether multidimensional
+      prediction/labels should be treated as multilabel responses, or flattened
+      into a single label.
+    label_weights: (optional) tensor of non-negative weights for multilabel
+      data, applied to the flattened data when `multi_label` is False.
+
+  Returns:
+    Update op.
+
+  Raises:
+    ValueError: If `label_weights` is passed with `multi_label=True`.
+  """
+  if multi_label and label_weights is not None:
+    raise ValueError('`label_weights` for multilabel data should be handled '
+                     'outside of `update_histogram_variables` when '
+                     '`multi_label` is True.')
+  variable_dtype = positives.dtype
+  y_true = math_ops.cast(y_true, dtype=variable_dtype)
+  y_pred = math_ops.cast(y_pred, dtype=variable_dtype)
+  if not multi_label:
+    [y_pred,
+     y_true], _ = ragged_assert_compatible_and_get_flat_values([y_pred, y_true],
+                                                               sample_weight)
+
+  with ops.control_dependencies([
+      check_ops.assert_greater_equal(
+          y_pred,
+          math_ops.cast(0.0, dtype=y_pred.dtype),
+          message='predictions must be >= 0'),
+      check_ops.assert_less_equal(
+          y_pred,
+          math_ops.cast(1.0, dtype=y_pred.dtype),
+          message='predictions must be <= 1')
+  ]):
+    if sample_weight is None:
+      y_pred, y_true = losses_utils.squeeze_or_expand_dimensions(
+          y_pred, y_true)
+    else:
+      sample_weight = math_ops.cast(sample_weight, dtype=variable_dtype)
+      y_pred, y_true, sample_weight = (
+          losses_utils.squeeze_or_expand_dimensions(
+              y_pred, y_true, sample_weight=sample_weight))
+  y_pred.shape.assert_is_compatible_with(y_true.shape)
+
+  if sample_weight is None:
+    weights = array_ops.ones_like(y_pred)
+  else:
+    weights = weights_broadcast_ops.broadcast_weights(sample_weight, y_pred)
+  if label_weights is not None:
+    label_weights = weights_broadcast_ops.broadcast_weights(
+        math_ops.cast(array_ops.expand_dims(label_weights, 0), variable_dtype),
+        y_pred)
+    weights *= label_weights
+
+  bin_edges = ops.convert_to_tensor_v2_with_dispatch(
+      bin_edges, dtype=variable_dtype)
+  bin_ids = array_ops.reshape(
+      array_ops.searchsorted(
+          array_ops.expand_dims(bin_edges, 0),
+          array_ops.reshape(y_pred, [1, -1]),
+          side='left'), [-1])
+  num_segments = array_ops.shape(positives)[0]
+  if multi_label:
+    # Each label gets its own histogram, interleaved in the flat segments. The
+    # labels are the last dimension, so the label of a flattened prediction is
+    # its position modulo the number of labels.
+    num_labels = array_ops.shape(y_pred)[-1]
+    bin_ids = bin_ids * num_labels + math_ops.range(
+        array_ops.size(y_pred)) % num_labels
+    num_segments *= num_labels
+  y_true = array_ops.reshape(y_true, [-1])
+  weights = array_ops.reshape(weights, [-1])
+
+  is_positive = math_ops.cast(
+      math_ops.cast(y_true, dtype=dtypes.bool), dtype=variable_dtype)
+  positive_counts = math_ops.unsorted_segment_sum(
+      weights * is_positive, bin_ids, num_segments)
+  negative_counts = math_ops.unsorted_segment_sum(
+      weights * (1. - is_positive), bin_ids, num_segments)
+  return control_flow_ops.group(
+      positives.assign_add(
+          array_ops.reshape(positive_counts, array_ops.shape(positives))),
+      negatives.assign_add(
+          array_ops.reshape(negative_counts, array_ops.shape(negatives))))
+
+
+def histograms_to_confusion_matrix(positives, negatives):
+  """Computes the confusion matrix at every bin edge of two histograms.
+
+  Args:
+    positives: Histogram of positive predictions, as updated by
+      `update_histogram_variables`.
+    negatives: Histogram of negative predictions.
+
+  Returns:
+    A tuple `(true_positives, true_negatives, false_positives,
+    false_negatives)` of `Tensor`s with `num_bins + 1` rows. Row `i` counts the
+    predictions greater than the `i`-th threshold, where the thresholds are
+    below all predictions, then each of the `num_bins - 1` bin edges, then above
+    all predictions.
+  """
+  zeros = array_ops.zeros_like(positives[:1])
+  true_positives = array_ops.concat(
+      [math_ops.cumsum(positives, axis=0, reverse=True), zeros], axis=0)
+  false_positives = array_ops.concat(
+      [math_ops.cumsum(negatives, axis=0, reverse=True), zeros], axis=0)
+  false_negatives = math_ops.reduce_sum(positives, axis=0) - true_positives
+  true_negatives = math_ops.reduce_sum(negatives, axis=0) - false_positives
+  return true_positives, true_negatives, false_positives, false_negatives
+
+
 def _filter_top_k(x, k):
   """Filters top-k values in the last dim of x and set the rest to NEG_INF.
 